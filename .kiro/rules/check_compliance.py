@@ -7,14 +7,35 @@ CloudScope's compliance analysis tools to provide automated enforcement
 of compliance requirements during development and CI/CD.
 """
 
+import ast
 import yaml
 import os
 import re
 import sys
 import argparse
+import hashlib
+import json
+import mmap
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_left
+from fnmatch import translate
+from functools import cached_property, lru_cache
+from html import escape
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, Pattern, Tuple, Union
+from dataclasses import astuple, dataclass
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
 # Import CloudScope compliance tools
 try:
@@ -26,7 +47,11 @@ except ImportError:
     ComplianceCommands = None
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class KiroRule:
     """Represents a Kiro compliance rule."""
     name: str
@@ -36,9 +61,12 @@ class KiroRule:
     severity: str
     framework: str
     documentation: str = ""
+    content_re: Optional[Pattern] = None
+    match_re: Optional[Pattern] = None
+    pattern_re: Optional[Pattern] = None
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class KiroViolation:
     """Represents a violation found by Kiro rules."""
     rule_name: str
@@ -50,15 +78,269 @@ class KiroViolation:
     matched_content: str = ""
 
 
+# Flags applied to rule patterns that need them
+RULE_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Class header pattern used when a file cannot be parsed into an AST
+CLASS_RE = re.compile(rb'^([ \t]*)class\s+(\w+)[^\n]*:', re.MULTILINE)
+
+# Newline pattern used to build per-file line offset tables
+NEWLINE_RE = re.compile(b'\n')
+
+# Number of leading bytes inspected when sniffing for binary content
+BINARY_SNIFF_SIZE = 4096
+
+# Files larger than this are assumed to be data rather than code and skipped
+DEFAULT_MAX_FILE_SIZE = 2 * 1024 * 1024
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_MIN_SIZE = 64 * 1024
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+# Pending work can only be cancelled on shutdown from Python 3.9
+SHUTDOWN_OPTIONS = {'cancel_futures': True} if sys.version_info >= (3, 9) else {}
+
+# Processor instance used by worker processes
+_worker_processor = None
+
+
+def _init_worker(processor: 'KiroComplianceProcessor') -> None:
+    """Install the processor in a worker process."""
+    global _worker_processor
+    _worker_processor = processor
+
+
+def _check_file_worker(file_path: str,
+                       cached: Optional[List['KiroViolation']] = None) -> Optional[List['KiroViolation']]:
+    """Check one file in a worker process."""
+    return _worker_processor._check_file(file_path, cached)
+
+
+class FileContext:
+    """Per-file data shared across all rules checked against one file."""
+    
+    def __init__(self, content: Union[bytes, mmap.mmap]):
+        self.content = content
+        # Whole-file results per compiled pattern, shared by rules using the same regex
+        self._searches: Dict[Pattern, Any] = {}
+        self._findalls: Dict[Pattern, List[Any]] = {}
+    
+    def search(self, pattern: Pattern) -> Optional[Any]:
+        """Search the whole content, reusing the result for repeated patterns."""
+        try:
+            return self._searches[pattern]
+        except KeyError:
+            result = self._searches[pattern] = pattern.search(self.content)
+            return result
+    
+    def finditer(self, pattern: Pattern) -> List[Any]:
+        """Find all matches in the content, reusing the result for repeated patterns."""
+        try:
+            return self._findalls[pattern]
+        except KeyError:
+            result = self._findalls[pattern] = list(pattern.finditer(self.content))
+            return result
+    
+    @cached_property
+    def newline_offsets(self) -> List[int]:
+        """Offsets of every newline in the content, in ascending order."""
+        return [match.start() for match in NEWLINE_RE.finditer(self.content)]
+    
+    @cached_property
+    def class_segments(self) -> List[Tuple[int, str, bytes]]:
+        """
+        Source of every class in the file, decorators included.
+        
+        Returns:
+            List of (class line number, class name, class source) tuples
+        """
+        try:
+            tree = ast.parse(self.content[:])
+        except (SyntaxError, ValueError):
+            return self._regex_class_segments()
+        
+        segments = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                start = min([node.lineno] + [d.lineno for d in node.decorator_list])
+                source = self.line_slice(start, node.end_lineno)
+                segments.append((node.lineno, node.name, source))
+        return segments
+    
+    def _regex_class_segments(self) -> List[Tuple[int, str, bytes]]:
+        """Locate classes by header and indentation for unparseable files."""
+        segments = []
+        for match in CLASS_RE.finditer(self.content):
+            indent = len(match.group(1))
+            class_line = self.line_number(match.start())
+            
+            start = class_line
+            while start > 1 and self.line_slice(start - 1, start - 1).strip().startswith(b'@'):
+                start -= 1
+            
+            # The class ends before the next code line at the same or lower indentation
+            dedent_re = re.compile(rb'^[ \t]{0,%d}[^ \t\r\n#]' % indent, re.MULTILINE)
+            dedent = dedent_re.search(self.content, match.end())
+            end = self.line_number(dedent.start()) - 1 if dedent else len(self.newline_offsets) + 1
+            
+            source = self.line_slice(start, end)
+            segments.append((class_line, _decode(match.group(2)), source))
+        return segments
+    
+    def line_number(self, offset: int) -> int:
+        """Convert a character offset into a 1-based line number."""
+        return bisect_left(self.newline_offsets, offset) + 1
+    
+    def line_slice(self, first: int, last: int) -> bytes:
+        """Return lines first..last (1-based, inclusive) without their final newline."""
+        offsets = self.newline_offsets
+        start = offsets[first - 2] + 1 if first > 1 else 0
+        end = offsets[last - 1] if last <= len(offsets) else len(self.content)
+        return self.content[start:end]
+    
+    def iter_lines(self) -> Iterator[bytes]:
+        """Yield each line as a slice, without building a list of all lines."""
+        start = 0
+        for end in self.newline_offsets:
+            yield self.content[start:end]
+            start = end + 1
+        yield self.content[start:]
+
+
+def _pattern_flags(pattern: str) -> int:
+    """Return the subset of RULE_FLAGS that can affect a pattern."""
+    flags = 0
+    if '^' in pattern or '$' in pattern:
+        flags |= re.MULTILINE
+    if any(c.isalpha() for c in pattern):
+        flags |= re.IGNORECASE
+    return flags & RULE_FLAGS
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern(pattern: str) -> Pattern:
+    """Compile a rule pattern as a bytes regex with only the flags it needs."""
+    return re.compile(pattern.encode('utf-8'), _pattern_flags(pattern))
+
+
+def _decode(data: bytes) -> str:
+    """Decode a matched byte slice for reporting."""
+    return data.decode('utf-8', 'replace')
+
+
+def _is_forbidden_rule(rule: KiroRule) -> bool:
+    """Check whether a rule is a must-not-contain content check."""
+    return (rule.check.get('type') == 'content-check'
+            and rule.check.get('condition') == 'must-not-contain')
+
+
+def _is_prefiltered_rule(rule: KiroRule) -> bool:
+    """
+    Check whether a rule is covered by the must-not-contain prefilter.
+    
+    Joining patterns renumbers their groups, which breaks backreferences
+    and clashes on repeated group names, so patterns with groups are left
+    out and always scanned on their own.
+    """
+    return _is_forbidden_rule(rule) and rule.content_re.groups == 0
+
+
+def _compile_forbidden_prefilter(rules: List[KiroRule]) -> Optional[Pattern]:
+    """
+    Combine the prefiltered must-not-contain patterns into one alternation.
+    
+    Each pattern keeps its own flags through a scoped inline flag group.
+    A single pattern gains nothing from the prefilter, so None is returned
+    unless there are at least two distinct patterns, or if the combined
+    pattern does not compile.
+    """
+    branches = []
+    for rule in rules:
+        if not _is_prefiltered_rule(rule):
+            continue
+        flag_letters = ''.join(
+            letter for flag, letter in ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'))
+            if rule.content_re.flags & flag
+        )
+        pattern = rule.content_re.pattern.decode('utf-8')
+        branch = f'(?{flag_letters}:{pattern})' if flag_letters else f'(?:{pattern})'
+        if branch not in branches:
+            branches.append(branch)
+    
+    if len(branches) < 2:
+        return None
+    try:
+        return re.compile('|'.join(branches).encode('utf-8'))
+    except re.error:
+        # e.g. a global inline flag that is only valid at the start of a pattern
+        return None
+
+
+@lru_cache(maxsize=None)
+def _compile_exclude_patterns(exclude_patterns: Tuple[str, ...]) -> Pattern:
+    """Compile glob exclude patterns into a single alternation regex."""
+    return re.compile('|'.join(translate(pattern) for pattern in exclude_patterns) or r'(?!)')
+
+
+# Report templates, formatted once per violation
+TEXT_VIOLATION = "File: {file_path}:{line_number}\nRule: {rule_name} ({framework})\nMessage: {message}\n{code}\n"
+TEXT_CODE = "Code: {code}\n"
+
+HTML_EMPTY_REPORT = """
+            <html><body>
+            <h1>✅ Compliance Report</h1>
+            <p>No compliance violations found!</p>
+            </body></html>
+            """
+
+HTML_REPORT_HEAD = """
+        <html>
+        <head>
+            <title>CloudScope Compliance Report</title>
+            <style>
+                body {{ font-family: Arial, sans-serif; margin: 20px; }}
+                .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
+                .violation {{ margin: 10px 0; padding: 15px; border-left: 4px solid; }}
+                .critical {{ border-left-color: #d32f2f; background-color: #ffebee; }}
+                .error {{ border-left-color: #f57c00; background-color: #fff3e0; }}
+                .warning {{ border-left-color: #fbc02d; background-color: #fffde7; }}
+                .info {{ border-left-color: #1976d2; background-color: #e3f2fd; }}
+                .code {{ background-color: #f5f5f5; padding: 5px; font-family: monospace; }}
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>📋 CloudScope Compliance Report</h1>
+                <p>{count} violations found</p>
+            </div>
+        """
+
+HTML_SECTION = "<h2>{severity} ({count})</h2>"
+
+HTML_VIOLATION = """
+                <div class="violation {severity}">
+                    <h4>{rule_name} ({framework})</h4>
+                    <p><strong>File:</strong> {file_path}:{line_number}</p>
+                    <p><strong>Message:</strong> {message}</p>
+                {code}</div>"""
+
+HTML_CODE = '<div class="code">{code}</div>'
+
+HTML_REPORT_TAIL = "</body></html>"
+
+
 class KiroComplianceProcessor:
     """Processes Kiro compliance rules and checks code for violations."""
     
-    def __init__(self, rules_file: str = None):
+    def __init__(self, rules_file: str = None, cache_file: str = None):
         """
         Initialize the Kiro compliance processor.
         
         Args:
             rules_file: Path to the YAML rules file
+            cache_file: Optional path of a per-file result cache reused across runs
         """
         if rules_file is None:
             # Default to the compliance rules in the .kiro directory
@@ -67,6 +349,20 @@ class KiroComplianceProcessor:
         self.rules_file = Path(rules_file)
         self.rules: List[KiroRule] = []
         self.violations: List[KiroViolation] = []
+        # Stop at the first match per rule and the first critical violation
+        self.fail_fast = False
+        # Skip files above this size in bytes (0 disables the limit)
+        self.max_file_size = DEFAULT_MAX_FILE_SIZE
+        # Compiled file globs shared by rules with the same pattern
+        self._pattern_res: Dict[str, Pattern] = {}
+        # Combined prefilter for all must-not-contain patterns, if there are several
+        self._forbidden_re: Optional[Pattern] = None
+        # Content-check results per file, keyed by absolute path and validated by mtime/size
+        self.cache_file = Path(cache_file) if cache_file else None
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._rules_hash = ''
+        # Project root resolved for each directory already visited
+        self._root_cache: Dict[Path, Optional[Path]] = {}
         
         if self.rules_file.exists():
             self._load_rules()
@@ -77,9 +373,13 @@ class KiroComplianceProcessor:
         """Load rules from the YAML file."""
         try:
             with open(self.rules_file, 'r') as f:
-                rules_data = yaml.safe_load(f)
+                rules_data = yaml.load(f, Loader=YamlLoader)
             
             for rule_data in rules_data.get('rules', []):
+                pattern = rule_data['check'].get('pattern', '**/*.py')
+                if pattern not in self._pattern_res:
+                    self._pattern_res[pattern] = re.compile(translate(pattern))
+                
                 rule = KiroRule(
                     name=rule_data['name'],
                     description=rule_data['description'],
@@ -87,23 +387,33 @@ class KiroComplianceProcessor:
                     message=rule_data['message'],
                     severity=rule_data['severity'],
                     framework=rule_data['framework'],
-                    documentation=rule_data.get('documentation', '')
+                    documentation=rule_data.get('documentation', ''),
+                    content_re=_compile_pattern(rule_data['check'].get('content-pattern', '')),
+                    match_re=_compile_pattern(rule_data['check'].get('match-pattern', '')),
+                    pattern_re=self._pattern_res[pattern]
                 )
                 self.rules.append(rule)
             
+            self._forbidden_re = _compile_forbidden_prefilter(self.rules)
+            self._rules_hash = hashlib.blake2b(
+                json.dumps(rules_data.get('rules', []), sort_keys=True, default=str).encode('utf-8'),
+                digest_size=16
+            ).hexdigest()
             print(f"Loaded {len(self.rules)} compliance rules")
             
         except Exception as e:
             print(f"Error loading rules: {str(e)}")
             sys.exit(1)
     
-    def check_directory(self, directory: str, exclude_patterns: List[str] = None) -> List[KiroViolation]:
+    def check_directory(self, directory: str, exclude_patterns: List[str] = None,
+                        jobs: int = 1) -> List[KiroViolation]:
         """
         Check a directory against all compliance rules.
         
         Args:
             directory: Directory to check
             exclude_patterns: Patterns to exclude from checking
+            jobs: Number of worker processes to scan files with
             
         Returns:
             List of violations found
@@ -113,32 +423,81 @@ class KiroComplianceProcessor:
         
         self.violations = []
         directory_path = Path(directory)
+        exclude_re = _compile_exclude_patterns(tuple(exclude_patterns))
         
         if not directory_path.exists():
             print(f"Error: Directory '{directory}' does not exist")
             return self.violations
         
-        # Find all Python files
-        python_files = []
-        for root, dirs, files in os.walk(directory_path):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if not self._matches_exclude_patterns(d, exclude_patterns)]
+        # Find all Python files, keeping plain string paths for speed. Files
+        # come out in os.walk's top-down order: a directory's own files first,
+        # then each subdirectory in turn, without following symlinked ones
+        python_files: List[str] = []
+        stack = [str(directory_path)]
+        while stack:
+            current_dir = stack.pop()
+            try:
+                entries = os.scandir(current_dir)
+            except OSError:
+                continue
             
-            for file in files:
-                if file.endswith('.py') and not self._matches_exclude_patterns(file, exclude_patterns):
-                    file_path = Path(root) / file
-                    python_files.append(file_path)
+            subdirs = []
+            with entries:
+                for entry in entries:
+                    if self._matches_exclude_patterns(entry.name, exclude_re):
+                        continue
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        python_files.append(entry.path)
+            stack.extend(reversed(subdirs))
         
         print(f"Checking {len(python_files)} Python files against {len(self.rules)} rules...")
         
-        # Check each file against each rule
-        for file_path in python_files:
-            for rule in self.rules:
-                violations = self._check_file_against_rule(file_path, rule)
-                self.violations.extend(violations)
-        
+        self._scan_files(python_files, jobs)
         return self.violations
     
+    def _scan_files(self, file_paths: List[str], jobs: int = 1) -> None:
+        """Check files against all rules, reusing cached results where valid."""
+        self._load_cache()
+        cached = [self._cache_lookup(file_path) for file_path in file_paths]
+        
+        # Read each file once and check it against every rule
+        if jobs > 1 and len(file_paths) >= PARALLEL_MIN_FILES:
+            chunksize = max(1, len(file_paths) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                     initargs=(self,)) as executor:
+                results = executor.map(_check_file_worker, file_paths, cached,
+                                       chunksize=chunksize)
+                stopped = self._collect_results(file_paths, cached, results)
+                if stopped:
+                    executor.shutdown(wait=False, **SHUTDOWN_OPTIONS)
+        else:
+            results = map(self._check_file, file_paths, cached)
+            self._collect_results(file_paths, cached, results)
+        
+        self._save_cache()
+    
+    def _collect_results(self, file_paths: List[str], cached: List[Optional[List[KiroViolation]]],
+                         results: Iterator[Optional[List[KiroViolation]]]) -> bool:
+        """Gather per-file results in order; returns True if a fail-fast scan stopped early."""
+        for file_path, hit, violations in zip(file_paths, cached, results):
+            if violations is None:
+                # Skipped without a scan, so there is nothing to cache
+                self._cache_discard(file_path)
+                continue
+            self.violations.extend(violations)
+            if hit is None:
+                self._cache_store(file_path, violations)
+            if self._should_stop(violations):
+                return True
+        return False
+    
+    def _should_stop(self, violations: List[KiroViolation]) -> bool:
+        """Check whether a fail-fast scan can stop after these violations."""
+        return self.fail_fast and any(v.severity == 'critical' for v in violations)
+    
     def check_file(self, file_path: str) -> List[KiroViolation]:
         """
         Check a single file against all compliance rules.
@@ -157,53 +516,179 @@ class KiroComplianceProcessor:
             return self.violations
         
         # Check file against each rule
-        for rule in self.rules:
-            violations = self._check_file_against_rule(file_path, rule)
-            self.violations.extend(violations)
+        self._scan_files([str(file_path)])
         
         return self.violations
     
-    def _check_file_against_rule(self, file_path: Path, rule: KiroRule) -> List[KiroViolation]:
-        """Check a single file against a single rule."""
-        violations = []
+    def _check_file(self, file_path: Union[str, Path],
+                    cached: Optional[List[KiroViolation]] = None) -> Optional[List[KiroViolation]]:
+        """
+        Read a file once and check it against all applicable rules.
         
-        # Check if rule pattern matches the file
-        pattern = rule.check.get('pattern', '**/*.py')
-        if not self._file_matches_pattern(file_path, pattern):
+        Args:
+            file_path: Path of the file to check
+            cached: Content-check violations from a previous run of the
+                unchanged file; only the other rule types are re-evaluated
+        
+        Returns:
+            Violations found, or None if the file was skipped without a scan
+        """
+        # Match the file against each distinct glob once, then pick the rules
+        path = str(file_path)
+        name = os.path.basename(path)
+        matched = {
+            pattern_re: pattern_re.match(path) is not None or pattern_re.match(name) is not None
+            for pattern_re in self._pattern_res.values()
+        }
+        rules = [rule for rule in self.rules if matched[rule.pattern_re]]
+        if not rules:
+            return []
+        
+        if cached is not None:
+            # File-pattern and file-exists rules depend on other files, so always rerun them
+            path_rules = [rule for rule in rules if rule.check.get('type') != 'content-check']
+            violations = list(cached)
+            violations.extend(self._check_file_all_rules(file_path, None, path_rules))
+            rule_order = {rule.name: index for index, rule in enumerate(rules)}
+            violations.sort(key=lambda v: rule_order.get(v.rule_name, len(rule_order)))
             return violations
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            check_type = rule.check.get('type')
-            
-            if check_type == 'content-check':
-                violations.extend(self._check_content_rule(file_path, content, rule))
-            elif check_type == 'file-pattern':
-                violations.extend(self._check_file_pattern_rule(file_path, rule))
-            elif check_type == 'file-exists':
-                violations.extend(self._check_file_exists_rule(file_path, rule))
-            
-        except UnicodeDecodeError:
-            # Skip binary files
-            pass
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if self.max_file_size and size > self.max_file_size:
+                    print(f"Warning: Skipping {file_path} ({size} bytes exceeds --max-file-size)")
+                    return None
+                
+                # Large files are scanned in place through a read-only mapping
+                if size >= MMAP_MIN_SIZE:
+                    content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    content = f.read()
         except Exception as e:
-            print(f"Warning: Error checking {file_path} against rule {rule.name}: {str(e)}")
+            print(f"Warning: Error reading {file_path}: {str(e)}")
+            return None
+        
+        try:
+            # Skip binary files
+            if content.find(b'\x00', 0, BINARY_SNIFF_SIZE) != -1:
+                return None
+            
+            return self._check_file_all_rules(file_path, FileContext(content), rules)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
+    
+    def _check_file_all_rules(self, file_path: Union[str, Path], context: Optional[FileContext],
+                              rules: List[KiroRule]) -> List[KiroViolation]:
+        """Check already-read file content against a list of rules."""
+        violations = []
+        
+        # One pass over the file for the prefiltered must-not-contain patterns;
+        # if none of them occur anywhere, their per-rule scans can be skipped
+        skip_forbidden = (
+            self._forbidden_re is not None
+            and any(_is_prefiltered_rule(rule) for rule in rules)
+            and self._forbidden_re.search(context.content) is None
+        )
+        
+        for rule in rules:
+            if skip_forbidden and _is_prefiltered_rule(rule):
+                continue
+            try:
+                check_type = rule.check.get('type')
+                
+                if check_type == 'content-check':
+                    violations.extend(self._check_content_rule(file_path, context, rule))
+                elif check_type == 'file-pattern':
+                    violations.extend(self._check_file_pattern_rule(Path(file_path), rule))
+                elif check_type == 'file-exists':
+                    violations.extend(self._check_file_exists_rule(Path(file_path), rule))
+                
+            except Exception as e:
+                print(f"Warning: Error checking {file_path} against rule {rule.name}: {str(e)}")
         
         return violations
     
-    def _check_content_rule(self, file_path: Path, content: str, rule: KiroRule) -> List[KiroViolation]:
+    def _load_cache(self) -> None:
+        """Load the result cache, discarding it if the rules have changed."""
+        self._cache = {}
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable cache {self.cache_file}: {str(e)}")
+            return
+        if data.get('rules_hash') == self._rules_hash:
+            self._cache = data.get('files', {})
+    
+    def _save_cache(self) -> None:
+        """Write the result cache atomically."""
+        if self.cache_file is None:
+            return
+        # Drop entries for files that have been deleted or moved
+        self._cache = {path: entry for path, entry in self._cache.items() if os.path.exists(path)}
+        data = {'rules_hash': self._rules_hash, 'files': self._cache}
+        temp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            print(f"Warning: Could not write cache {self.cache_file}: {str(e)}")
+    
+    def _cache_lookup(self, file_path: str) -> Optional[List[KiroViolation]]:
+        """Return cached content-check violations if the file is unchanged."""
+        if self.cache_file is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        if self.max_file_size and stat.st_size > self.max_file_size:
+            # The file will be skipped, whatever an earlier run found in it
+            return None
+        
+        entry = self._cache.get(os.path.abspath(file_path))
+        if (entry and entry.get('violations') is not None
+                and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size):
+            return [KiroViolation(*fields) for fields in entry['violations']]
+        
+        # Remember the stat taken before the read so a later edit invalidates the entry
+        self._cache[os.path.abspath(file_path)] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+                                                   'violations': None}
+        return None
+    
+    def _cache_store(self, file_path: str, violations: List[KiroViolation]) -> None:
+        """Record the content-check violations found for a freshly scanned file."""
+        key = os.path.abspath(file_path)
+        entry = self._cache.get(key)
+        if entry is None:
+            return
+        if self.fail_fast:
+            # Fail-fast results are incomplete and must not be reused
+            del self._cache[key]
+            return
+        content_rules = {rule.name for rule in self.rules if rule.check.get('type') == 'content-check'}
+        entry['violations'] = [list(astuple(v)) for v in violations if v.rule_name in content_rules]
+    
+    def _cache_discard(self, file_path: str) -> None:
+        """Forget the cache entry of a file that was not scanned."""
+        self._cache.pop(os.path.abspath(file_path), None)
+    
+    def _check_content_rule(self, file_path: Union[str, Path], context: FileContext,
+                            rule: KiroRule) -> List[KiroViolation]:
         """Check content-based rules."""
         violations = []
-        lines = content.split('\n')
         
-        content_pattern = rule.check.get('content-pattern', '')
-        match_pattern = rule.check.get('match-pattern', '')
+        content_re = rule.content_re
+        match_re = rule.match_re
         condition = rule.check.get('condition', 'must-contain')
         
         if condition == 'must-contain':
-            if not re.search(content_pattern, content, re.IGNORECASE | re.MULTILINE):
+            if not context.search(content_re):
                 violations.append(KiroViolation(
                     rule_name=rule.name,
                     file_path=str(file_path),
@@ -214,9 +699,15 @@ class KiroComplianceProcessor:
                 ))
         
         elif condition == 'must-not-contain':
-            matches = list(re.finditer(content_pattern, content, re.IGNORECASE | re.MULTILINE))
+            if self.fail_fast:
+                # Presence is all that matters; stop at the first match
+                match = context.search(content_re)
+                matches = [match] if match else []
+            else:
+                matches = context.finditer(content_re)
+            
             for match in matches:
-                line_number = content[:match.start()].count('\n') + 1
+                line_number = context.line_number(match.start())
                 violations.append(KiroViolation(
                     rule_name=rule.name,
                     file_path=str(file_path),
@@ -224,76 +715,45 @@ class KiroComplianceProcessor:
                     message=rule.message,
                     severity=rule.severity,
                     framework=rule.framework,
-                    matched_content=match.group()
+                    matched_content=_decode(match.group())
                 ))
         
         elif condition == 'must-contain-for-matches':
             # Check if file contains match pattern
-            if re.search(match_pattern, content, re.IGNORECASE | re.MULTILINE):
+            if context.search(match_re):
                 # If it does, it must also contain the content pattern
-                if not re.search(content_pattern, content, re.IGNORECASE | re.MULTILINE):
-                    # Find the line with the match pattern
-                    match_lines = []
-                    for i, line in enumerate(lines, 1):
-                        if re.search(match_pattern, line, re.IGNORECASE):
-                            match_lines.append(i)
-                    
-                    for line_number in match_lines:
-                        violations.append(KiroViolation(
-                            rule_name=rule.name,
-                            file_path=str(file_path),
-                            line_number=line_number,
-                            message=rule.message,
-                            severity=rule.severity,
-                            framework=rule.framework,
-                            matched_content=lines[line_number - 1] if line_number <= len(lines) else ""
-                        ))
+                if not context.search(content_re):
+                    # Report every line with the match pattern
+                    for line_number, line in enumerate(context.iter_lines(), 1):
+                        if match_re.search(line):
+                            violations.append(KiroViolation(
+                                rule_name=rule.name,
+                                file_path=str(file_path),
+                                line_number=line_number,
+                                message=rule.message,
+                                severity=rule.severity,
+                                framework=rule.framework,
+                                matched_content=_decode(line)
+                            ))
         
         elif condition == 'must-contain-for-classes-with':
-            # Find classes that contain the match pattern
-            class_pattern = r'class\s+(\w+).*?:'
-            current_class = None
-            class_start_line = 0
-            in_class = False
-            indent_level = 0
-            
-            for i, line in enumerate(lines, 1):
-                stripped_line = line.strip()
-                if not stripped_line or stripped_line.startswith('#'):
-                    continue
-                
-                # Calculate indentation
-                line_indent = len(line) - len(line.lstrip())
-                
-                # Check for class definition
-                class_match = re.match(class_pattern, stripped_line)
-                if class_match:
-                    current_class = class_match.group(1)
-                    class_start_line = i
-                    in_class = True
-                    indent_level = line_indent
-                    continue
-                
-                # If we're in a class and hit a line at the same or lower indentation, we've left the class
-                if in_class and line_indent <= indent_level and stripped_line and not stripped_line.startswith('@'):
-                    in_class = False
-                    current_class = None
-                
-                # Check if this line in the class matches our pattern
-                if in_class and re.search(match_pattern, line, re.IGNORECASE):
-                    # Now check if the class has the required content pattern
-                    class_content = '\n'.join(lines[class_start_line - 1:i])
-                    if not re.search(content_pattern, class_content, re.IGNORECASE | re.MULTILINE):
-                        violations.append(KiroViolation(
-                            rule_name=rule.name,
-                            file_path=str(file_path),
-                            line_number=class_start_line,
-                            message=f"{rule.message} (Class: {current_class})",
-                            severity=rule.severity,
-                            framework=rule.framework,
-                            matched_content=line.strip()
-                        ))
-                    break  # Only report once per class
+            # Check every class whose source matches the match pattern
+            for class_line, class_name, class_source in context.class_segments:
+                match = match_re.search(class_source)
+                if match and not content_re.search(class_source):
+                    line_start = class_source.rfind(b'\n', 0, match.start()) + 1
+                    line_end = class_source.find(b'\n', match.start())
+                    if line_end == -1:
+                        line_end = len(class_source)
+                    violations.append(KiroViolation(
+                        rule_name=rule.name,
+                        file_path=str(file_path),
+                        line_number=class_line,
+                        message=f"{rule.message} (Class: {class_name})",
+                        severity=rule.severity,
+                        framework=rule.framework,
+                        matched_content=_decode(class_source[line_start:line_end].strip())
+                    ))
         
         return violations
     
@@ -341,24 +801,32 @@ class KiroComplianceProcessor:
         
         return violations
     
-    def _file_matches_pattern(self, file_path: Path, pattern: str) -> bool:
-        """Check if a file matches a glob pattern."""
-        from fnmatch import fnmatch
-        return fnmatch(str(file_path), pattern) or fnmatch(file_path.name, pattern)
-    
-    def _matches_exclude_patterns(self, name: str, exclude_patterns: List[str]) -> bool:
-        """Check if a name matches any exclude patterns."""
-        from fnmatch import fnmatch
-        return any(fnmatch(name, pattern) for pattern in exclude_patterns)
+    def _matches_exclude_patterns(self, name: str, exclude_re: Pattern) -> bool:
+        """Check if a name matches the compiled exclude patterns."""
+        return exclude_re.match(name) is not None
     
     def _find_project_root(self, file_path: Path) -> Path:
         """Find the project root directory."""
-        current = file_path.parent
+        start = file_path.parent
+        walked = []
+        current = start
+        root = None
         while current.parent != current:
-            if (current / 'pyproject.toml').exists() or (current / '.git').exists():
-                return current
+            if current in self._root_cache:
+                root = self._root_cache[current]
+                break
+            walked.append(current)
+            current_str = str(current)
+            if (os.path.exists(os.path.join(current_str, 'pyproject.toml'))
+                    or os.path.exists(os.path.join(current_str, '.git'))):
+                root = current
+                break
             current = current.parent
-        return file_path.parent
+        
+        # Every directory on the way up resolves to the same root (None if there is none)
+        for directory in walked:
+            self._root_cache[directory] = root
+        return root if root is not None else start
     
     def generate_report(self, output_format: str = 'text') -> str:
         """
@@ -382,8 +850,10 @@ class KiroComplianceProcessor:
         if not self.violations:
             return "✅ No compliance violations found!"
         
-        report = f"📋 Compliance Report - {len(self.violations)} violations found\n"
-        report += "=" * 60 + "\n\n"
+        parts = [
+            f"📋 Compliance Report - {len(self.violations)} violations found\n",
+            "=" * 60 + "\n\n",
+        ]
         
         # Group by severity
         by_severity = {}
@@ -400,82 +870,60 @@ class KiroComplianceProcessor:
             violations = by_severity[severity]
             icon = {'critical': '🚨', 'error': '❌', 'warning': '⚠️', 'info': 'ℹ️'}[severity]
             
-            report += f"{icon} {severity.upper()} ({len(violations)})\n"
-            report += "-" * 40 + "\n"
+            parts.append(f"{icon} {severity.upper()} ({len(violations)})\n")
+            parts.append("-" * 40 + "\n")
             
-            for violation in violations:
-                report += f"File: {violation.file_path}:{violation.line_number}\n"
-                report += f"Rule: {violation.rule_name} ({violation.framework})\n"
-                report += f"Message: {violation.message}\n"
-                if violation.matched_content:
-                    report += f"Code: {violation.matched_content}\n"
-                report += "\n"
+            parts.extend(
+                TEXT_VIOLATION.format(
+                    file_path=violation.file_path,
+                    line_number=violation.line_number,
+                    rule_name=violation.rule_name,
+                    framework=violation.framework,
+                    message=violation.message,
+                    code=TEXT_CODE.format(code=violation.matched_content)
+                    if violation.matched_content else ''
+                )
+                for violation in violations
+            )
         
-        return report
+        return "".join(parts)
     
     def _generate_json_report(self) -> str:
         """Generate a JSON report."""
-        import json
-        
-        data = {
-            'summary': {
-                'total_violations': len(self.violations),
-                'by_severity': {},
-                'by_framework': {}
-            },
-            'violations': []
+        summary = {
+            'total_violations': len(self.violations),
+            'by_severity': dict(Counter(v.severity for v in self.violations)),
+            'by_framework': dict(Counter(v.framework for v in self.violations))
         }
         
-        # Calculate summaries
-        for violation in self.violations:
-            data['summary']['by_severity'][violation.severity] = \
-                data['summary']['by_severity'].get(violation.severity, 0) + 1
-            data['summary']['by_framework'][violation.framework] = \
-                data['summary']['by_framework'].get(violation.framework, 0) + 1
-            
-            data['violations'].append({
-                'rule_name': violation.rule_name,
-                'file_path': violation.file_path,
-                'line_number': violation.line_number,
-                'message': violation.message,
-                'severity': violation.severity,
-                'framework': violation.framework,
-                'matched_content': violation.matched_content
-            })
+        # orjson serializes the violation dataclasses natively
+        if orjson is not None:
+            data = {'summary': summary, 'violations': self.violations}
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
         
+        data = {
+            'summary': summary,
+            'violations': [
+                {
+                    'rule_name': violation.rule_name,
+                    'file_path': violation.file_path,
+                    'line_number': violation.line_number,
+                    'message': violation.message,
+                    'severity': violation.severity,
+                    'framework': violation.framework,
+                    'matched_content': violation.matched_content
+                }
+                for violation in self.violations
+            ]
+        }
         return json.dumps(data, indent=2)
     
     def _generate_html_report(self) -> str:
         """Generate an HTML report."""
         if not self.violations:
-            return """
-            <html><body>
-            <h1>✅ Compliance Report</h1>
-            <p>No compliance violations found!</p>
-            </body></html>
-            """
+            return HTML_EMPTY_REPORT
         
-        html = f"""
-        <html>
-        <head>
-            <title>CloudScope Compliance Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
-                .violation {{ margin: 10px 0; padding: 15px; border-left: 4px solid; }}
-                .critical {{ border-left-color: #d32f2f; background-color: #ffebee; }}
-                .error {{ border-left-color: #f57c00; background-color: #fff3e0; }}
-                .warning {{ border-left-color: #fbc02d; background-color: #fffde7; }}
-                .info {{ border-left-color: #1976d2; background-color: #e3f2fd; }}
-                .code {{ background-color: #f5f5f5; padding: 5px; font-family: monospace; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>📋 CloudScope Compliance Report</h1>
-                <p>{len(self.violations)} violations found</p>
-            </div>
-        """
+        parts = [HTML_REPORT_HEAD.format(count=len(self.violations))]
         
         # Group and display violations
         by_severity = {}
@@ -487,23 +935,23 @@ class KiroComplianceProcessor:
                 continue
             
             violations = by_severity[severity]
-            html += f"<h2>{severity.upper()} ({len(violations)})</h2>"
-            
-            for violation in violations:
-                html += f"""
-                <div class="violation {severity}">
-                    <h4>{violation.rule_name} ({violation.framework})</h4>
-                    <p><strong>File:</strong> {violation.file_path}:{violation.line_number}</p>
-                    <p><strong>Message:</strong> {violation.message}</p>
-                """
-                
-                if violation.matched_content:
-                    html += f'<div class="code">{violation.matched_content}</div>'
-                
-                html += "</div>"
+            parts.append(HTML_SECTION.format(severity=severity.upper(), count=len(violations)))
+            parts.extend(
+                HTML_VIOLATION.format(
+                    severity=severity,
+                    rule_name=escape(violation.rule_name),
+                    framework=escape(violation.framework),
+                    file_path=escape(violation.file_path),
+                    line_number=violation.line_number,
+                    message=escape(violation.message),
+                    code=HTML_CODE.format(code=escape(violation.matched_content))
+                    if violation.matched_content else ''
+                )
+                for violation in violations
+            )
         
-        html += "</body></html>"
-        return html
+        parts.append(HTML_REPORT_TAIL)
+        return "".join(parts)
 
 
 def main():
@@ -522,18 +970,28 @@ def main():
                         help='Patterns to exclude')
     parser.add_argument('--fail-on-violations', action='store_true',
                         help='Exit with error code if violations found')
+    parser.add_argument('--fail-fast', action='store_true',
+                        help='Report one match per rule and stop at the first critical violation')
+    parser.add_argument('--cache', nargs='?', const='.kiro/.compliance_cache.json',
+                        help='Reuse per-file results across runs (default: .kiro/.compliance_cache.json)')
+    parser.add_argument('--max-file-size', type=int, default=DEFAULT_MAX_FILE_SIZE,
+                        help='Skip files larger than this many bytes (0 for no limit)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes for directory scans')
     
     args = parser.parse_args()
     
     # Initialize processor
-    processor = KiroComplianceProcessor(args.rules)
+    processor = KiroComplianceProcessor(args.rules, args.cache)
+    processor.fail_fast = args.fail_fast
+    processor.max_file_size = args.max_file_size
     
     # Check the specified path
     path = Path(args.path)
     if path.is_file():
         violations = processor.check_file(str(path))
     elif path.is_dir():
-        violations = processor.check_directory(str(path), args.exclude)
+        violations = processor.check_directory(str(path), args.exclude, args.jobs)
     else:
         print(f"Error: Path '{path}' does not exist")
         sys.exit(1)
@@ -0,0 +1,16 @@
+"""
+Small helpers shared by CloudScope modules.
+"""
+
+import sys
+from typing import Any
+
+# Options for @dataclass; slots=True is only available from Python 3.10
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def intern_str(value: Any) -> Any:
+    """Intern exact str values, such as names that repeat across many records."""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
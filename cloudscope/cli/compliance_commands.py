@@ -6,35 +6,126 @@ and reporting functionality.
 """
 
 import argparse
+import hashlib
 import json
+import os
 import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from html import escape
 from pathlib import Path
-from typing import List, Optional
+from string import Template
+from typing import Any, List, Optional
 
-from cloudscope.infrastructure.compliance.analysis import (
-    ComplianceStaticAnalyzer,
-    generate_compliance_report_html
-)
-from cloudscope.infrastructure.compliance.monitoring import get_compliance_monitor
-from cloudscope.infrastructure.compliance.context import User, user_context
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_HTML_REPORT_HEAD = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>CloudScope $title Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #f0f0f0; padding: 20px; border-radius: 5px; }
+        table { border-collapse: collapse; width: 100%; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>CloudScope $title Report</h1>
+        <p>Generated: $generated</p>
+    </div>
+    <pre>""")
+
+_HTML_REPORT_TAIL = """</pre>
+</body>
+</html>
+"""
+
+# Severity levels from least to most severe
+SEVERITY_ORDER = {'info': 0, 'warning': 1, 'error': 2, 'critical': 3}
+
+# Analysis results are reused for repeat runs over an unchanged tree
+ANALYZE_CACHE_TTL = 30 * 60
+
+# Below this many files, process start-up costs more than parallel analysis saves
+CHECK_PARALLEL_MIN_FILES = 8
+
+# Analyzer owned by a check worker process, created on its first file
+_worker_analyzer = None
+
+
+def _analyze_file_worker(file_path: str) -> list:
+    """Analyze one file in a worker process."""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        from cloudscope.infrastructure.compliance.analysis import ComplianceStaticAnalyzer
+        _worker_analyzer = ComplianceStaticAnalyzer()
+    return _worker_analyzer.analyze_file(file_path)
+
+
+def _analyze_cache_dir() -> Path:
+    """Return the directory holding cached analyze reports."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(Path.home(), '.cache')
+    return Path(cache_home) / 'cloudscope' / 'analyze'
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize report data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
 
 
 class ComplianceCommands:
     """CLI commands for compliance functionality."""
     
     def __init__(self):
-        self.analyzer = ComplianceStaticAnalyzer()
-        self.monitor = get_compliance_monitor()
+        self._analyzer = None
+        self._monitor = None
+    
+    @property
+    def analyzer(self):
+        """Static analyzer, created on first use."""
+        if self._analyzer is None:
+            from cloudscope.infrastructure.compliance.analysis import ComplianceStaticAnalyzer
+            self._analyzer = ComplianceStaticAnalyzer()
+        return self._analyzer
     
-    def add_compliance_commands(self, parser: argparse.ArgumentParser) -> None:
+    @property
+    def monitor(self):
+        """Global compliance monitor, looked up on first use."""
+        if self._monitor is None:
+            from cloudscope.infrastructure.compliance.monitoring import get_compliance_monitor
+            self._monitor = get_compliance_monitor()
+        return self._monitor
+    
+    def add_compliance_commands(
+        self,
+        parser: argparse.ArgumentParser,
+        argv: Optional[List[str]] = None
+    ) -> None:
         """
         Add compliance-related commands to the argument parser.
         
+        Only the subcommand named on the command line is built; every
+        subcommand is built when none (or an unknown one) is given so that
+        help and error messages still list them all.
+        
         Args:
             parser: Main argument parser to add commands to
+            argv: Command-line arguments to inspect (default: sys.argv[1:])
         """
         # Create compliance subparser
-        compliance_parser = parser.add_subparser(
+        compliance_parser = parser.add_subparsers(dest='command').add_parser(
             'compliance',
             help='Compliance-as-code operations'
         )
@@ -43,8 +134,31 @@ class ComplianceCommands:
             help='Compliance commands'
         )
         
-        # Analyze command
-        analyze_parser = compliance_subparsers.add_parser(
+        builders = {
+            'analyze': self._add_analyze_parser,
+            'monitor': self._add_monitor_parser,
+            'report': self._add_report_parser,
+            'check': self._add_check_parser,
+            'config': self._add_config_parser,
+        }
+        requested = self._requested_command(argv, builders)
+        for name, build in builders.items():
+            if requested is None or name == requested:
+                build(compliance_subparsers)
+    
+    @staticmethod
+    def _requested_command(argv: Optional[List[str]], commands) -> Optional[str]:
+        """Return the compliance subcommand named in argv, if recognised."""
+        if argv is None:
+            argv = sys.argv[1:]
+        positionals = [arg for arg in argv if not arg.startswith('-')]
+        if len(positionals) >= 2 and positionals[0] == 'compliance' and positionals[1] in commands:
+            return positionals[1]
+        return None
+    
+    def _add_analyze_parser(self, subparsers) -> None:
+        """Add the analyze command."""
+        analyze_parser = subparsers.add_parser(
             'analyze',
             help='Run static compliance analysis'
         )
@@ -75,14 +189,26 @@ class ComplianceCommands:
             default=['test_*', '*_test.py', '__pycache__', '.git'],
             help='Patterns to exclude from analysis'
         )
+        analyze_parser.add_argument(
+            '--jobs', '-j',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of worker processes to analyze files with (default: CPU count)'
+        )
+        analyze_parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Re-run the analysis even if a cached report is available'
+        )
         analyze_parser.add_argument(
             '--severity',
             choices=['critical', 'error', 'warning', 'info'],
             help='Minimum severity level to report'
         )
-        
-        # Monitor command
-        monitor_parser = compliance_subparsers.add_parser(
+    
+    def _add_monitor_parser(self, subparsers) -> None:
+        """Add the monitor command."""
+        monitor_parser = subparsers.add_parser(
             'monitor',
             help='View compliance monitoring results'
         )
@@ -105,9 +231,10 @@ class ComplianceCommands:
             '--user',
             help='Filter by specific user ID'
         )
-        
-        # Report command
-        report_parser = compliance_subparsers.add_parser(
+    
+    def _add_report_parser(self, subparsers) -> None:
+        """Add the report command."""
+        report_parser = subparsers.add_parser(
             'report',
             help='Generate compliance reports'
         )
@@ -133,9 +260,10 @@ class ComplianceCommands:
             default=30,
             help='Period in days to analyze (default: 30)'
         )
-        
-        # Check command  
-        check_parser = compliance_subparsers.add_parser(
+    
+    def _add_check_parser(self, subparsers) -> None:
+        """Add the check command."""
+        check_parser = subparsers.add_parser(
             'check',
             help='Run compliance checks on specific files'
         )
@@ -153,9 +281,16 @@ class ComplianceCommands:
             '--framework',
             help='Specific framework to check against'
         )
-        
-        # Config command
-        config_parser = compliance_subparsers.add_parser(
+        check_parser.add_argument(
+            '--jobs', '-j',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of worker processes to check files with (default: CPU count)'
+        )
+    
+    def _add_config_parser(self, subparsers) -> None:
+        """Add the config command."""
+        config_parser = subparsers.add_parser(
             'config',
             help='Configure compliance settings'
         )
@@ -204,6 +339,13 @@ class ComplianceCommands:
             print(f"Error executing compliance command: {str(e)}")
             return 1
     
+    @staticmethod
+    def _framework_filter(framework: Optional[str]) -> Optional[frozenset]:
+        """Return the frameworks to keep, or None when no filter applies."""
+        if not framework or framework == 'ALL':
+            return None
+        return frozenset((sys.intern(framework),))
+    
     def _handle_analyze(self, args) -> int:
         """Handle the analyze command."""
         path = Path(args.path)
@@ -214,70 +356,136 @@ class ComplianceCommands:
         
         print(f"Analyzing compliance for: {path}")
         
-        # Run analysis
-        if path.is_file():
-            issues = self.analyzer.analyze_file(str(path))
-            report = type('Report', (), {
-                'total_files_analyzed': 1,
-                'issues_found': issues,
-                'compliance_score': max(0, (10 - len(issues)) / 10 * 100),
-                'framework_scores': self._calculate_framework_scores(issues)
-            })()
-        else:
-            report = self.analyzer.analyze_directory(
-                str(path),
-                exclude_patterns=args.exclude
-            )
-        
-        # Filter by framework if specified
-        if args.framework != 'ALL':
-            report.issues_found = [
-                issue for issue in report.issues_found 
-                if issue.framework == args.framework
-            ]
-        
-        # Filter by severity if specified
-        if args.severity:
-            severity_order = {'info': 0, 'warning': 1, 'error': 2, 'critical': 3}
-            min_level = severity_order.get(args.severity, 0)
-            report.issues_found = [
-                issue for issue in report.issues_found
-                if severity_order.get(issue.severity, 0) >= min_level
-            ]
+        # Run analysis, reusing a recent report for an unchanged tree
+        cache_path = None if args.no_cache else self._analyze_cache_path(path, args.exclude)
+        report = self._load_cached_report(cache_path) if cache_path else None
+        if report is None:
+            report = self._run_analysis(path, args.exclude, args.jobs)
+            if cache_path:
+                self._save_cached_report(report, cache_path)
+        
+        # Filter by framework and severity, grouping by severity in the same pass
+        min_level = SEVERITY_ORDER.get(args.severity, 0) if args.severity else 0
+        frameworks = self._framework_filter(args.framework)
+        issues = []
+        by_severity = {}
+        for issue in report.issues_found:
+            if frameworks is not None and issue.framework not in frameworks:
+                continue
+            if min_level and SEVERITY_ORDER.get(issue.severity, 0) < min_level:
+                continue
+            issues.append(issue)
+            by_severity.setdefault(issue.severity, []).append(issue)
+        report.issues_found = issues
         
         # Output results
         if args.format == 'console':
-            self._print_console_report(report)
+            self._print_console_report(report, by_severity)
         elif args.format == 'json':
             self._save_json_report(report, args.output)
         elif args.format == 'html':
+            from cloudscope.infrastructure.compliance.analysis import (
+                generate_compliance_report_html,
+            )
             generate_compliance_report_html(report, args.output)
             print(f"HTML report saved to: {args.output}")
         
         # Return appropriate exit code
-        critical_issues = [i for i in report.issues_found if i.severity == 'critical']
-        error_issues = [i for i in report.issues_found if i.severity == 'error']
-        
-        if critical_issues:
+        if 'critical' in by_severity:
             return 2  # Critical issues found
-        elif error_issues:
+        elif 'error' in by_severity:
             return 1  # Error issues found
         else:
             return 0  # Success
     
+    def _run_analysis(self, path: Path, exclude_patterns: List[str], jobs: int = 1):
+        """Analyze a file or directory and return a ComplianceReport."""
+        if path.is_dir():
+            return self.analyzer.analyze_directory(
+                str(path),
+                exclude_patterns=exclude_patterns,
+                jobs=jobs
+            )
+        
+        from cloudscope.infrastructure.compliance.analysis import ComplianceReport
+        issues = self.analyzer.analyze_file(str(path))
+        return ComplianceReport(
+            total_files_analyzed=1,
+            issues_found=issues,
+            compliance_score=max(0, (10 - len(issues)) / 10 * 100),
+            framework_scores=self._calculate_framework_scores(issues)
+        )
+    
+    def _analyze_cache_path(self, path: Path, exclude_patterns: List[str]) -> Optional[Path]:
+        """
+        Return the cache file for analyzing path with the given exclusions.
+        
+        The key covers the resolved path, the exclusions, the analyzer
+        module and the name, size and mtime of every Python file analyzed.
+        """
+        from cloudscope.infrastructure.compliance import analysis
+        
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            digest.update(str(path.resolve()).encode('utf-8'))
+            digest.update(repr(sorted(exclude_patterns or ())).encode('utf-8'))
+            digest.update(str(os.stat(analysis.__file__).st_mtime_ns).encode('ascii'))
+            if path.is_file():
+                stat = path.stat()
+                digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode('ascii'))
+            else:
+                # Hash exactly the files the analyzer will visit
+                for file_path in sorted(analysis.iter_analyzed_files(str(path), exclude_patterns)):
+                    stat = os.stat(file_path)
+                    entry = f"{file_path}:{stat.st_size}:{stat.st_mtime_ns}\n"
+                    digest.update(entry.encode('utf-8'))
+        except OSError:
+            return None
+        return _analyze_cache_dir() / f"{digest.hexdigest()}.json"
+    
+    def _load_cached_report(self, cache_path: Path):
+        """Load a cached ComplianceReport, or None if missing, expired or unreadable."""
+        try:
+            if time.time() - cache_path.stat().st_mtime > ANALYZE_CACHE_TTL:
+                return None
+            data = json.loads(cache_path.read_bytes())
+            
+            from cloudscope.infrastructure.compliance.analysis import (
+                ComplianceIssue,
+                ComplianceReport,
+            )
+            return ComplianceReport(
+                total_files_analyzed=data['total_files_analyzed'],
+                issues_found=[ComplianceIssue(**issue) for issue in data['issues_found']],
+                compliance_score=data['compliance_score'],
+                framework_scores=data['framework_scores']
+            )
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+    
+    def _save_cached_report(self, report, cache_path: Path) -> None:
+        """Cache a ComplianceReport; failures only cost the next run a re-analysis."""
+        from dataclasses import asdict
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(_dumps_json({
+                'total_files_analyzed': report.total_files_analyzed,
+                'issues_found': [asdict(issue) for issue in report.issues_found],
+                'compliance_score': report.compliance_score,
+                'framework_scores': report.framework_scores,
+            }))
+        except (OSError, TypeError):
+            pass
+    
     def _handle_monitor(self, args) -> int:
         """Handle the monitor command."""
         print(f"Compliance monitoring for last {args.period} hours")
         
         # Get violations
-        violations = self.monitor.get_violations()
-        
-        # Apply filters
-        if args.framework:
-            violations = [v for v in violations if v.framework == args.framework]
-        
-        if args.user:
-            violations = [v for v in violations if v.user_id == args.user]
+        violations = self.monitor.get_violations(
+            framework=args.framework if args.framework != 'ALL' else None,
+            user_id=args.user
+        )
         
         # Get metrics
         metrics = self.monitor.get_metrics(args.period)
@@ -351,8 +559,8 @@ class ComplianceCommands:
         # Save report
         if args.output:
             if args.format == 'json':
-                with open(args.output, 'w') as f:
-                    json.dump(data, f, indent=2)
+                with open(args.output, 'wb') as f:
+                    f.write(_dumps_json(data))
                 print(f"Report saved to: {args.output}")
             elif args.format == 'csv':
                 self._save_csv_report(data, args.output)
@@ -361,7 +569,7 @@ class ComplianceCommands:
                 self._save_html_report(data, args.output, args.type)
                 print(f"HTML report saved to: {args.output}")
         else:
-            print(json.dumps(data, indent=2))
+            print(_dumps_json(data).decode('utf-8'))
         
         return 0
     
@@ -369,18 +577,28 @@ class ComplianceCommands:
         """Handle the check command."""
         print(f"Checking {len(args.files)} files for compliance")
         
+        frameworks = self._framework_filter(args.framework)
+        existing = [file_path for file_path in args.files if Path(file_path).exists()]
+        if args.jobs > 1 and len(existing) >= CHECK_PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+                chunksize = max(1, len(existing) // (args.jobs * 4))
+                issues = executor.map(_analyze_file_worker, existing, chunksize=chunksize)
+                results = dict(zip(existing, issues))
+        else:
+            results = {file_path: self.analyzer.analyze_file(file_path) for file_path in existing}
+        
         total_issues = 0
         for file_path in args.files:
-            if not Path(file_path).exists():
+            if file_path not in results:
                 print(f"Warning: File '{file_path}' does not exist")
                 continue
             
             print(f"\nChecking: {file_path}")
-            issues = self.analyzer.analyze_file(file_path)
+            issues = results[file_path]
             
             # Filter by framework if specified
-            if args.framework:
-                issues = [i for i in issues if i.framework == args.framework]
+            if frameworks is not None:
+                issues = [i for i in issues if i.framework in frameworks]
             
             if issues:
                 total_issues += len(issues)
@@ -412,8 +630,8 @@ class ComplianceCommands:
         
         return 0
     
-    def _print_console_report(self, report) -> None:
-        """Print compliance report to console."""
+    def _print_console_report(self, report, by_severity: Optional[dict] = None) -> None:
+        """Print compliance report to console, optionally with issues pre-grouped by severity."""
         print(f"\n=== Compliance Analysis Report ===")
         print(f"Files analyzed: {report.total_files_analyzed}")
         print(f"Overall compliance score: {report.compliance_score:.1f}%")
@@ -428,11 +646,12 @@ class ComplianceCommands:
             print(f"\n=== Issues Found ({len(report.issues_found)}) ===")
             
             # Group by severity
-            by_severity = {}
-            for issue in report.issues_found:
-                by_severity.setdefault(issue.severity, []).append(issue)
+            if by_severity is None:
+                by_severity = {}
+                for issue in report.issues_found:
+                    by_severity.setdefault(issue.severity, []).append(issue)
             
-            for severity in ['critical', 'error', 'warning', 'info']:
+            for severity in reversed(SEVERITY_ORDER):
                 if severity in by_severity:
                     print(f"\n{severity.upper()} ({len(by_severity[severity])}):")
                     for issue in by_severity[severity]:
@@ -461,8 +680,8 @@ class ComplianceCommands:
             ]
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(_dumps_json(data))
     
     def _save_csv_report(self, data, output_path: str) -> None:
         """Save report data as CSV."""
@@ -476,60 +695,32 @@ class ComplianceCommands:
                     writer.writeheader()
                     writer.writerows(data)
         else:
-            # Metrics data - flatten for CSV
-            flattened = []
-            for key, value in data.items():
-                if isinstance(value, dict):
-                    for subkey, subvalue in value.items():
-                        flattened.append({'metric': f"{key}.{subkey}", 'value': subvalue})
-                else:
-                    flattened.append({'metric': key, 'value': value})
-            
+            # Metrics data - flatten nested dicts into dotted metric names
             with open(output_path, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=['metric', 'value'])
-                writer.writeheader()
-                writer.writerows(flattened)
+                writer = csv.writer(f)
+                writer.writerow(('metric', 'value'))
+                for key, value in data.items():
+                    if isinstance(value, dict):
+                        for subkey, subvalue in value.items():
+                            writer.writerow((f"{key}.{subkey}", subvalue))
+                    else:
+                        writer.writerow((key, value))
     
     def _save_html_report(self, data, output_path: str, report_type: str) -> None:
         """Save report data as HTML."""
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>CloudScope {report_type.title()} Report</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
-                table {{ border-collapse: collapse; width: 100%; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #f2f2f2; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>CloudScope {report_type.title()} Report</h1>
-                <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-            <pre>{json.dumps(data, indent=2)}</pre>
-        </body>
-        </html>
-        """
-        
-        with open(output_path, 'w') as f:
-            f.write(html_content)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(_HTML_REPORT_HEAD.substitute(
+                title=escape(report_type.title()),
+                generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            ))
+            f.write(escape(_dumps_json(data).decode('utf-8'), quote=False))
+            f.write(_HTML_REPORT_TAIL)
     
     def _calculate_framework_scores(self, issues: List) -> dict:
         """Calculate framework scores from issues list."""
-        frameworks = set(issue.framework for issue in issues)
-        scores = {}
-        
-        for framework in frameworks:
-            framework_issues = [i for i in issues if i.framework == framework]
-            # Simple scoring: start at 100, subtract points for issues
-            score = max(0, 100 - (len(framework_issues) * 10))
-            scores[framework] = score
-        
-        return scores
+        # Simple scoring: start at 100, subtract points for issues
+        counts = Counter(issue.framework for issue in issues)
+        return {framework: max(0, 100 - count * 10) for framework, count in counts.items()}
 
 
 def main():
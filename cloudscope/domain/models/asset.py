@@ -7,8 +7,27 @@ Assets can be servers, databases, applications, users, or any other entity that
 tracked in the inventory.
 """
 import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from operator import itemgetter
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Optional
+
+from cloudscope._util import DATACLASS_OPTIONS, intern_str
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+_required_fields = itemgetter("name", "asset_type", "source")
+
+
+def _parse_dt(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 string, passing datetimes and None through unchanged."""
+    if type(value) is str:
+        return _parse_iso(value)
+    return value
 
 
 class AssetValidationError(Exception):
@@ -17,6 +36,7 @@ class AssetValidationError(Exception):
     pass
 
 
+@dataclass(eq=False, **DATACLASS_OPTIONS)
 class Asset:
     """
     Asset domain model.
@@ -25,7 +45,7 @@ class Asset:
     applications, users, or any other entity that needs to be tracked in the inventory.
 
     Attributes:
-        id: Unique identifier for the asset
+        id: Unique identifier for the asset. If None, a UUID will be generated.
         name: Human-readable name of the asset
         asset_type: Type of asset (e.g., server, database, application)
         source: Source of the asset data (e.g., aws_collector, azure_collector)
@@ -34,55 +54,50 @@ class Asset:
         risk_score: Risk score of the asset (0-100)
         created_at: Timestamp when the asset was created
         updated_at: Timestamp when the asset was last updated
+
+    Raises:
+        AssetValidationError: If any of the required parameters are invalid
     """
 
-    def __init__(
-        self,
-        id: Optional[str],
-        name: str,
-        asset_type: str,
-        source: str,
-        metadata: Optional[Dict[str, Any]] = None,
-        tags: Optional[Dict[str, str]] = None,
-        risk_score: int = 0,
-        created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None,
-    ):
-        """
-        Initialize an Asset.
+    # Loaders of trusted data may switch this off to skip constructor validation
+    VALIDATE: ClassVar[bool] = True
 
-        Args:
-            id: Unique identifier for the asset. If None, a UUID will be generated.
-            name: Human-readable name of the asset
-            asset_type: Type of asset (e.g., server, database, application)
-            source: Source of the asset data (e.g., aws_collector, azure_collector)
-            metadata: Additional metadata about the asset
-            tags: Key-value pairs for categorizing the asset
-            risk_score: Risk score of the asset (0-100)
-            created_at: Timestamp when the asset was created
-            updated_at: Timestamp when the asset was last updated
+    id: Optional[str]
+    name: str
+    asset_type: str
+    source: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    tags: Dict[str, str] = field(default_factory=dict)
+    risk_score: int = 0
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    _batch_depth: int = field(default=0, init=False, repr=False)
 
-        Raises:
-            AssetValidationError: If any of the required parameters are invalid
-        """
-        # Validate required parameters
-        if not name:
-            raise AssetValidationError("Asset name cannot be empty")
-        if not asset_type:
-            raise AssetValidationError("Asset type cannot be empty")
-        if not source:
-            raise AssetValidationError("Asset source cannot be empty")
-
-        # Set attributes
-        self.id = id if id is not None else str(uuid.uuid4())
-        self.name = name
-        self.asset_type = asset_type
-        self.source = source
-        self.metadata = metadata or {}
-        self.tags = tags or {}
-        self.risk_score = risk_score
-        self.created_at = created_at or datetime.now()
-        self.updated_at = updated_at or self.created_at
+    def __post_init__(self) -> None:
+        """Validate required parameters and fill in generated defaults."""
+        if self.VALIDATE and not (self.name and self.asset_type and self.source):
+            for value, message in (
+                (self.name, "Asset name cannot be empty"),
+                (self.asset_type, "Asset type cannot be empty"),
+                (self.source, "Asset source cannot be empty"),
+            ):
+                if not value:
+                    raise AssetValidationError(message)
+
+        if self.id is None:
+            self.id = str(uuid.uuid4())
+        self.asset_type = intern_str(self.asset_type)
+        self.source = intern_str(self.source)
+        if self.metadata is None:
+            self.metadata = {}
+        if self.tags:
+            self.tags = {intern_str(key): value for key, value in self.tags.items()}
+        else:
+            self.tags = {}
+        if self.created_at is None:
+            self.created_at = datetime.now()
+        if self.updated_at is None:
+            self.updated_at = self.created_at
 
     def add_metadata(self, key: str, value: Any) -> None:
         """
@@ -93,7 +108,7 @@ class Asset:
             value: Metadata value
         """
         self.metadata[key] = value
-        self.updated_at = datetime.now()
+        self._touch()
 
     def add_tag(self, key: str, value: str) -> None:
         """
@@ -103,8 +118,8 @@ class Asset:
             key: Tag key
             value: Tag value
         """
-        self.tags[key] = value
-        self.updated_at = datetime.now()
+        self.tags[intern_str(key)] = value
+        self._touch()
 
     def set_risk_score(self, score: int) -> None:
         """
@@ -119,7 +134,54 @@ class Asset:
         if not 0 <= score <= 100:
             raise AssetValidationError("Risk score must be between 0 and 100")
         self.risk_score = score
-        self.updated_at = datetime.now()
+        self._touch()
+
+    def bulk_update(
+        self,
+        metadata: Optional[Dict[str, Any]] = None,
+        tags: Optional[Dict[str, str]] = None,
+        risk_score: Optional[int] = None,
+    ) -> None:
+        """
+        Update several attributes at once, refreshing updated_at a single time.
+
+        Args:
+            metadata: Metadata entries to add or replace
+            tags: Tags to add or replace
+            risk_score: New risk score (0-100)
+
+        Raises:
+            AssetValidationError: If the score is not between 0 and 100
+        """
+        if risk_score is not None and not 0 <= risk_score <= 100:
+            raise AssetValidationError("Risk score must be between 0 and 100")
+        if metadata:
+            self.metadata.update(metadata)
+        if tags:
+            self.tags.update((intern_str(key), value) for key, value in tags.items())
+        if risk_score is not None:
+            self.risk_score = risk_score
+        self._touch()
+
+    @contextmanager
+    def batch_mutate(self) -> Iterator["Asset"]:
+        """
+        Defer the updated_at refresh of individual mutators until the block exits.
+
+        Yields:
+            The asset itself
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self._touch()
+
+    def _touch(self) -> None:
+        """Refresh updated_at unless a batch_mutate block is active."""
+        if not self._batch_depth:
+            self.updated_at = datetime.now()
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -151,18 +213,6 @@ class Asset:
         Returns:
             Asset instance
         """
-        # Convert ISO format strings to datetime objects
-        created_at = (
-            datetime.fromisoformat(data["created_at"])
-            if isinstance(data.get("created_at"), str)
-            else data.get("created_at")
-        )
-        updated_at = (
-            datetime.fromisoformat(data["updated_at"])
-            if isinstance(data.get("updated_at"), str)
-            else data.get("updated_at")
-        )
-
         return cls(
             id=data.get("id"),
             name=data["name"],
@@ -171,6 +221,92 @@ class Asset:
             metadata=data.get("metadata", {}),
             tags=data.get("tags", {}),
             risk_score=data.get("risk_score", 0),
-            created_at=created_at,
-            updated_at=updated_at,
-        )
\ No newline at end of file
+            created_at=_parse_dt(data.get("created_at")),
+            updated_at=_parse_dt(data.get("updated_at")),
+        )
+
+    @classmethod
+    def from_dicts_bulk(cls, records: Iterable[Dict[str, Any]]) -> List["Asset"]:
+        """
+        Create Assets from many dictionaries.
+
+        Args:
+            records: Dictionaries containing asset data
+
+        Returns:
+            List of Asset instances
+        """
+        assets = []
+        append = assets.append
+        for data in records:
+            name, asset_type, source = _required_fields(data)
+            get = data.get
+            append(
+                cls(
+                    get("id"),
+                    name,
+                    asset_type,
+                    source,
+                    get("metadata", {}),
+                    get("tags", {}),
+                    get("risk_score", 0),
+                    _parse_dt(get("created_at")),
+                    _parse_dt(get("updated_at")),
+                )
+            )
+        return assets
+
+    @classmethod
+    def from_records(
+        cls, records: Iterable[Dict[str, Any]], validate: bool = True
+    ) -> List["Asset"]:
+        """
+        Create Assets from many dictionaries, optionally trusting their contents.
+
+        With validate=False the records are assumed to come from trusted
+        storage: instances are populated directly without running the
+        constructor's checks, and repeated timestamp strings are parsed once.
+
+        Args:
+            records: Dictionaries containing asset data
+            validate: Whether to run the usual constructor validation
+
+        Returns:
+            List of Asset instances
+        """
+        if validate:
+            return cls.from_dicts_bulk(records)
+
+        parsed: Dict[str, datetime] = {}
+
+        def parse(value: Any) -> Optional[datetime]:
+            if type(value) is not str:
+                return value
+            result = parsed.get(value)
+            if result is None:
+                result = parsed[value] = _parse_iso(value)
+            return result
+
+        new = cls.__new__
+        now = datetime.now()
+        assets = []
+        append = assets.append
+        for data in records:
+            name, asset_type, source = _required_fields(data)
+            get = data.get
+            asset = new(cls)
+            asset_id = get("id")
+            asset.id = asset_id if asset_id is not None else str(uuid.uuid4())
+            asset.name = name
+            asset.asset_type = intern_str(asset_type)
+            asset.source = intern_str(source)
+            asset.metadata = get("metadata") or {}
+            tags = get("tags")
+            asset.tags = {intern_str(key): value for key, value in tags.items()} if tags else {}
+            asset.risk_score = get("risk_score", 0)
+            created_at = parse(get("created_at")) or now
+            asset.created_at = created_at
+            asset.updated_at = parse(get("updated_at")) or created_at
+            asset._batch_depth = 0
+            append(asset)
+        return assets
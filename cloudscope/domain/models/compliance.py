@@ -3,7 +3,7 @@ Compliance domain model for managing compliance requirements and assessments.
 """
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import ClassVar, List, Dict, Any, Optional
 from enum import Enum
 
 
@@ -66,6 +66,15 @@ class Control:
 @dataclass
 class ComplianceAssessment:
     """Results of a compliance assessment for an asset."""
+    _THRESHOLDS: ClassVar[Dict[ComplianceLevel, float]] = {
+        ComplianceLevel.BASIC: 70.0,
+        ComplianceLevel.STANDARD: 85.0,
+        ComplianceLevel.ADVANCED: 95.0,
+        ComplianceLevel.ASVS_L1: 80.0,
+        ComplianceLevel.ASVS_L2: 90.0,
+        ComplianceLevel.ASVS_L3: 95.0,
+    }
+    
     id: str
     asset_id: str
     framework: ComplianceFramework
@@ -94,13 +103,4 @@ class ComplianceAssessment:
     @property
     def is_compliant(self) -> bool:
         """Check if assessment meets minimum compliance threshold."""
-        thresholds = {
-            ComplianceLevel.BASIC: 70.0,
-            ComplianceLevel.STANDARD: 85.0,
-            ComplianceLevel.ADVANCED: 95.0,
-            ComplianceLevel.ASVS_L1: 80.0,
-            ComplianceLevel.ASVS_L2: 90.0,
-            ComplianceLevel.ASVS_L3: 95.0,
-        }
-        threshold = thresholds.get(self.level, 85.0)
-        return self.compliance_score >= threshold
+        return self.compliance_score >= self._THRESHOLDS.get(self.level, 85.0)
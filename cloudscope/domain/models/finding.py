@@ -2,12 +2,14 @@
 Finding model for compliance violations and security issues.
 Part of CloudScope's compliance-as-code implementation.
 """
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime, timezone, timezone
-from typing import Optional, Dict, Any
+from typing import Callable, Iterable, Optional, Dict, Any
 from enum import Enum
 import uuid
 
+from cloudscope._util import DATACLASS_OPTIONS, intern_str
+
 
 class Severity(Enum):
     """Severity levels for compliance findings."""
@@ -19,14 +21,7 @@ class Severity(Enum):
 
     def to_risk_score(self) -> int:
         """Convert severity to risk score (0-100)."""
-        mapping = {
-            self.CRITICAL: 100,
-            self.HIGH: 80,
-            self.MEDIUM: 60,
-            self.LOW: 30,
-            self.INFO: 10
-        }
-        return mapping[self]
+        return _RISK_SCORE[self]
 
 
 class FindingStatus(Enum):
@@ -38,7 +33,25 @@ class FindingStatus(Enum):
     FALSE_POSITIVE = "FALSE_POSITIVE"
 
 
-@dataclass
+# Lookup tables used on the serialization path instead of per-call enum work
+_RISK_SCORE = {
+    Severity.CRITICAL: 100,
+    Severity.HIGH: 80,
+    Severity.MEDIUM: 60,
+    Severity.LOW: 30,
+    Severity.INFO: 10,
+}
+_SEVERITY_VALUE = {severity: severity.value for severity in Severity}
+_STATUS_VALUE = {status: status.value for status in FindingStatus}
+_SEVERITY_FROM_STR = {value: severity for severity, value in _SEVERITY_VALUE.items()}
+_STATUS_FROM_STR = {value: status for status, value in _STATUS_VALUE.items()}
+
+# Bound once for the generated from_dict and the lifecycle methods
+_FROMISO = datetime.fromisoformat
+_UTC = timezone.utc
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class Finding:
     """
     Represents a compliance or security finding.
@@ -55,7 +68,7 @@ class Finding:
     control_id: str  # "V1.1.1", "CC6.1", etc.
     
     # Auto-generated fields
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
     status: FindingStatus = field(default=FindingStatus.OPEN)
     discovered_at: datetime = field(default_factory=datetime.utcnow)
     
@@ -74,6 +87,12 @@ class Finding:
     
     def __post_init__(self):
         """Validate finding after initialization."""
+        if self.asset_id and self.title and self.description and self.framework and self.control_id:
+            # Many findings share an asset, framework and control
+            self.asset_id = intern_str(self.asset_id)
+            self.framework = intern_str(self.framework)
+            self.control_id = intern_str(self.control_id)
+            return
         if not self.asset_id:
             raise ValueError("asset_id is required")
         if not self.title:
@@ -91,72 +110,137 @@ class Finding:
             raise ValueError("Finding is already resolved")
             
         self.status = FindingStatus.RESOLVED
-        self.resolved_at = datetime.now(timezone.utc)
+        self.resolved_at = datetime.now(_UTC)
         self.resolved_by = resolved_by
         self.resolution_notes = resolution_notes
         
+    @classmethod
+    def bulk_resolve(
+        cls, findings: Iterable["Finding"], resolved_by: str, resolution_notes: str = ""
+    ):
+        """
+        Mark many findings as resolved with a single resolution timestamp.
+        
+        No finding is changed if any of them is already resolved.
+        """
+        findings = list(findings)
+        for finding in findings:
+            if finding.status == FindingStatus.RESOLVED:
+                raise ValueError(f"Finding {finding.id} is already resolved")
+        
+        resolved_at = datetime.now(_UTC)
+        for finding in findings:
+            finding.status = FindingStatus.RESOLVED
+            finding.resolved_at = resolved_at
+            finding.resolved_by = resolved_by
+            finding.resolution_notes = resolution_notes
+        
     def accept_risk(self, accepted_by: str, justification: str):
         """Accept the risk associated with this finding."""
         self.status = FindingStatus.ACCEPTED
-        self.resolved_at = datetime.now(timezone.utc)
+        self.resolved_at = datetime.now(_UTC)
         self.resolved_by = accepted_by
         self.resolution_notes = f"Risk accepted: {justification}"
         
     def mark_false_positive(self, marked_by: str, reason: str):
         """Mark the finding as a false positive."""
         self.status = FindingStatus.FALSE_POSITIVE
-        self.resolved_at = datetime.now(timezone.utc)
+        self.resolved_at = datetime.now(_UTC)
         self.resolved_by = marked_by
         self.resolution_notes = f"False positive: {reason}"
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert finding to dictionary for serialization."""
+        severity = self.severity
+        resolved_at = self.resolved_at
+        due_date = self.due_date
         return {
             "id": self.id,
             "asset_id": self.asset_id,
             "title": self.title,
             "description": self.description,
-            "severity": self.severity.value,
-            "status": self.status.value,
+            "severity": _SEVERITY_VALUE[severity],
+            "status": _STATUS_VALUE[self.status],
             "framework": self.framework,
             "control_id": self.control_id,
             "discovered_at": self.discovered_at.isoformat(),
-            "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None,
+            "resolved_at": resolved_at.isoformat() if resolved_at else None,
             "resolved_by": self.resolved_by,
             "resolution_notes": self.resolution_notes,
-            "due_date": self.due_date.isoformat() if self.due_date else None,
+            "due_date": due_date.isoformat() if due_date else None,
             "assignee": self.assignee,
             "evidence": self.evidence,
             "remediation": self.remediation,
             "tags": self.tags,
             "references": self.references,
-            "risk_score": self.severity.to_risk_score()
+            "risk_score": _RISK_SCORE[severity]
         }
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Finding":
         """Create a Finding from a dictionary."""
-        # Convert string values back to enums
-        if isinstance(data.get("severity"), str):
-            data["severity"] = Severity(data["severity"])
-        if isinstance(data.get("status"), str):
-            data["status"] = FindingStatus(data["status"])
-            
-        # Convert ISO format strings back to datetime
-        if data.get("discovered_at") and isinstance(data["discovered_at"], str):
-            data["discovered_at"] = datetime.fromisoformat(data["discovered_at"])
-        if data.get("resolved_at") and isinstance(data["resolved_at"], str):
-            data["resolved_at"] = datetime.fromisoformat(data["resolved_at"])
-        if data.get("due_date") and isinstance(data["due_date"], str):
-            data["due_date"] = datetime.fromisoformat(data["due_date"])
-            
-        # Remove any extra fields not in the dataclass
-        valid_fields = {
-            "id", "asset_id", "title", "description", "severity", "status",
-            "framework", "control_id", "discovered_at", "resolved_at",
-            "resolved_by", "resolution_notes", "due_date", "assignee",
-            "evidence", "remediation", "tags", "references"
-        }
-        
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
-        return cls(**filtered_data)
+        try:
+            from_dict = _FROM_DICT[cls]
+        except KeyError:
+            from_dict = _FROM_DICT[cls] = _compile_from_dict(cls)
+        try:
+            return from_dict(data)
+        except KeyError as e:
+            # Only required fields are read without a default
+            raise TypeError(f"missing required field {e}") from None
+
+
+# Deserializers generated per class by _compile_from_dict
+_FROM_DICT: Dict[type, Callable[[Dict[str, Any]], Finding]] = {}
+
+# Conversions applied to serialized values, by field name. Unknown enum
+# values fall through to the Enum call, which raises ValueError.
+_FROM_DICT_CONVERSIONS = {
+    "severity": "(_SEVERITY_FROM_STR.get({0}) or _Severity({0})) if type({0}) is str else {0}",
+    "status": "(_STATUS_FROM_STR.get({0}) or _FindingStatus({0})) if type({0}) is str else {0}",
+    "discovered_at": "_FROMISO({0}) if type({0}) is str and {0} else {0}",
+    "resolved_at": "_FROMISO({0}) if type({0}) is str and {0} else {0}",
+    "due_date": "_FROMISO({0}) if type({0}) is str and {0} else {0}",
+}
+
+
+def _compile_from_dict(cls) -> Callable[[Dict[str, Any]], Finding]:
+    """
+    Generate a from_dict specialised to the init fields of cls.
+    
+    Each field is read straight from the input dictionary, falling back to its
+    dataclass default when absent, so no per-call filtering of keys is needed
+    and unknown keys are ignored. The input dictionary is left unmodified.
+    """
+    namespace = {
+        "cls": cls,
+        "_Severity": Severity,
+        "_FindingStatus": FindingStatus,
+        "_SEVERITY_FROM_STR": _SEVERITY_FROM_STR,
+        "_STATUS_FROM_STR": _STATUS_FROM_STR,
+        "_FROMISO": _FROMISO,
+    }
+    body = []
+    names = []
+    for f in fields(cls):
+        if not f.init:
+            continue
+        name = f.name
+        if f.default is not MISSING:
+            namespace[f"_default_{name}"] = f.default
+            value = f"data.get({name!r}, _default_{name})"
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{name}"] = f.default_factory
+            value = f"data[{name!r}] if {name!r} in data else _factory_{name}()"
+        else:
+            value = f"data[{name!r}]"
+        body.append(f"    {name} = {value}")
+        conversion = _FROM_DICT_CONVERSIONS.get(name)
+        if conversion:
+            body.append(f"    {name} = {conversion.format(name)}")
+        names.append(name)
+    
+    arguments = ", ".join(f"{name}={name}" for name in names)
+    source = "\n".join(["def from_dict(data):", *body, f"    return cls({arguments})"])
+    exec(source, namespace)
+    return namespace["from_dict"]
@@ -12,6 +12,8 @@ from .decorators import (
     audit_log,
     access_control,
     pci_scope,
+    start_audit_log_listener,
+    stop_audit_log_listener,
 )
 from .monitoring import ComplianceMonitor
 from .analysis import ComplianceStaticAnalyzer
@@ -27,6 +29,8 @@ __all__ = [
     "audit_log",
     "access_control",
     "pci_scope",
+    "start_audit_log_listener",
+    "stop_audit_log_listener",
     "ComplianceMonitor",
     "ComplianceStaticAnalyzer",
     "ComplianceViolationError",
@@ -6,16 +6,27 @@ requirements during development and CI/CD pipelines.
 """
 
 import ast
+import fnmatch
+import hashlib
+import json
 import os
 import re
-from typing import List, Dict, Any, Optional, Set
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Any, Iterator, Optional, Pattern, Set
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from html import escape
 from pathlib import Path
 
+from cloudscope._util import DATACLASS_OPTIONS, intern_str
 from .exceptions import ComplianceViolationError
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ComplianceIssue:
     """Represents a compliance issue found during static analysis."""
     file_path: str
@@ -26,9 +37,15 @@ class ComplianceIssue:
     framework: str
     recommendation: str
     code_snippet: Optional[str] = None
+    
+    def __post_init__(self):
+        # Issue types, severities and frameworks come from a small fixed set
+        self.issue_type = intern_str(self.issue_type)
+        self.severity = intern_str(self.severity)
+        self.framework = intern_str(self.framework)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ComplianceReport:
     """Compliance analysis report."""
     total_files_analyzed: int
@@ -36,33 +53,237 @@ class ComplianceReport:
     compliance_score: float
     framework_scores: Dict[str, float]
     
+    # Issues bucketed by severity and framework on the first lookup. The
+    # buckets are rebuilt if issues_found is replaced, but not if the list
+    # is modified in place.
+    _indexed_issues: Optional[List[ComplianceIssue]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _by_severity: Dict[str, List[ComplianceIssue]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_framework: Dict[str, List[ComplianceIssue]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def _index_issues(self) -> None:
+        """Bucket issues_found by severity and framework if not already done."""
+        if self._indexed_issues is self.issues_found:
+            return
+        by_severity = {}
+        by_framework = {}
+        for issue in self.issues_found:
+            by_severity.setdefault(issue.severity, []).append(issue)
+            by_framework.setdefault(issue.framework, []).append(issue)
+        self._by_severity = by_severity
+        self._by_framework = by_framework
+        self._indexed_issues = self.issues_found
+    
     def get_issues_by_severity(self, severity: str) -> List[ComplianceIssue]:
         """Get issues filtered by severity."""
-        return [issue for issue in self.issues_found if issue.severity == severity]
+        self._index_issues()
+        return list(self._by_severity.get(severity, ()))
     
     def get_issues_by_framework(self, framework: str) -> List[ComplianceIssue]:
         """Get issues filtered by framework."""
-        return [issue for issue in self.issues_found if issue.framework == framework]
+        self._index_issues()
+        return list(self._by_framework.get(framework, ()))
+
+
+PERSONAL_DATA_KEYWORDS = ('name', 'email', 'address', 'phone', 'ssn', 'social', 'birth', 'dob')
+HEALTH_DATA_KEYWORDS = ('health', 'medical', 'patient', 'diagnosis', 'treatment', 'medication', 'symptom')
+FINANCIAL_DATA_KEYWORDS = ('card', 'payment', 'credit', 'cvv', 'account', 'bank', 'financial')
+
+
+def _compile_keywords(keywords) -> Pattern:
+    """Compile keywords into one alternation for searching identifiers."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
+def _compile_exclude_patterns(exclude_patterns: List[str]) -> Optional[Pattern]:
+    """Combine exclude globs into one pattern matched against whole names."""
+    if not exclude_patterns:
+        return None
+    return re.compile('|'.join(f"(?:{fnmatch.translate(pattern)})" for pattern in exclude_patterns))
+
+
+_NEWLINE_RE = re.compile(b'\n')
+
+
+@lru_cache(maxsize=None)
+def _classification_re(classification: str) -> Pattern:
+    """Compile the decorator pattern for a data classification."""
+    return re.compile(rf"@data_classification\(['\"]?{classification}['\"]?\)".encode())
+
+
+class _SourceIndex:
+    """
+    Line access for one analyzed file, kept as the raw bytes.
+    
+    Most files never need a line: line starts are only located when a check
+    asks for a snippet or a nearby marker, and only the requested line is
+    decoded. Decorator checks ask whether a marker appears within a few
+    lines of a node; the lines containing each marker are found once per
+    file and kept sorted, so each check is a binary search.
+    """
+    
+    def __init__(self, data: bytes):
+        self.data = data
+        self._line_starts: Optional[List[int]] = None
+        self._marker_lines: Dict[Any, List[int]] = {}
+        self._snippets: Dict[int, str] = {}
+    
+    @property
+    def line_starts(self) -> List[int]:
+        """Byte offset at which each line begins."""
+        if self._line_starts is None:
+            self._line_starts = [0]
+            self._line_starts.extend(match.end() for match in _NEWLINE_RE.finditer(self.data))
+        return self._line_starts
+    
+    def snippet(self, lineno: int) -> Optional[str]:
+        """Return the source line for a 1-based line number."""
+        # Several checks report against the same class or function line
+        snippet = self._snippets.get(lineno)
+        if snippet is None:
+            line_starts = self.line_starts
+            if lineno > len(line_starts):
+                return None
+            end = line_starts[lineno] - 1 if lineno < len(line_starts) else len(self.data)
+            snippet = self.data[line_starts[lineno - 1]:end].decode('utf-8', 'replace')
+            self._snippets[lineno] = snippet
+        return snippet
+    
+    def has_nearby(self, marker, lineno: int, context_size: int) -> bool:
+        """Check if a bytes substring or pattern occurs within context_size lines of lineno."""
+        line_starts = self.line_starts
+        found = self._marker_lines.get(marker)
+        if found is None:
+            if isinstance(marker, bytes):
+                positions = []
+                position = self.data.find(marker)
+                while position != -1:
+                    positions.append(position)
+                    position = self.data.find(marker, position + 1)
+            else:
+                positions = [match.start() for match in marker.finditer(self.data)]
+            # Markers never span lines, so each one belongs to the line it starts on
+            found = sorted({bisect_right(line_starts, position) - 1 for position in positions})
+            self._marker_lines[marker] = found
+        start = max(0, lineno - context_size - 1)
+        end = min(len(line_starts), lineno + context_size)
+        position = bisect_left(found, start)
+        return position < len(found) and found[position] < end
+
+
+# Fields holding nested statements, in the order ast.iter_child_nodes visits them
+_STATEMENT_FIELDS = ('body', 'handlers', 'orelse', 'finalbody', 'cases')
+
+
+def _iter_statements(tree: ast.AST) -> Iterator[ast.AST]:
+    """
+    Yield the statement-level nodes of tree in ast.walk order.
+    
+    Classes, functions and assignments are statements, and statements only
+    nest inside other statements, exception handlers and match cases, so
+    expression subtrees are never entered.
+    """
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        for name in _STATEMENT_FIELDS:
+            children = getattr(node, name, None)
+            if children:
+                todo.extend(children)
+        yield node
+
+
+def _iter_py_files(root: str, exclude_re: Optional[Pattern]) -> Iterator[str]:
+    """
+    Yield the Python files under root that are not excluded.
+    
+    Files come out in os.walk's top-down order: a directory's own files first,
+    then each subdirectory in turn. Symlinked directories are not followed and
+    unreadable directories are skipped.
+    """
+    stack = [root]
+    while stack:
+        try:
+            scanner = os.scandir(stack.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with scanner:
+            for entry in scanner:
+                name = entry.name
+                if exclude_re is not None and exclude_re.match(name):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif name.endswith('.py'):
+                    yield entry.path
+        stack.extend(reversed(subdirs))
+
+
+def iter_analyzed_files(directory_path: str,
+                        exclude_patterns: Optional[List[str]] = None) -> Iterator[str]:
+    """
+    Yield the files analyze_directory analyzes, in the order it analyzes them.
+    
+    Args:
+        directory_path: Path to directory to analyze
+        exclude_patterns: Patterns to exclude (default: test files, __pycache__ and .git)
+    
+    Returns:
+        Iterator over file paths
+    """
+    if exclude_patterns is None:
+        exclude_patterns = ['test_*', '*_test.py', '__pycache__', '.git']
+    return _iter_py_files(directory_path, _compile_exclude_patterns(exclude_patterns))
+
+
+# Bump whenever a check changes so cached per-file results are not reused
+ANALYSIS_CACHE_VERSION = "1"
+
+
+# Below this many files, process start-up costs more than parallel analysis saves
+PARALLEL_MIN_FILES = 32
+
+# Analyzer owned by a worker process, created once by _init_worker
+_worker_analyzer = None
+
+
+def _init_worker(analyzer_class, cache_dir: Optional[str]) -> None:
+    """Create the analyzer a worker process reuses for all of its files."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer_class(cache_dir=cache_dir)
+
+
+def _analyze_file_worker(file_path: str) -> List["ComplianceIssue"]:
+    """Analyze one file in a worker process."""
+    return _worker_analyzer.analyze_file(file_path)
 
 
 class ComplianceStaticAnalyzer:
     """Static analyzer for compliance requirements."""
     
-    def __init__(self):
-        self.personal_data_patterns = [
-            r'.*name.*', r'.*email.*', r'.*address.*', r'.*phone.*',
-            r'.*ssn.*', r'.*social.*', r'.*birth.*', r'.*dob.*'
-        ]
-        
-        self.health_data_patterns = [
-            r'.*health.*', r'.*medical.*', r'.*patient.*', r'.*diagnosis.*',
-            r'.*treatment.*', r'.*medication.*', r'.*symptom.*'
-        ]
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Directory for per-file results, reused while a file's
+                mtime and size are unchanged (e.g. ".cloudscope_cache").
+                Caching is disabled when None.
+        """
+        self.cache_dir = cache_dir
+        self.personal_data_patterns = [rf'.*{keyword}.*' for keyword in PERSONAL_DATA_KEYWORDS]
+        self.health_data_patterns = [rf'.*{keyword}.*' for keyword in HEALTH_DATA_KEYWORDS]
+        self.financial_data_patterns = [rf'.*{keyword}.*' for keyword in FINANCIAL_DATA_KEYWORDS]
         
-        self.financial_data_patterns = [
-            r'.*card.*', r'.*payment.*', r'.*credit.*', r'.*cvv.*',
-            r'.*account.*', r'.*bank.*', r'.*financial.*'
-        ]
+        # '.*keyword.*' matched against a name is a search for any keyword,
+        # so each category is checked with a single compiled alternation
+        self._personal_data_re = _compile_keywords(PERSONAL_DATA_KEYWORDS)
+        self._health_data_re = _compile_keywords(HEALTH_DATA_KEYWORDS)
+        self._financial_data_re = _compile_keywords(FINANCIAL_DATA_KEYWORDS)
     
     def analyze_file(self, file_path: str) -> List[ComplianceIssue]:
         """
@@ -74,20 +295,101 @@ class ComplianceStaticAnalyzer:
         Returns:
             List of compliance issues found
         """
+        if self.cache_dir is None:
+            return self._analyze_file(file_path)
+        
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return self._analyze_file(file_path)
+        
+        cache_path = self._file_cache_path(file_path)
+        issues = self._load_cached_issues(cache_path, file_path, stat)
+        if issues is None:
+            issues = self._analyze_file(file_path)
+            self._save_cached_issues(cache_path, issues, stat)
+        return issues
+    
+    def _file_cache_path(self, file_path: str) -> str:
+        """Return the cache entry holding results for file_path."""
+        key = f"{ANALYSIS_CACHE_VERSION}:{type(self).__qualname__}:{os.path.abspath(file_path)}"
+        return os.path.join(self.cache_dir, hashlib.blake2b(key.encode()).hexdigest() + '.json')
+    
+    def _load_cached_issues(self, cache_path: str, file_path: str,
+                            stat: os.stat_result) -> Optional[List[ComplianceIssue]]:
+        """Load cached issues, or None if missing, stale or unreadable."""
+        try:
+            with open(cache_path, 'rb') as f:
+                entry = json.load(f)
+            if entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+                return None
+            return [ComplianceIssue(file_path=file_path, **issue) for issue in entry['issues']]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_cached_issues(self, cache_path: str, issues: List[ComplianceIssue],
+                            stat: os.stat_result) -> None:
+        """Store issues for a file; failures only cost a later cache miss."""
+        entry_issues = []
+        for issue in issues:
+            data = asdict(issue)
+            del data['file_path']
+            entry_issues.append(data)
+        entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'issues': entry_issues}
+        
+        # Write then rename so concurrent workers never see a partial entry
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    def _analyze_file(self, file_path: str) -> List[ComplianceIssue]:
+        """Analyze a single file without consulting the cache."""
         issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            if b'\r' in data:
+                # Match the universal newlines the parser uses when numbering lines
+                data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            
+            # Parse the AST straight from bytes, honouring any encoding declaration
+            try:
+                tree = ast.parse(data, filename=file_path)
+            except SyntaxError:
+                # Re-parse as UTF-8 text, as files were read before, so that
+                # undecodable files stay analysis errors rather than syntax errors
+                tree = ast.parse(data.decode('utf-8'), filename=file_path)
             
-            # Parse the AST
-            tree = ast.parse(content, filename=file_path)
+            # Run every compliance check in a single walk over the tree,
+            # keeping each framework's issues together as separate passes did
+            source = _SourceIndex(data)
+            gdpr_issues, pci_issues, hipaa_issues, general_issues = [], [], [], []
+            for node in _iter_statements(tree):
+                node_type = type(node)
+                if node_type is ast.ClassDef:
+                    self._check_gdpr_class(node, file_path, source, gdpr_issues)
+                    self._check_pci_class(node, file_path, source, pci_issues)
+                    self._check_hipaa_class(node, file_path, source, hipaa_issues)
+                elif node_type is ast.FunctionDef:
+                    self._check_gdpr_function(node, file_path, source, gdpr_issues)
+                    self._check_hipaa_function(node, file_path, source, hipaa_issues)
+                    self._check_admin_function(node, file_path, source, general_issues)
+                elif node_type is ast.Assign:
+                    self._check_hardcoded_secret(node, file_path, source, general_issues)
             
-            # Run various compliance checks
-            issues.extend(self._check_gdpr_compliance(tree, file_path, content))
-            issues.extend(self._check_pci_compliance(tree, file_path, content))
-            issues.extend(self._check_hipaa_compliance(tree, file_path, content))
-            issues.extend(self._check_general_security(tree, file_path, content))
+            issues.extend(gdpr_issues)
+            issues.extend(pci_issues)
+            issues.extend(hipaa_issues)
+            issues.extend(general_issues)
             
         except SyntaxError as e:
             issues.append(ComplianceIssue(
@@ -112,52 +414,47 @@ class ComplianceStaticAnalyzer:
         
         return issues
     
-    def analyze_directory(self, directory_path: str, exclude_patterns: List[str] = None) -> ComplianceReport:
+    def analyze_directory(self, directory_path: str, exclude_patterns: List[str] = None,
+                          jobs: int = 1) -> ComplianceReport:
         """
         Analyze all Python files in a directory for compliance issues.
         
         Args:
             directory_path: Path to directory to analyze
             exclude_patterns: Patterns to exclude from analysis
+            jobs: Number of worker processes (default: 1, in-process). Trees
+                with fewer than PARALLEL_MIN_FILES files are always analyzed
+                in-process. Callers on spawn platforms need a __main__ guard.
         
         Returns:
             ComplianceReport with analysis results
         """
-        if exclude_patterns is None:
-            exclude_patterns = ['test_*', '*_test.py', '__pycache__', '.git']
+        file_paths = list(iter_analyzed_files(directory_path, exclude_patterns))
+        files_analyzed = len(file_paths)
         
-        all_issues = []
-        files_analyzed = 0
-        
-        for root, dirs, files in os.walk(directory_path):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if not any(re.match(pattern.replace('*', '.*'), d) for pattern in exclude_patterns)]
-            
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    
-                    # Check if file should be excluded
-                    if any(re.match(pattern.replace('*', '.*'), file) for pattern in exclude_patterns):
-                        continue
-                    
-                    files_analyzed += 1
-                    issues = self.analyze_file(file_path)
-                    all_issues.extend(issues)
+        if jobs > 1 and files_analyzed >= PARALLEL_MIN_FILES:
+            chunksize = max(1, files_analyzed // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                     initargs=(type(self), self.cache_dir)) as executor:
+                results = executor.map(_analyze_file_worker, file_paths, chunksize=chunksize)
+                all_issues = list(chain.from_iterable(results))
+        else:
+            all_issues = []
+            for file_path in file_paths:
+                all_issues.extend(self.analyze_file(file_path))
         
         # Calculate compliance scores
         total_checks = files_analyzed * 10  # Assume 10 checks per file
         issues_count = len(all_issues)
         compliance_score = max(0, (total_checks - issues_count) / total_checks * 100) if total_checks > 0 else 100
         
-        # Calculate framework-specific scores
+        # Calculate framework-specific scores from one count over all issues
         framework_scores = {}
-        frameworks = set(issue.framework for issue in all_issues)
+        framework_checks = files_analyzed * 3  # Assume 3 checks per framework per file
+        framework_counts = Counter(issue.framework for issue in all_issues)
         
-        for framework in frameworks:
-            framework_issues = [issue for issue in all_issues if issue.framework == framework]
-            framework_checks = files_analyzed * 3  # Assume 3 checks per framework per file
-            framework_score = max(0, (framework_checks - len(framework_issues)) / framework_checks * 100) if framework_checks > 0 else 100
+        for framework, framework_issue_count in framework_counts.items():
+            framework_score = max(0, (framework_checks - framework_issue_count) / framework_checks * 100) if framework_checks > 0 else 100
             framework_scores[framework] = framework_score
         
         return ComplianceReport(
@@ -167,315 +464,302 @@ class ComplianceStaticAnalyzer:
             framework_scores=framework_scores
         )
     
-    def _check_gdpr_compliance(self, tree: ast.AST, file_path: str, content: str) -> List[ComplianceIssue]:
-        """Check GDPR compliance requirements."""
-        issues = []
-        lines = content.split('\n')
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Check class attributes for personal data
-                for attr_node in node.body:
-                    if isinstance(attr_node, ast.AnnAssign) and hasattr(attr_node.target, 'id'):
-                        attr_name = attr_node.target.id
-                        
-                        # Check if attribute contains personal data patterns
-                        if any(re.match(pattern, attr_name.lower()) for pattern in self.personal_data_patterns):
-                            # Check if attribute has data classification
-                            if not self._has_data_classification(attr_node, content, "personal"):
-                                issues.append(ComplianceIssue(
-                                    file_path=file_path,
-                                    line_number=attr_node.lineno,
-                                    issue_type="missing_data_classification",
-                                    description=f"Personal data '{attr_name}' in class '{node.name}' is not classified",
-                                    severity="error",
-                                    framework="GDPR",
-                                    recommendation="Add @data_classification('personal') decorator",
-                                    code_snippet=lines[attr_node.lineno - 1] if attr_node.lineno <= len(lines) else None
-                                ))
-            
-            elif isinstance(node, ast.FunctionDef):
-                # Check functions that handle personal data
-                func_name = node.name.lower()
-                if any(pattern in func_name for pattern in ['email', 'name', 'address', 'personal']):
-                    if not self._has_gdpr_decorator(node, content):
+    def _check_gdpr_class(self, node: ast.ClassDef, file_path: str, source: _SourceIndex,
+                          issues: List[ComplianceIssue]) -> None:
+        """Check GDPR requirements for personal data attributes of a class."""
+        for attr_node in node.body:
+            if isinstance(attr_node, ast.AnnAssign) and hasattr(attr_node.target, 'id'):
+                attr_name = attr_node.target.id
+                
+                # Check if attribute contains personal data patterns
+                if self._personal_data_re.search(attr_name.lower()):
+                    # Check if attribute has data classification
+                    if not self._has_data_classification(attr_node, source, "personal"):
                         issues.append(ComplianceIssue(
                             file_path=file_path,
-                            line_number=node.lineno,
-                            issue_type="missing_gdpr_controls",
-                            description=f"Function '{node.name}' handles personal data but lacks GDPR controls",
-                            severity="warning",
+                            line_number=attr_node.lineno,
+                            issue_type="missing_data_classification",
+                            description=f"Personal data '{attr_name}' in class '{node.name}' is not classified",
+                            severity="error",
                             framework="GDPR",
-                            recommendation="Add @data_classification('personal') or @audit_log decorator",
-                            code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else None
+                            recommendation="Add @data_classification('personal') decorator",
+                            code_snippet=source.snippet(attr_node.lineno)
                         ))
-        
-        return issues
     
-    def _check_pci_compliance(self, tree: ast.AST, file_path: str, content: str) -> List[ComplianceIssue]:
-        """Check PCI DSS compliance requirements."""
-        issues = []
-        lines = content.split('\n')
+    def _check_gdpr_function(self, node: ast.FunctionDef, file_path: str, source: _SourceIndex,
+                             issues: List[ComplianceIssue]) -> None:
+        """Check GDPR controls on a function that handles personal data."""
+        func_name = node.name.lower()
+        if any(pattern in func_name for pattern in ['email', 'name', 'address', 'personal']):
+            if not self._has_gdpr_decorator(node, source):
+                issues.append(ComplianceIssue(
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    issue_type="missing_gdpr_controls",
+                    description=f"Function '{node.name}' handles personal data but lacks GDPR controls",
+                    severity="warning",
+                    framework="GDPR",
+                    recommendation="Add @data_classification('personal') or @audit_log decorator",
+                    code_snippet=source.snippet(node.lineno)
+                ))
+    
+    def _check_pci_class(self, node: ast.ClassDef, file_path: str, source: _SourceIndex,
+                         issues: List[ComplianceIssue]) -> None:
+        """Check PCI DSS requirements for a class handling payment data."""
+        class_name = node.name.lower()
+        if any(pattern in class_name for pattern in ['payment', 'card', 'credit']):
+            if not self._has_pci_scope_decorator(node, source):
+                issues.append(ComplianceIssue(
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    issue_type="missing_pci_scope",
+                    description=f"Class '{node.name}' handles payment data but is not marked as PCI scope",
+                    severity="error",
+                    framework="PCI_DSS",
+                    recommendation="Add @pci_scope decorator to class",
+                    code_snippet=source.snippet(node.lineno)
+                ))
         
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Check if class handles payment data
-                class_name = node.name.lower()
-                if any(pattern in class_name for pattern in ['payment', 'card', 'credit']):
-                    if not self._has_pci_scope_decorator(node, content):
+        # Check for card data attributes
+        for attr_node in node.body:
+            if isinstance(attr_node, ast.AnnAssign) and hasattr(attr_node.target, 'id'):
+                attr_name = attr_node.target.id
+                
+                if self._financial_data_re.search(attr_name.lower()):
+                    if not self._has_encryption_decorator(attr_node, source):
                         issues.append(ComplianceIssue(
                             file_path=file_path,
-                            line_number=node.lineno,
-                            issue_type="missing_pci_scope",
-                            description=f"Class '{node.name}' handles payment data but is not marked as PCI scope",
-                            severity="error",
+                            line_number=attr_node.lineno,
+                            issue_type="missing_encryption",
+                            description=f"Payment data '{attr_name}' is not encrypted",
+                            severity="critical",
                             framework="PCI_DSS",
-                            recommendation="Add @pci_scope decorator to class",
-                            code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else None
+                            recommendation="Add @encrypted decorator to sensitive data setters",
+                            code_snippet=source.snippet(attr_node.lineno)
                         ))
-                
-                # Check for card data attributes
-                for attr_node in node.body:
-                    if isinstance(attr_node, ast.AnnAssign) and hasattr(attr_node.target, 'id'):
-                        attr_name = attr_node.target.id
-                        
-                        if any(re.match(pattern, attr_name.lower()) for pattern in self.financial_data_patterns):
-                            if not self._has_encryption_decorator(attr_node, content):
-                                issues.append(ComplianceIssue(
-                                    file_path=file_path,
-                                    line_number=attr_node.lineno,
-                                    issue_type="missing_encryption",
-                                    description=f"Payment data '{attr_name}' is not encrypted",
-                                    severity="critical",
-                                    framework="PCI_DSS",
-                                    recommendation="Add @encrypted decorator to sensitive data setters",
-                                    code_snippet=lines[attr_node.lineno - 1] if attr_node.lineno <= len(lines) else None
-                                ))
-        
-        return issues
     
-    def _check_hipaa_compliance(self, tree: ast.AST, file_path: str, content: str) -> List[ComplianceIssue]:
-        """Check HIPAA compliance requirements."""
-        issues = []
-        lines = content.split('\n')
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Check class attributes for health data
-                for attr_node in node.body:
-                    if isinstance(attr_node, ast.AnnAssign) and hasattr(attr_node.target, 'id'):
-                        attr_name = attr_node.target.id
-                        
-                        if any(re.match(pattern, attr_name.lower()) for pattern in self.health_data_patterns):
-                            if not self._has_data_classification(attr_node, content, "health"):
-                                issues.append(ComplianceIssue(
-                                    file_path=file_path,
-                                    line_number=attr_node.lineno,
-                                    issue_type="missing_health_classification",
-                                    description=f"Health data '{attr_name}' in class '{node.name}' is not classified",
-                                    severity="error",
-                                    framework="HIPAA",
-                                    recommendation="Add @data_classification('health') decorator",
-                                    code_snippet=lines[attr_node.lineno - 1] if attr_node.lineno <= len(lines) else None
-                                ))
-            
-            elif isinstance(node, ast.FunctionDef):
-                # Check functions that handle health data
-                func_name = node.name.lower()
-                if any(pattern in func_name for pattern in ['medical', 'health', 'patient', 'diagnosis']):
-                    if not self._has_audit_decorator(node, content):
+    def _check_hipaa_class(self, node: ast.ClassDef, file_path: str, source: _SourceIndex,
+                           issues: List[ComplianceIssue]) -> None:
+        """Check HIPAA requirements for health data attributes of a class."""
+        for attr_node in node.body:
+            if isinstance(attr_node, ast.AnnAssign) and hasattr(attr_node.target, 'id'):
+                attr_name = attr_node.target.id
+                
+                if self._health_data_re.search(attr_name.lower()):
+                    if not self._has_data_classification(attr_node, source, "health"):
                         issues.append(ComplianceIssue(
                             file_path=file_path,
-                            line_number=node.lineno,
-                            issue_type="missing_audit_log",
-                            description=f"Function '{node.name}' handles health data but is not audit logged",
+                            line_number=attr_node.lineno,
+                            issue_type="missing_health_classification",
+                            description=f"Health data '{attr_name}' in class '{node.name}' is not classified",
                             severity="error",
                             framework="HIPAA",
-                            recommendation="Add @audit_log decorator to function",
-                            code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else None
+                            recommendation="Add @data_classification('health') decorator",
+                            code_snippet=source.snippet(attr_node.lineno)
                         ))
-        
-        return issues
     
-    def _check_general_security(self, tree: ast.AST, file_path: str, content: str) -> List[ComplianceIssue]:
-        """Check general security requirements."""
-        issues = []
-        lines = content.split('\n')
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Check for administrative functions
-                func_name = node.name.lower()
-                if any(admin_pattern in func_name for admin_pattern in ['delete', 'admin', 'config', 'system']):
-                    if not self._has_access_control_decorator(node, content):
+    def _check_hipaa_function(self, node: ast.FunctionDef, file_path: str, source: _SourceIndex,
+                              issues: List[ComplianceIssue]) -> None:
+        """Check HIPAA audit logging on a function that handles health data."""
+        func_name = node.name.lower()
+        if any(pattern in func_name for pattern in ['medical', 'health', 'patient', 'diagnosis']):
+            if not self._has_audit_decorator(node, source):
+                issues.append(ComplianceIssue(
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    issue_type="missing_audit_log",
+                    description=f"Function '{node.name}' handles health data but is not audit logged",
+                    severity="error",
+                    framework="HIPAA",
+                    recommendation="Add @audit_log decorator to function",
+                    code_snippet=source.snippet(node.lineno)
+                ))
+    
+    def _check_admin_function(self, node: ast.FunctionDef, file_path: str, source: _SourceIndex,
+                              issues: List[ComplianceIssue]) -> None:
+        """Check access control on an administrative function."""
+        func_name = node.name.lower()
+        if any(admin_pattern in func_name for admin_pattern in ['delete', 'admin', 'config', 'system']):
+            if not self._has_access_control_decorator(node, source):
+                issues.append(ComplianceIssue(
+                    file_path=file_path,
+                    line_number=node.lineno,
+                    issue_type="missing_access_control",
+                    description=f"Administrative function '{node.name}' lacks access control",
+                    severity="warning",
+                    framework="SOC2",
+                    recommendation="Add @access_control(['admin']) decorator",
+                    code_snippet=source.snippet(node.lineno)
+                ))
+    
+    def _check_hardcoded_secret(self, node: ast.Assign, file_path: str, source: _SourceIndex,
+                                issues: List[ComplianceIssue]) -> None:
+        """Check an assignment for a hardcoded secret."""
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                var_name = target.id.lower()
+                if any(secret_pattern in var_name for secret_pattern in ['password', 'secret', 'key', 'token']):
+                    if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
                         issues.append(ComplianceIssue(
                             file_path=file_path,
                             line_number=node.lineno,
-                            issue_type="missing_access_control",
-                            description=f"Administrative function '{node.name}' lacks access control",
-                            severity="warning",
-                            framework="SOC2",
-                            recommendation="Add @access_control(['admin']) decorator",
-                            code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else None
+                            issue_type="hardcoded_secret",
+                            description=f"Hardcoded secret detected in variable '{target.id}'",
+                            severity="critical",
+                            framework="GENERAL",
+                            recommendation="Move secrets to environment variables or secure storage",
+                            code_snippet=source.snippet(node.lineno)
                         ))
-            
-            # Check for hardcoded secrets
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if isinstance(target, ast.Name):
-                        var_name = target.id.lower()
-                        if any(secret_pattern in var_name for secret_pattern in ['password', 'secret', 'key', 'token']):
-                            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
-                                issues.append(ComplianceIssue(
-                                    file_path=file_path,
-                                    line_number=node.lineno,
-                                    issue_type="hardcoded_secret",
-                                    description=f"Hardcoded secret detected in variable '{target.id}'",
-                                    severity="critical",
-                                    framework="GENERAL",
-                                    recommendation="Move secrets to environment variables or secure storage",
-                                    code_snippet=lines[node.lineno - 1] if node.lineno <= len(lines) else None
-                                ))
-        
-        return issues
     
-    def _has_data_classification(self, node: ast.AST, content: str, classification: str) -> bool:
+    def _has_data_classification(self, node: ast.AST, source: _SourceIndex, classification: str) -> bool:
         """Check if a node has data classification decorator."""
         # Look for @data_classification decorator in surrounding context
         # This is a simplified check - in practice, you'd need more sophisticated AST analysis
-        context_lines = self._get_context_lines(node, content, 5)
-        pattern = rf"@data_classification\(['\"]?{classification}['\"]?\)"
-        return any(re.search(pattern, line) for line in context_lines)
+        return source.has_nearby(_classification_re(classification), node.lineno, 5)
     
-    def _has_encryption_decorator(self, node: ast.AST, content: str) -> bool:
+    def _has_encryption_decorator(self, node: ast.AST, source: _SourceIndex) -> bool:
         """Check if a node has encryption decorator."""
-        context_lines = self._get_context_lines(node, content, 10)
-        return any('@encrypted' in line for line in context_lines)
+        return source.has_nearby(b'@encrypted', node.lineno, 10)
     
-    def _has_audit_decorator(self, node: ast.AST, content: str) -> bool:
+    def _has_audit_decorator(self, node: ast.AST, source: _SourceIndex) -> bool:
         """Check if a node has audit log decorator."""
-        context_lines = self._get_context_lines(node, content, 5)
-        return any('@audit_log' in line for line in context_lines)
+        return source.has_nearby(b'@audit_log', node.lineno, 5)
     
-    def _has_access_control_decorator(self, node: ast.AST, content: str) -> bool:
+    def _has_access_control_decorator(self, node: ast.AST, source: _SourceIndex) -> bool:
         """Check if a node has access control decorator."""
-        context_lines = self._get_context_lines(node, content, 5)
-        return any('@access_control' in line for line in context_lines)
+        return source.has_nearby(b'@access_control', node.lineno, 5)
     
-    def _has_pci_scope_decorator(self, node: ast.AST, content: str) -> bool:
+    def _has_pci_scope_decorator(self, node: ast.AST, source: _SourceIndex) -> bool:
         """Check if a class has PCI scope decorator."""
-        context_lines = self._get_context_lines(node, content, 5)
-        return any('@pci_scope' in line for line in context_lines)
+        return source.has_nearby(b'@pci_scope', node.lineno, 5)
     
-    def _has_gdpr_decorator(self, node: ast.AST, content: str) -> bool:
+    def _has_gdpr_decorator(self, node: ast.AST, source: _SourceIndex) -> bool:
         """Check if a node has GDPR-related decorators."""
-        context_lines = self._get_context_lines(node, content, 5)
-        gdpr_decorators = ['@data_classification', '@audit_log']
-        return any(decorator in line for line in context_lines for decorator in gdpr_decorators)
-    
-    def _get_context_lines(self, node: ast.AST, content: str, context_size: int = 5) -> List[str]:
-        """Get lines around a node for context analysis."""
-        lines = content.split('\n')
-        start_line = max(0, node.lineno - context_size - 1)
-        end_line = min(len(lines), node.lineno + context_size)
-        return lines[start_line:end_line]
+        return (source.has_nearby(b'@data_classification', node.lineno, 5)
+                or source.has_nearby(b'@audit_log', node.lineno, 5))
 
 
-def generate_compliance_report_html(report: ComplianceReport, output_path: str) -> None:
-    """
-    Generate an HTML compliance report.
+_HTML_REPORT_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>CloudScope Compliance Report</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; }}
+        .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
+        .summary {{ display: flex; justify-content: space-around; margin: 20px 0; }}
+        .metric {{ text-align: center; padding: 10px; border: 1px solid #ddd; border-radius: 5px; }}
+        .issues {{ margin-top: 20px; }}
+        .issue {{ margin: 10px 0; padding: 15px; border-left: 4px solid; }}
+        .critical {{ border-left-color: #d32f2f; background-color: #ffebee; }}
+        .error {{ border-left-color: #f57c00; background-color: #fff3e0; }}
+        .warning {{ border-left-color: #fbc02d; background-color: #fffde7; }}
+        .info {{ border-left-color: #1976d2; background-color: #e3f2fd; }}
+        .code {{ background-color: #f5f5f5; padding: 5px; border-radius: 3px; font-family: monospace; }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>CloudScope Compliance Report</h1>
+        <p>Generated on: {timestamp}</p>
+    </div>
     
-    Args:
-        report: ComplianceReport to generate HTML for
-        output_path: Path to save HTML report
-    """
-    html_template = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>CloudScope Compliance Report</title>
-        <style>
-            body { font-family: Arial, sans-serif; margin: 20px; }
-            .header { background-color: #f0f0f0; padding: 20px; border-radius: 5px; }
-            .summary { display: flex; justify-content: space-around; margin: 20px 0; }
-            .metric { text-align: center; padding: 10px; border: 1px solid #ddd; border-radius: 5px; }
-            .issues { margin-top: 20px; }
-            .issue { margin: 10px 0; padding: 15px; border-left: 4px solid; }
-            .critical { border-left-color: #d32f2f; background-color: #ffebee; }
-            .error { border-left-color: #f57c00; background-color: #fff3e0; }
-            .warning { border-left-color: #fbc02d; background-color: #fffde7; }
-            .info { border-left-color: #1976d2; background-color: #e3f2fd; }
-            .code { background-color: #f5f5f5; padding: 5px; border-radius: 3px; font-family: monospace; }
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>CloudScope Compliance Report</h1>
-            <p>Generated on: {timestamp}</p>
-        </div>
-        
-        <div class="summary">
-            <div class="metric">
-                <h3>Overall Score</h3>
-                <h2>{compliance_score:.1f}%</h2>
-            </div>
-            <div class="metric">
-                <h3>Files Analyzed</h3>
-                <h2>{files_analyzed}</h2>
-            </div>
-            <div class="metric">
-                <h3>Issues Found</h3>
-                <h2>{total_issues}</h2>
-            </div>
+    <div class="summary">
+        <div class="metric">
+            <h3>Overall Score</h3>
+            <h2>{compliance_score:.1f}%</h2>
         </div>
-        
-        <div class="framework-scores">
-            <h2>Framework Scores</h2>
-            {framework_scores_html}
+        <div class="metric">
+            <h3>Files Analyzed</h3>
+            <h2>{files_analyzed}</h2>
         </div>
-        
-        <div class="issues">
-            <h2>Issues Found</h2>
-            {issues_html}
+        <div class="metric">
+            <h3>Issues Found</h3>
+            <h2>{total_issues}</h2>
         </div>
-    </body>
-    </html>
-    """
+    </div>
     
-    # Generate framework scores HTML
-    framework_scores_html = ""
-    for framework, score in report.framework_scores.items():
-        framework_scores_html += f"""
+    <div class="framework-scores">
+        <h2>Framework Scores</h2>
+        {framework_scores_html}
+    </div>
+    
+    <div class="issues">
+        <h2>Issues Found</h2>
+        {issues_html}
+    </div>
+</body>
+</html>
+"""
+
+_FRAMEWORK_SCORE_TEMPLATE = """
         <div class="metric">
             <h4>{framework}</h4>
             <p>{score:.1f}%</p>
         </div>
         """
-    
-    # Generate issues HTML
-    issues_html = ""
-    for issue in report.issues_found:
-        severity_class = issue.severity.lower()
-        code_snippet = f'<div class="code">{issue.code_snippet}</div>' if issue.code_snippet else ''
-        
-        issues_html += f"""
+
+_ISSUE_TEMPLATE = """
         <div class="issue {severity_class}">
-            <h4>{issue.issue_type} ({issue.severity.upper()})</h4>
-            <p><strong>File:</strong> {issue.file_path}:{issue.line_number}</p>
-            <p><strong>Framework:</strong> {issue.framework}</p>
-            <p><strong>Description:</strong> {issue.description}</p>
-            <p><strong>Recommendation:</strong> {issue.recommendation}</p>
+            <h4>{issue_type} ({severity})</h4>
+            <p><strong>File:</strong> {file_path}:{line_number}</p>
+            <p><strong>Framework:</strong> {framework}</p>
+            <p><strong>Description:</strong> {description}</p>
+            <p><strong>Recommendation:</strong> {recommendation}</p>
             {code_snippet}
         </div>
         """
+
+
+def generate_compliance_report_html(report: ComplianceReport, output_path: str) -> None:
+    """
+    Generate an HTML compliance report.
+    
+    Args:
+        report: ComplianceReport to generate HTML for
+        output_path: Path to save HTML report
+    """
+    # Generate framework scores HTML
+    framework_scores_html = ''.join(
+        _FRAMEWORK_SCORE_TEMPLATE.format(framework=escape(framework), score=score)
+        for framework, score in report.framework_scores.items()
+    )
+    
+    # Generate issues HTML. Paths, issue types and recommendations repeat
+    # across issues, so each distinct value is escaped only once.
+    escaped: Dict[str, str] = {}
+    
+    def escape_once(value: str) -> str:
+        try:
+            return escaped[value]
+        except KeyError:
+            result = escaped[value] = escape(value)
+            return result
+    
+    render_issue = _ISSUE_TEMPLATE.format_map
+    issues_parts = []
+    for issue in report.issues_found:
+        severity = issue.severity
+        code_snippet = issue.code_snippet
+        issues_parts.append(render_issue({
+            'severity_class': escape_once(severity.lower()),
+            'issue_type': escape_once(issue.issue_type),
+            'severity': escape_once(severity.upper()),
+            'file_path': escape_once(issue.file_path),
+            'line_number': issue.line_number,
+            'framework': escape_once(issue.framework),
+            'description': escape_once(issue.description),
+            'recommendation': escape_once(issue.recommendation),
+            'code_snippet': f'<div class="code">{escape(code_snippet)}</div>' if code_snippet else '',
+        }))
     
-    html_content = html_template.format(
+    html_content = _HTML_REPORT_TEMPLATE.format(
         timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         compliance_score=report.compliance_score,
         files_analyzed=report.total_files_analyzed,
         total_issues=len(report.issues_found),
         framework_scores_html=framework_scores_html,
-        issues_html=issues_html
+        issues_html=''.join(issues_parts)
     )
     
     with open(output_path, 'w', encoding='utf-8') as f:
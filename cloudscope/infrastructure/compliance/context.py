@@ -5,12 +5,14 @@ This module provides context management for compliance operations,
 including user context and compliance settings.
 """
 
-import threading
+from contextvars import ContextVar, Token
 from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+from cloudscope._util import DATACLASS_OPTIONS
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class User:
     """Simple user model for compliance context."""
     id: str
@@ -19,69 +21,96 @@ class User:
     name: Optional[str] = None
 
 
-@dataclass 
+@dataclass(**DATACLASS_OPTIONS)
 class ComplianceContext:
     """Compliance context for operations."""
     gdpr_lawful_basis: Optional[str] = None
     hipaa_minimum_necessary: bool = False
     pci_authorized_access: bool = False
-    framework_specific: Dict[str, Any] = None
-    
-    def __post_init__(self):
-        if self.framework_specific is None:
-            self.framework_specific = {}
+    framework_specific: Dict[str, Any] = field(default_factory=dict)
 
 
-# Thread-local storage for context
-_context = threading.local()
+# Context-local storage, isolated per thread and per asyncio task
+_current_user: ContextVar[Optional[User]] = ContextVar('current_user', default=None)
+_compliance_context: ContextVar[Optional[ComplianceContext]] = ContextVar(
+    'compliance_context', default=None
+)
 
 
-def set_current_user(user: Optional[User]) -> None:
+def set_current_user(user: Optional[User]) -> Token:
     """
-    Set the current user in thread-local context.
+    Set the current user in the current context.
     
     Args:
         user: User object or None to clear context
+    
+    Returns:
+        Token for restoring the previous user with reset_current_user
+    """
+    return _current_user.set(user)
+
+
+def reset_current_user(token: Token) -> None:
+    """
+    Restore the user that was current before set_current_user returned token.
+    
+    Args:
+        token: Token returned by set_current_user
     """
-    _context.current_user = user
+    _current_user.reset(token)
 
 
 def get_current_user() -> Optional[User]:
     """
-    Get the current user from thread-local context.
+    Get the current user from the current context.
     
     Returns:
         Current user or None if not set
     """
-    return getattr(_context, 'current_user', None)
+    return _current_user.get()
 
 
-def set_compliance_context(context: ComplianceContext) -> None:
+def set_compliance_context(context: ComplianceContext) -> Token:
     """
-    Set the compliance context in thread-local storage.
+    Set the compliance context for the current context.
     
     Args:
         context: ComplianceContext object
+    
+    Returns:
+        Token for restoring the previous context with reset_compliance_context
     """
-    _context.compliance_context = context
+    return _compliance_context.set(context)
+
+
+def reset_compliance_context(token: Token) -> None:
+    """
+    Restore the compliance context that was set before token was issued.
+    
+    Args:
+        token: Token returned by set_compliance_context
+    """
+    _compliance_context.reset(token)
 
 
 def get_compliance_context() -> ComplianceContext:
     """
-    Get the compliance context from thread-local storage.
+    Get the compliance context for the current context.
     
     Returns:
         ComplianceContext object (creates default if not set)
     """
-    if not hasattr(_context, 'compliance_context'):
-        _context.compliance_context = ComplianceContext()
-    return _context.compliance_context
+    context = _compliance_context.get()
+    if context is None:
+        context = ComplianceContext()
+        _compliance_context.set(context)
+    return context
 
 
 def clear_context() -> None:
-    """Clear all context from thread-local storage."""
-    _context.current_user = None
-    _context.compliance_context = ComplianceContext()
+    """Clear all compliance state from the current context."""
+    _current_user.set(None)
+    _compliance_context.set(ComplianceContext())
 
 
 # Context managers for compliance operations
@@ -89,38 +118,42 @@ def clear_context() -> None:
 class user_context:
     """Context manager for setting user context."""
     
+    __slots__ = ('user', '_token')
+    
     def __init__(self, user: User):
         self.user = user
-        self.previous_user = None
+        self._token = None
     
     def __enter__(self):
-        self.previous_user = get_current_user()
-        set_current_user(self.user)
+        self._token = _current_user.set(self.user)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        set_current_user(self.previous_user)
+        _current_user.reset(self._token)
 
 
 class compliance_context:
     """Context manager for setting compliance context."""
     
+    __slots__ = ('context', '_token')
+    
     def __init__(self, **kwargs):
         self.context = ComplianceContext(**kwargs)
-        self.previous_context = None
+        self._token = None
     
     def __enter__(self):
-        self.previous_context = get_compliance_context()
-        set_compliance_context(self.context)
+        self._token = _compliance_context.set(self.context)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        set_compliance_context(self.previous_context)
+        _compliance_context.reset(self._token)
 
 
 class gdpr_context(compliance_context):
     """Context manager specifically for GDPR operations."""
     
+    __slots__ = ()
+    
     def __init__(self, lawful_basis: str):
         super().__init__(gdpr_lawful_basis=lawful_basis)
 
@@ -128,6 +161,8 @@ class gdpr_context(compliance_context):
 class hipaa_context(compliance_context):
     """Context manager specifically for HIPAA operations."""
     
+    __slots__ = ()
+    
     def __init__(self, minimum_necessary: bool = True):
         super().__init__(hipaa_minimum_necessary=minimum_necessary)
 
@@ -135,5 +170,7 @@ class hipaa_context(compliance_context):
 class pci_context(compliance_context):
     """Context manager specifically for PCI DSS operations."""
     
+    __slots__ = ()
+    
     def __init__(self, authorized_access: bool = True):
         super().__init__(pci_authorized_access=authorized_access)
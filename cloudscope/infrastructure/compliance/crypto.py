@@ -6,18 +6,36 @@ for sensitive data in compliance with various frameworks.
 """
 
 import os
+import re
 import base64
 import hashlib
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import Iterable, List, Optional
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.ciphers.aead import AESSIV
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from .exceptions import EncryptionError
 
 
 # Global encryption key cache (in production, use proper key management)
 _encryption_key_cache: Optional[bytes] = None
+_encryption_key_lock = threading.Lock()
+
+# Fernet tokens start with the version byte 0x80, which base64-encodes to 'g'
+_FERNET_TOKEN_PREFIX = b'g'
+
+# URL-safe base64 starting with a Fernet version byte, bare ('g') or inside
+# the extra base64 layer written by earlier versions ('Z0FB' encodes 'gAA')
+_ENCRYPTED_VALUE_RE = re.compile(r'(?:g|Z0FB)[A-Za-z0-9_-]*={0,2}')
+
+# HKDF label separating the AES-SIV key from the Fernet signing and encryption keys
+_SIV_KEY_INFO = b'cloudscope-deterministic-aes-siv'
+
+# FIPS deployments must stay on SHA-256, so hash_value_fast defers to hash_value
+_FIPS_MODE = os.getenv('CLOUDSCOPE_FIPS_MODE', '').lower() in ('1', 'true', 'yes')
 
 
 def get_encryption_key() -> bytes:
@@ -35,33 +53,39 @@ def get_encryption_key() -> bytes:
     """
     global _encryption_key_cache
     
-    if _encryption_key_cache is not None:
-        return _encryption_key_cache
+    key = _encryption_key_cache
+    if key is not None:
+        return key
     
-    try:
-        # Try to get key from environment variable
-        key_string = os.getenv('CLOUDSCOPE_ENCRYPTION_KEY')
-        
-        if key_string:
-            # Decode base64 key from environment
-            _encryption_key_cache = base64.urlsafe_b64decode(key_string)
-        else:
-            # Generate a new key (not recommended for production)
-            # In production, keys should be managed externally
-            _encryption_key_cache = Fernet.generate_key()
-            
-            # Log warning about key generation
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(
-                "Generated new encryption key - this should not happen in production. "
-                "Set CLOUDSCOPE_ENCRYPTION_KEY environment variable."
-            )
-        
-        return _encryption_key_cache
+    # Only the first caller loads the key; concurrent first calls wait for it
+    with _encryption_key_lock:
+        if _encryption_key_cache is not None:
+            return _encryption_key_cache
         
-    except Exception as e:
-        raise EncryptionError(f"Failed to retrieve encryption key: {str(e)}")
+        try:
+            # Try to get key from environment variable
+            key_string = os.getenv('CLOUDSCOPE_ENCRYPTION_KEY')
+            
+            if key_string:
+                # Decode base64 key from environment
+                _encryption_key_cache = base64.urlsafe_b64decode(key_string)
+            else:
+                # Generate a new key (not recommended for production)
+                # In production, keys should be managed externally
+                _encryption_key_cache = Fernet.generate_key()
+                
+                # Log warning about key generation
+                import logging
+                logger = logging.getLogger(__name__)
+                logger.warning(
+                    "Generated new encryption key - this should not happen in production. "
+                    "Set CLOUDSCOPE_ENCRYPTION_KEY environment variable."
+                )
+            
+            return _encryption_key_cache
+            
+        except Exception as e:
+            raise EncryptionError(f"Failed to retrieve encryption key: {str(e)}")
 
 
 def derive_key_from_password(password: str, salt: Optional[bytes] = None) -> tuple[bytes, bytes]:
@@ -78,17 +102,16 @@ def derive_key_from_password(password: str, salt: Optional[bytes] = None) -> tup
     if salt is None:
         salt = os.urandom(16)
     
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=100000,
-    )
-    
-    key = kdf.derive(password.encode())
+    key = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100000, dklen=32)
     return key, salt
 
 
+@lru_cache(maxsize=16)
+def _get_cipher(key: bytes) -> Fernet:
+    """Return a Fernet cipher for key, built once per key."""
+    return Fernet(key)
+
+
 def encrypt_value(value: str, key: Optional[bytes] = None) -> str:
     """
     Encrypt a string value.
@@ -98,7 +121,7 @@ def encrypt_value(value: str, key: Optional[bytes] = None) -> str:
         key: Encryption key (uses default if None)
         
     Returns:
-        Base64-encoded encrypted value
+        Fernet token, which is already URL-safe base64
         
     Raises:
         EncryptionError: If encryption fails
@@ -107,11 +130,7 @@ def encrypt_value(value: str, key: Optional[bytes] = None) -> str:
         if key is None:
             key = get_encryption_key()
         
-        cipher_suite = Fernet(key)
-        encrypted_value = cipher_suite.encrypt(value.encode())
-        
-        # Return base64-encoded string for easy storage
-        return base64.urlsafe_b64encode(encrypted_value).decode()
+        return _get_cipher(key).encrypt(value.encode()).decode('ascii')
         
     except Exception as e:
         raise EncryptionError(f"Failed to encrypt value: {str(e)}")
@@ -122,7 +141,8 @@ def decrypt_value(encrypted_value: str, key: Optional[bytes] = None) -> str:
     Decrypt a string value.
     
     Args:
-        encrypted_value: Base64-encoded encrypted value
+        encrypted_value: Fernet token, or a token with an extra base64 layer
+            as produced by earlier versions
         key: Encryption key (uses default if None)
         
     Returns:
@@ -135,13 +155,85 @@ def decrypt_value(encrypted_value: str, key: Optional[bytes] = None) -> str:
         if key is None:
             key = get_encryption_key()
         
-        cipher_suite = Fernet(key)
+        token = encrypted_value.encode('ascii')
+        if not token.startswith(_FERNET_TOKEN_PREFIX):
+            # Values encrypted before the extra base64 layer was dropped
+            token = base64.urlsafe_b64decode(token)
+        
+        return _get_cipher(key).decrypt(token).decode()
+        
+    except Exception as e:
+        raise EncryptionError(f"Failed to decrypt value: {str(e)}")
+
+
+@lru_cache(maxsize=16)
+def _get_siv_cipher(key: bytes) -> AESSIV:
+    """Return an AES-SIV cipher for a Fernet key, built once per key."""
+    # Fernet already uses both halves of its key, so AES-SIV gets a derived one
+    siv_key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=_SIV_KEY_INFO,
+    ).derive(base64.urlsafe_b64decode(key))
+    return AESSIV(siv_key)
+
+
+@lru_cache(maxsize=1024)
+def _encrypt_deterministic(value: str, key: bytes) -> str:
+    """Encrypt value with AES-SIV; the result depends only on value and key."""
+    token = _get_siv_cipher(key).encrypt(value.encode(), None)
+    return base64.urlsafe_b64encode(token).decode('ascii')
+
+
+def encrypt_value_deterministic(value: str, key: Optional[bytes] = None) -> str:
+    """
+    Encrypt a string value so that equal values give equal ciphertexts.
+    
+    Equal ciphertexts reveal equal plaintexts, so use this only for stable
+    identifiers that must be matched or looked up while encrypted, and
+    encrypt_value for everything else. Results are cached per value and key.
+    
+    Args:
+        value: String value to encrypt
+        key: Encryption key (uses default if None)
+        
+    Returns:
+        URL-safe base64 encoded AES-SIV ciphertext
+        
+    Raises:
+        EncryptionError: If encryption fails
+    """
+    try:
+        if key is None:
+            key = get_encryption_key()
+        
+        return _encrypt_deterministic(value, key)
+        
+    except Exception as e:
+        raise EncryptionError(f"Failed to encrypt value: {str(e)}")
+
+
+def decrypt_value_deterministic(encrypted_value: str, key: Optional[bytes] = None) -> str:
+    """
+    Decrypt a value encrypted with encrypt_value_deterministic.
+    
+    Args:
+        encrypted_value: URL-safe base64 encoded AES-SIV ciphertext
+        key: Encryption key (uses default if None)
+        
+    Returns:
+        Decrypted string value
         
-        # Decode base64 and decrypt
-        encrypted_bytes = base64.urlsafe_b64decode(encrypted_value.encode())
-        decrypted_value = cipher_suite.decrypt(encrypted_bytes)
+    Raises:
+        EncryptionError: If decryption fails
+    """
+    try:
+        if key is None:
+            key = get_encryption_key()
         
-        return decrypted_value.decode()
+        token = base64.urlsafe_b64decode(encrypted_value.encode('ascii'))
+        return _get_siv_cipher(key).decrypt(token, None).decode()
         
     except Exception as e:
         raise EncryptionError(f"Failed to decrypt value: {str(e)}")
@@ -169,6 +261,50 @@ def hash_value(value: str, salt: Optional[str] = None) -> str:
     return hash_object.hexdigest()
 
 
+def hash_value_batch(values: Iterable[str], salt: Optional[str] = None) -> List[str]:
+    """
+    Hash many values, as hash_value does for one.
+    
+    Args:
+        values: Values to hash
+        salt: Salt shared by every value (generates a new one per value if None)
+        
+    Returns:
+        Hexadecimal hash strings in input order
+    """
+    if salt is None:
+        return [hash_value(value) for value in values]
+    
+    # The salt is appended to each value, so encode it once
+    salt_bytes = salt.encode()
+    sha256 = hashlib.sha256
+    return [sha256(value.encode() + salt_bytes).hexdigest() for value in values]
+
+
+def hash_value_fast(value: str, salt: Optional[str] = None) -> str:
+    """
+    Create a hash of a value with BLAKE2b, for bulk fingerprinting.
+    
+    Hashes differ from hash_value for the same value and salt. When
+    CLOUDSCOPE_FIPS_MODE is set this is the same as hash_value.
+    
+    Args:
+        value: Value to hash
+        salt: Salt for hashing, at most 64 bytes (generates new if None)
+        
+    Returns:
+        Hexadecimal hash string
+    """
+    if _FIPS_MODE:
+        return hash_value(value, salt)
+    
+    if salt is None:
+        salt = os.urandom(16).hex()
+    
+    # BLAKE2b is keyed natively, so the salt is not concatenated to the value
+    return hashlib.blake2b(value.encode(), key=salt.encode(), digest_size=32).hexdigest()
+
+
 def generate_key_string() -> str:
     """
     Generate a new base64-encoded encryption key string.
@@ -183,6 +319,15 @@ def generate_key_string() -> str:
     return base64.urlsafe_b64encode(key).decode()
 
 
+# Masks up to this length are sliced from one shared string
+_MASK = "*" * 4096
+
+
+def _mask(length: int) -> str:
+    """Return a mask of length asterisks."""
+    return _MASK[:length] if length <= 4096 else "*" * length
+
+
 def mask_sensitive_data(value: str, visible_chars: int = 4) -> str:
     """
     Mask sensitive data for display purposes.
@@ -194,11 +339,35 @@ def mask_sensitive_data(value: str, visible_chars: int = 4) -> str:
     Returns:
         Masked string
     """
-    if len(value) <= visible_chars:
-        return "*" * len(value)
+    length = len(value)
+    if length <= visible_chars:
+        return _mask(length)
     
-    mask_length = len(value) - visible_chars
-    return "*" * mask_length + value[-visible_chars:]
+    mask_length = length - visible_chars
+    return _mask(mask_length) + value[mask_length:]
+
+
+def mask_sensitive_data_batch(values: Iterable[str], visible_chars: int = 4) -> List[str]:
+    """
+    Mask many values for display, as mask_sensitive_data does for one.
+    
+    Args:
+        values: Values to mask
+        visible_chars: Number of characters to show at end of each value
+        
+    Returns:
+        Masked strings in input order
+    """
+    values = list(values)
+    
+    # One mask long enough for every value, sliced inline without a call per value
+    longest = max(map(len, values), default=0)
+    mask = _MASK if longest <= len(_MASK) else "*" * longest
+    return [
+        mask[:len(value)] if len(value) <= visible_chars
+        else mask[:len(value) - visible_chars] + value[len(value) - visible_chars:]
+        for value in values
+    ]
 
 
 def is_encrypted_value(value: str) -> bool:
@@ -211,13 +380,11 @@ def is_encrypted_value(value: str) -> bool:
     Returns:
         True if value appears to be encrypted
     """
-    try:
-        # Try to decode as base64
-        decoded = base64.urlsafe_b64decode(value.encode())
-        
-        # Check if it's the right length for Fernet tokens
-        # Fernet tokens are typically 60+ bytes
-        return len(decoded) >= 60
-        
-    except Exception:
-        return False
+    # Tokens are at least 60 bytes, so 80 base64 characters, and start with
+    # the Fernet version byte, either directly or under the legacy extra
+    # base64 layer. Checking the text avoids decoding the whole value.
+    return (
+        len(value) >= 80
+        and len(value) % 4 == 0
+        and _ENCRYPTED_VALUE_RE.fullmatch(value) is not None
+    )
@@ -5,11 +5,14 @@ This module provides decorators that enforce compliance requirements directly
 in the code, supporting frameworks like GDPR, PCI DSS, HIPAA, and SOC 2.
 """
 
+import itertools
 import logging
-from datetime import datetime
+import queue
+import time
 from functools import wraps
 from typing import List, Any, Callable, Optional
 from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
 
 from .exceptions import UnauthorizedError, ForbiddenError, EncryptionError
 from .context import get_current_user, get_compliance_context
@@ -19,6 +22,84 @@ from .crypto import encrypt_value, decrypt_value, get_encryption_key
 logger = logging.getLogger(__name__)
 audit_logger = logging.getLogger("cloudscope.audit")
 
+# Sequence numbers for audit_log operation ids. next() on a count is atomic
+# under the GIL, so ids are unique within a process; log records carry the
+# process id to tell processes apart.
+_operation_ids = itertools.count(1)
+
+# Background delivery of audit records, see start_audit_log_listener
+_audit_listener: Optional[QueueListener] = None
+_audit_queue_handler: Optional[QueueHandler] = None
+
+
+# Second of the last audit timestamp and its formatted value
+_timestamp_cache = (0, '')
+
+
+def _audit_timestamp() -> str:
+    """Return the local time to the second in ISO format, formatted once per second."""
+    global _timestamp_cache
+    
+    now = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != now:
+        # The tuple is replaced in one assignment, so threads never see a
+        # second paired with another second's text
+        cached = _timestamp_cache = (now, time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(now)))
+    return cached[1]
+
+
+def start_audit_log_listener(*handlers: logging.Handler) -> QueueListener:
+    """
+    Deliver audit log records from a background thread.
+    
+    The decorators then only enqueue records, so slow audit sinks no longer
+    hold up the decorated calls. Records go to the given handlers, or to the
+    handlers currently attached to the audit logger, which are detached
+    until stop_audit_log_listener is called.
+    
+    Args:
+        handlers: Handlers to deliver audit records to
+    
+    Returns:
+        The running QueueListener
+    """
+    global _audit_listener, _audit_queue_handler
+    
+    if _audit_listener is not None:
+        return _audit_listener
+    
+    if not handlers:
+        handlers = tuple(audit_logger.handlers)
+        if not handlers:
+            raise ValueError("No handlers to deliver audit log records to")
+    
+    for handler in handlers:
+        audit_logger.removeHandler(handler)
+    
+    log_queue = queue.SimpleQueue()
+    _audit_queue_handler = QueueHandler(log_queue)
+    audit_logger.addHandler(_audit_queue_handler)
+    _audit_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _audit_listener.start()
+    return _audit_listener
+
+
+def stop_audit_log_listener() -> None:
+    """Deliver any queued audit records and log synchronously again."""
+    global _audit_listener, _audit_queue_handler
+    
+    if _audit_listener is None:
+        return
+    
+    audit_logger.removeHandler(_audit_queue_handler)
+    _audit_listener.stop()
+    for handler in _audit_listener.handlers:
+        audit_logger.addHandler(handler)
+    
+    _audit_listener = None
+    _audit_queue_handler = None
+
 
 def data_classification(classification_type: str):
     """
@@ -36,7 +117,12 @@ def data_classification(classification_type: str):
         def update_user_email(self, email: str):
             self.email = email
     """
+    apply_controls = _CLASSIFICATION_CONTROLS.get(classification_type)
+    
     def decorator(func: Callable) -> Callable:
+        func_name = func.__name__
+        func_module = func.__module__
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Get current context
@@ -44,40 +130,38 @@ def data_classification(classification_type: str):
             compliance_context = get_compliance_context()
             
             # Log access to classified data
-            logger.info(
-                f"Accessing {classification_type} data: {func.__name__}",
-                extra={
-                    "classification": classification_type,
-                    "function": func.__name__,
-                    "user_id": current_user.id if current_user else "system",
-                    "timestamp": datetime.now().isoformat(),
-                    "module": func.__module__,
-                    "class": args[0].__class__.__name__ if args else None,
-                }
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    f"Accessing {classification_type} data: {func_name}",
+                    extra={
+                        "classification": classification_type,
+                        "function": func_name,
+                        "user_id": current_user.id if current_user else "system",
+                        "timestamp": _audit_timestamp(),
+                        "function_module": func_module,
+                        "class": args[0].__class__.__name__ if args else None,
+                    }
+                )
             
             # Apply classification-specific controls
-            if classification_type == "personal":
-                _apply_gdpr_controls(func, args, kwargs, current_user)
-            elif classification_type == "health": 
-                _apply_hipaa_controls(func, args, kwargs, current_user)
-            elif classification_type == "financial":
-                _apply_pci_controls(func, args, kwargs, current_user)
+            if apply_controls is not None:
+                apply_controls(func, args, kwargs, current_user, compliance_context)
             
             # Execute function
             result = func(*args, **kwargs)
             
             # Log successful access
-            audit_logger.info(
-                f"Data classification access completed: {classification_type}",
-                extra={
-                    "classification": classification_type,
-                    "function": func.__name__,
-                    "user_id": current_user.id if current_user else "system",
-                    "timestamp": datetime.now().isoformat(),
-                    "status": "success"
-                }
-            )
+            if audit_logger.isEnabledFor(logging.INFO):
+                audit_logger.info(
+                    f"Data classification access completed: {classification_type}",
+                    extra={
+                        "classification": classification_type,
+                        "function": func_name,
+                        "user_id": current_user.id if current_user else "system",
+                        "timestamp": _audit_timestamp(),
+                        "status": "success"
+                    }
+                )
             
             return result
         
@@ -101,6 +185,8 @@ def encrypted(func: Callable) -> Callable:
         def set_card_number(self, card_number: str):
             self._card_number = card_number
     """
+    func_name = func.__name__
+    
     @wraps(func)
     def wrapper(self, value, *args, **kwargs):
         current_user = get_current_user()
@@ -113,33 +199,35 @@ def encrypted(func: Callable) -> Callable:
             encrypted_value = encrypt_value(value, encryption_key)
             
             # Log encryption operation
-            audit_logger.info(
-                f"Data encrypted: {func.__name__}",
-                extra={
-                    "function": func.__name__,
-                    "user_id": current_user.id if current_user else "system",
-                    "timestamp": datetime.now().isoformat(),
-                    "data_type": "encrypted",
-                    "status": "success"
-                }
-            )
+            if audit_logger.isEnabledFor(logging.INFO):
+                audit_logger.info(
+                    f"Data encrypted: {func_name}",
+                    extra={
+                        "function": func_name,
+                        "user_id": current_user.id if current_user else "system",
+                        "timestamp": _audit_timestamp(),
+                        "data_type": "encrypted",
+                        "status": "success"
+                    }
+                )
             
             # Call original function with encrypted value
             return func(self, encrypted_value, *args, **kwargs)
             
         except Exception as e:
             # Log encryption failure
-            audit_logger.error(
-                f"Encryption failed: {func.__name__}",
-                extra={
-                    "function": func.__name__,
-                    "user_id": current_user.id if current_user else "system",
-                    "timestamp": datetime.now().isoformat(),
-                    "error": str(e),
-                    "status": "failed"
-                }
-            )
-            raise EncryptionError(f"Failed to encrypt data for {func.__name__}: {str(e)}")
+            if audit_logger.isEnabledFor(logging.ERROR):
+                audit_logger.error(
+                    f"Encryption failed: {func_name}",
+                    extra={
+                        "function": func_name,
+                        "user_id": current_user.id if current_user else "system",
+                        "timestamp": _audit_timestamp(),
+                        "error": str(e),
+                        "status": "failed"
+                    }
+                )
+            raise EncryptionError(f"Failed to encrypt data for {func_name}: {str(e)}")
     
     # Add metadata to function for static analysis
     wrapper.__encrypted__ = True
@@ -160,60 +248,66 @@ def audit_log(func: Callable) -> Callable:
             # Delete user data
             pass
     """
+    func_name = func.__name__
+    func_module = func.__module__
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
         # Get current user from context
         current_user = get_current_user()
-        operation_id = f"{func.__name__}_{datetime.now().timestamp()}"
+        operation_id = f"{func_name}_{next(_operation_ids)}"
         
         # Log operation start
-        audit_logger.info(
-            f"Operation started: {func.__name__}",
-            extra={
-                "operation_id": operation_id,
-                "operation": func.__name__,
-                "user_id": current_user.id if current_user else "system",
-                "timestamp": datetime.now().isoformat(),
-                "status": "started",
-                "module": func.__module__,
-                "args_count": len(args),
-                "kwargs_keys": list(kwargs.keys()) if kwargs else []
-            }
-        )
-        
-        try:
-            # Execute function
-            result = func(*args, **kwargs)
-            
-            # Log operation success
+        if audit_logger.isEnabledFor(logging.INFO):
             audit_logger.info(
-                f"Operation completed: {func.__name__}",
+                f"Operation started: {func_name}",
                 extra={
                     "operation_id": operation_id,
-                    "operation": func.__name__,
+                    "operation": func_name,
                     "user_id": current_user.id if current_user else "system",
-                    "timestamp": datetime.now().isoformat(),
-                    "status": "completed",
-                    "result_type": type(result).__name__ if result is not None else "None"
+                    "timestamp": _audit_timestamp(),
+                    "status": "started",
+                    "function_module": func_module,
+                    "args_count": len(args),
+                    "kwargs_keys": list(kwargs.keys()) if kwargs else []
                 }
             )
+        
+        try:
+            # Execute function
+            result = func(*args, **kwargs)
+            
+            # Log operation success
+            if audit_logger.isEnabledFor(logging.INFO):
+                audit_logger.info(
+                    f"Operation completed: {func_name}",
+                    extra={
+                        "operation_id": operation_id,
+                        "operation": func_name,
+                        "user_id": current_user.id if current_user else "system",
+                        "timestamp": _audit_timestamp(),
+                        "status": "completed",
+                        "result_type": type(result).__name__ if result is not None else "None"
+                    }
+                )
             
             return result
             
         except Exception as e:
             # Log operation failure
-            audit_logger.error(
-                f"Operation failed: {func.__name__}",
-                extra={
-                    "operation_id": operation_id,
-                    "operation": func.__name__,
-                    "user_id": current_user.id if current_user else "system",
-                    "timestamp": datetime.now().isoformat(),
-                    "status": "failed",
-                    "error": str(e),
-                    "error_type": type(e).__name__
-                }
-            )
+            if audit_logger.isEnabledFor(logging.ERROR):
+                audit_logger.error(
+                    f"Operation failed: {func_name}",
+                    extra={
+                        "operation_id": operation_id,
+                        "operation": func_name,
+                        "user_id": current_user.id if current_user else "system",
+                        "timestamp": _audit_timestamp(),
+                        "status": "failed",
+                        "error": str(e),
+                        "error_type": type(e).__name__
+                    }
+                )
             raise
     
     # Add metadata to function for static analysis
@@ -238,7 +332,11 @@ def access_control(required_roles: List[str]):
             # Process data
             pass
     """
+    required_role_set = frozenset(required_roles)
+    
     def decorator(func: Callable) -> Callable:
+        func_name = func.__name__
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Get current user from context
@@ -246,44 +344,47 @@ def access_control(required_roles: List[str]):
             
             # Check if user is authenticated
             if not current_user:
-                audit_logger.warning(
-                    f"Unauthorized access attempt: {func.__name__}",
-                    extra={
-                        "operation": func.__name__,
-                        "timestamp": datetime.now().isoformat(),
-                        "status": "unauthorized",
-                        "required_roles": required_roles
-                    }
-                )
+                if audit_logger.isEnabledFor(logging.WARNING):
+                    audit_logger.warning(
+                        f"Unauthorized access attempt: {func_name}",
+                        extra={
+                            "operation": func_name,
+                            "timestamp": _audit_timestamp(),
+                            "status": "unauthorized",
+                            "required_roles": required_roles
+                        }
+                    )
                 raise UnauthorizedError("Authentication required")
             
             # Check if user has required role
             user_roles = getattr(current_user, 'roles', [])
-            if not any(role in user_roles for role in required_roles):
-                audit_logger.warning(
-                    f"Insufficient permissions: {func.__name__}",
+            if required_role_set.isdisjoint(user_roles):
+                if audit_logger.isEnabledFor(logging.WARNING):
+                    audit_logger.warning(
+                        f"Insufficient permissions: {func_name}",
+                        extra={
+                            "operation": func_name,
+                            "user_id": current_user.id,
+                            "user_roles": user_roles,
+                            "required_roles": required_roles,
+                            "timestamp": _audit_timestamp(),
+                            "status": "forbidden"
+                        }
+                    )
+                raise ForbiddenError(f"Required roles: {', '.join(required_roles)}")
+            
+            # Log successful authorization
+            if audit_logger.isEnabledFor(logging.INFO):
+                audit_logger.info(
+                    f"Access granted: {func_name}",
                     extra={
-                        "operation": func.__name__,
+                        "operation": func_name,
                         "user_id": current_user.id,
                         "user_roles": user_roles,
-                        "required_roles": required_roles,
-                        "timestamp": datetime.now().isoformat(),
-                        "status": "forbidden"
+                        "timestamp": _audit_timestamp(),
+                        "status": "authorized"
                     }
                 )
-                raise ForbiddenError(f"Required roles: {', '.join(required_roles)}")
-            
-            # Log successful authorization
-            audit_logger.info(
-                f"Access granted: {func.__name__}",
-                extra={
-                    "operation": func.__name__,
-                    "user_id": current_user.id,
-                    "user_roles": user_roles,
-                    "timestamp": datetime.now().isoformat(),
-                    "status": "authorized"
-                }
-            )
             
             # Execute function
             return func(*args, **kwargs)
@@ -313,64 +414,91 @@ def pci_scope(cls):
     cls.__compliance_frameworks__ = getattr(cls, '__compliance_frameworks__', []) + ['PCI_DSS']
     
     # Log PCI scope registration
-    logger.info(
-        f"Class registered in PCI scope: {cls.__name__}",
-        extra={
-            "class_name": cls.__name__,
-            "module": cls.__module__,
-            "timestamp": datetime.now().isoformat(),
-            "compliance_framework": "PCI_DSS"
-        }
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"Class registered in PCI scope: {cls.__name__}",
+            extra={
+                "class_name": cls.__name__,
+                "class_module": cls.__module__,
+                "timestamp": _audit_timestamp(),
+                "compliance_framework": "PCI_DSS"
+            }
+        )
     
     return cls
 
 
 # Helper functions for applying framework-specific controls
 
-def _apply_gdpr_controls(func: Callable, args: tuple, kwargs: dict, current_user):
+def _apply_gdpr_controls(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    current_user,
+    compliance_context
+):
     """Apply GDPR-specific controls."""
     # Check for data processing lawful basis
-    compliance_context = get_compliance_context()
-    if not compliance_context.get('gdpr_lawful_basis'):
-        logger.warning(
-            f"GDPR: No lawful basis specified for personal data processing: {func.__name__}",
-            extra={
-                "function": func.__name__,
-                "user_id": current_user.id if current_user else "system",
-                "timestamp": datetime.now().isoformat(),
-                "compliance_issue": "missing_lawful_basis"
-            }
-        )
+    if not compliance_context.gdpr_lawful_basis:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                f"GDPR: No lawful basis specified for personal data processing: {func.__name__}",
+                extra={
+                    "function": func.__name__,
+                    "user_id": current_user.id if current_user else "system",
+                    "timestamp": _audit_timestamp(),
+                    "compliance_issue": "missing_lawful_basis"
+                }
+            )
 
 
-def _apply_hipaa_controls(func: Callable, args: tuple, kwargs: dict, current_user):
+def _apply_hipaa_controls(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    current_user,
+    compliance_context
+):
     """Apply HIPAA-specific controls."""
     # Check for minimum necessary access
-    compliance_context = get_compliance_context()
-    if not compliance_context.get('hipaa_minimum_necessary'):
-        logger.warning(
-            f"HIPAA: Minimum necessary not verified for health data access: {func.__name__}",
-            extra={
-                "function": func.__name__,
-                "user_id": current_user.id if current_user else "system",
-                "timestamp": datetime.now().isoformat(),
-                "compliance_issue": "minimum_necessary_not_verified"
-            }
-        )
+    if not compliance_context.hipaa_minimum_necessary:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                f"HIPAA: Minimum necessary not verified for health data access: {func.__name__}",
+                extra={
+                    "function": func.__name__,
+                    "user_id": current_user.id if current_user else "system",
+                    "timestamp": _audit_timestamp(),
+                    "compliance_issue": "minimum_necessary_not_verified"
+                }
+            )
 
 
-def _apply_pci_controls(func: Callable, args: tuple, kwargs: dict, current_user):
+def _apply_pci_controls(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    current_user,
+    compliance_context
+):
     """Apply PCI DSS-specific controls."""
     # Check for cardholder data access
-    compliance_context = get_compliance_context()
-    if not compliance_context.get('pci_authorized_access'):
-        logger.warning(
-            f"PCI DSS: Unauthorized cardholder data access attempt: {func.__name__}",
-            extra={
-                "function": func.__name__,
-                "user_id": current_user.id if current_user else "system",
-                "timestamp": datetime.now().isoformat(),
-                "compliance_issue": "unauthorized_cardholder_access"
-            }
-        )
+    if not compliance_context.pci_authorized_access:
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                f"PCI DSS: Unauthorized cardholder data access attempt: {func.__name__}",
+                extra={
+                    "function": func.__name__,
+                    "user_id": current_user.id if current_user else "system",
+                    "timestamp": _audit_timestamp(),
+                    "compliance_issue": "unauthorized_cardholder_access"
+                }
+            )
+
+
+# Controls applied by data_classification, by classification type
+_CLASSIFICATION_CONTROLS = {
+    "personal": _apply_gdpr_controls,
+    "health": _apply_hipaa_controls,
+    "financial": _apply_pci_controls,
+}
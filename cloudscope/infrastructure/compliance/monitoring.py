@@ -5,8 +5,13 @@ This module provides runtime verification and monitoring of compliance
 requirements, tracking violations and generating alerts.
 """
 
+import itertools
 import logging
-from datetime import datetime, timedelta
+import queue
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from collections import defaultdict
@@ -15,6 +20,50 @@ from .context import get_current_user, get_compliance_context
 from .exceptions import ComplianceViolationError
 
 
+# Default bound on alerts waiting for the background dispatcher
+ALERT_QUEUE_SIZE = 10_000
+
+# Most alerts the background dispatcher delivers in one batch
+ALERT_BATCH_MAX = 128
+
+# Queued after the last alert to stop the dispatcher thread
+_STOP_ALERTS = object()
+
+# Violation ids are a prefix, the import time and a sequence number, so they
+# stay unique across restarts and for violations in the same instant
+_ID_EPOCH = time.time_ns()
+_violation_ids = itertools.count(1)
+
+# Encryption requirements by data type
+_ENCRYPTION_REQUIRED = {
+    "personal": False,  # Not always required for GDPR
+    "health": True,     # Required for HIPAA
+    "financial": True,  # Required for PCI DSS
+    "payment_card": True,  # Always required
+}
+
+# Primary compliance framework for each data type
+_FRAMEWORK_FOR_DATA_TYPE = {
+    "personal": "GDPR",
+    "health": "HIPAA",
+    "financial": "PCI_DSS",
+    "payment_card": "PCI_DSS",
+}
+
+
+def _violation_id(prefix: str) -> str:
+    """Return a new unique violation id."""
+    return f"{prefix}_{_ID_EPOCH}_{next(_violation_ids)}"
+
+
+def _hour_bucket(timestamp: datetime) -> int:
+    """Return the hour bucket of a timestamp, ordered as timestamps compare."""
+    if timestamp.utcoffset() is not None:
+        # Aware datetimes compare in UTC
+        timestamp = timestamp.astimezone(timezone.utc)
+    return timestamp.toordinal() * 24 + timestamp.hour
+
+
 @dataclass
 class ComplianceViolation:
     """Represents a compliance violation."""
@@ -55,15 +104,80 @@ class ComplianceMonitor:
         self.metrics = ComplianceMetrics()
         self.logger = logging.getLogger(__name__)
         self.alert_callbacks: List[callable] = []
+        self.batch_alert_callbacks: List[callable] = []
+        
+        # Background alert delivery, see start_alert_dispatcher
+        self._alert_queue: Optional[queue.Queue] = None
+        self._alert_thread: Optional[threading.Thread] = None
+        
+        # Positions in self.violations bucketed by hour and grouped by type and
+        # framework, kept in step with the list on read so that reassigning
+        # self.violations is always safe. Positions count from the first
+        # violation indexed; _index_base is the position of self.violations[0]
+        self._index_lock = threading.Lock()
+        self._indexed_violations: Optional[List[ComplianceViolation]] = None
+        self._indexed_count = 0
+        self._index_base = 0
+        self._violation_buckets: Dict[int, List[int]] = {}
+        self._bucket_keys: List[int] = []
+        self._by_type: Dict[str, List[int]] = defaultdict(list)
+        self._by_framework: Dict[str, List[int]] = defaultdict(list)
     
-    def add_alert_callback(self, callback: callable) -> None:
+    def add_alert_callback(self, callback: callable, batch: bool = False) -> None:
         """
         Add a callback function to be called when violations occur.
         
         Args:
             callback: Function to call with violation data
+            batch: Call the function once per batch of violations with a
+                list, rather than once per violation
         """
-        self.alert_callbacks.append(callback)
+        if batch:
+            self.batch_alert_callbacks.append(callback)
+        else:
+            self.alert_callbacks.append(callback)
+    
+    def start_alert_dispatcher(self, maxsize: int = ALERT_QUEUE_SIZE) -> None:
+        """
+        Run alert callbacks on a background thread.
+        
+        Compliance checks then only queue their violations, so slow alert
+        sinks no longer hold them up. When more than maxsize alerts are
+        waiting, further alerts are dropped and logged.
+        
+        Args:
+            maxsize: Maximum number of alerts waiting for delivery
+        """
+        if self._alert_thread is not None:
+            return
+        
+        alert_queue = queue.Queue(maxsize)
+        self._alert_thread = threading.Thread(
+            target=self._alert_worker,
+            args=(alert_queue,),
+            name="compliance-alerts",
+            daemon=True
+        )
+        self._alert_thread.start()
+        self._alert_queue = alert_queue
+    
+    def stop_alert_dispatcher(self) -> None:
+        """Deliver any queued alerts and run callbacks synchronously again."""
+        if self._alert_thread is None:
+            return
+        
+        alert_queue = self._alert_queue
+        self._alert_queue = None
+        alert_queue.put(_STOP_ALERTS)
+        self._alert_thread.join()
+        self._alert_thread = None
+        
+        # Alerts queued by checks that raced with the stop
+        remaining = []
+        while not alert_queue.empty():
+            remaining.append(alert_queue.get_nowait())
+        if remaining:
+            self._dispatch_alerts(remaining)
     
     def record_operation(self, operation_type: str, is_compliant: bool = True) -> None:
         """
@@ -143,22 +257,15 @@ class ComplianceMonitor:
         """
         self.record_operation(f"encryption_check_{data_type}")
         
-        # Define encryption requirements by data type
-        encryption_required = {
-            "personal": False,  # Not always required for GDPR
-            "health": True,     # Required for HIPAA
-            "financial": True,  # Required for PCI DSS
-            "payment_card": True,  # Always required
-        }
-        
-        required = encryption_required.get(data_type, False)
+        required = _ENCRYPTION_REQUIRED.get(data_type, False)
         
         if required and not is_encrypted:
+            user = get_current_user()
             violation = ComplianceViolation(
-                id=f"enc_{datetime.now().timestamp()}",
+                id=_violation_id("enc"),
                 violation_type="encryption_required",
                 description=f"Encryption required for {data_type} data but not found",
-                user_id=get_current_user().id if get_current_user() else None,
+                user_id=user.id if user else None,
                 timestamp=datetime.now(),
                 severity="high",
                 framework=self._get_framework_for_data_type(data_type),
@@ -185,7 +292,7 @@ class ComplianceMonitor:
         
         if not user:
             violation = ComplianceViolation(
-                id=f"auth_{datetime.now().timestamp()}",
+                id=_violation_id("auth"),
                 violation_type="authentication_required",
                 description=f"Authentication required for accessing {resource}",
                 user_id=None,
@@ -199,7 +306,7 @@ class ComplianceMonitor:
         user_roles = getattr(user, 'roles', [])
         if not any(role in user_roles for role in required_roles):
             violation = ComplianceViolation(
-                id=f"authz_{datetime.now().timestamp()}",
+                id=_violation_id("authz"),
                 violation_type="insufficient_permissions",
                 description=f"User {user.id} lacks required roles {required_roles} for {resource}",
                 user_id=user.id,
@@ -217,7 +324,9 @@ class ComplianceMonitor:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         violation_type: Optional[str] = None,
-        framework: Optional[str] = None
+        framework: Optional[str] = None,
+        user_id: Optional[str] = None,
+        limit: Optional[int] = None
     ) -> List[ComplianceViolation]:
         """
         Get compliance violations based on filters.
@@ -227,23 +336,26 @@ class ComplianceMonitor:
             end_date: End date for filtering
             violation_type: Type of violation to filter by
             framework: Framework to filter by
+            user_id: User ID to filter by
+            limit: Maximum number of violations to return, keeping the most recent
         
         Returns:
-            List of filtered violations
+            New list of filtered violations
         """
-        violations = self.violations
-        
-        if start_date:
-            violations = [v for v in violations if v.timestamp >= start_date]
+        if start_date or end_date or violation_type or framework:
+            violations = self._select_violations(start_date, end_date, violation_type, framework)
+        else:
+            violations = self.violations
         
-        if end_date:
-            violations = [v for v in violations if v.timestamp <= end_date]
+        if user_id:
+            violations = [v for v in violations if v.user_id == user_id]
         
-        if violation_type:
-            violations = [v for v in violations if v.violation_type == violation_type]
+        if limit is not None:
+            violations = violations[-limit:] if limit > 0 else []
         
-        if framework:
-            violations = [v for v in violations if v.framework == framework]
+        if violations is self.violations:
+            # clear_violations trims the live list in place, so hand out a copy
+            violations = list(violations)
         
         return violations
     
@@ -258,7 +370,7 @@ class ComplianceMonitor:
             ComplianceMetrics object
         """
         cutoff_time = datetime.now() - timedelta(hours=period_hours)
-        recent_violations = [v for v in self.violations if v.timestamp >= cutoff_time]
+        recent_violations = self._select_violations(start_date=cutoff_time)
         
         metrics = ComplianceMetrics()
         metrics.total_operations = self.metrics.total_operations
@@ -285,16 +397,158 @@ class ComplianceMonitor:
             Number of violations removed
         """
         cutoff_time = datetime.now() - timedelta(days=older_than_days)
-        old_violations = [v for v in self.violations if v.timestamp < cutoff_time]
-        self.violations = [v for v in self.violations if v.timestamp >= cutoff_time]
+        
+        with self._index_lock:
+            violations = self._sync_violation_index()
+            
+            # Violations are normally recorded in time order, so the old ones
+            # are a prefix of the list and can be cut off in place
+            prefix = 0
+            for violation in violations:
+                if violation.timestamp >= cutoff_time:
+                    break
+                prefix += 1
+            
+            if prefix == self._count_older(cutoff_time):
+                if prefix:
+                    del violations[:prefix]
+                    self._indexed_count -= prefix
+                    self._index_base += prefix
+                    self._trim_violation_index()
+                return prefix
+        
+        old_violations = [v for v in violations if v.timestamp < cutoff_time]
+        self.violations = [v for v in violations if v.timestamp >= cutoff_time]
         
         return len(old_violations)
     
+    def _select_violations(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        violation_type: Optional[str] = None,
+        framework: Optional[str] = None
+    ) -> List[ComplianceViolation]:
+        """Return violations matching the given filters, in recorded order."""
+        with self._index_lock:
+            violations = self._sync_violation_index()
+            base = self._index_base
+            
+            # Drive from the smallest index that covers a filter, then check
+            # the remaining filters on those violations only
+            driver = None
+            if violation_type:
+                driver = self._by_type.get(violation_type, [])
+            if framework:
+                by_framework = self._by_framework.get(framework, [])
+                if driver is None or len(by_framework) < len(driver):
+                    driver = by_framework
+            
+            if start_date or end_date:
+                keys = self._bucket_keys
+                first_key = _hour_bucket(start_date) if start_date else None
+                last_key = _hour_bucket(end_date) if end_date else None
+                lo = bisect_left(keys, first_key) if first_key is not None else 0
+                hi = bisect_right(keys, last_key) if last_key is not None else len(keys)
+                range_keys = keys[lo:hi]
+                
+                buckets = self._violation_buckets
+                if driver is None or sum(len(buckets[key]) for key in range_keys) < len(driver):
+                    positions = []
+                    for key in range_keys:
+                        bucket = buckets[key]
+                        if key == first_key or key == last_key:
+                            # Only boundary hours need comparing; inner hours are in range
+                            positions.extend(
+                                i for i in bucket
+                                if (not start_date or violations[i - base].timestamp >= start_date)
+                                and (not end_date or violations[i - base].timestamp <= end_date)
+                            )
+                        else:
+                            positions.extend(bucket)
+                    positions.sort()
+                    driver = positions
+                    start_date = end_date = None
+            
+            if driver is None:
+                return list(violations)
+        
+        return [
+            v for v in (violations[i - base] for i in driver)
+            if (not start_date or v.timestamp >= start_date)
+            and (not end_date or v.timestamp <= end_date)
+            and (not violation_type or v.violation_type == violation_type)
+            and (not framework or v.framework == framework)
+        ]
+    
+    def _sync_violation_index(self) -> List[ComplianceViolation]:
+        """Index violations added since the last read; rebuild if the list was replaced."""
+        violations = self.violations
+        if violations is not self._indexed_violations or len(violations) < self._indexed_count:
+            self._indexed_violations = violations
+            self._indexed_count = 0
+            self._index_base = 0
+            self._violation_buckets = {}
+            self._bucket_keys = []
+            self._by_type = defaultdict(list)
+            self._by_framework = defaultdict(list)
+        
+        buckets = self._violation_buckets
+        by_type = self._by_type
+        by_framework = self._by_framework
+        base = self._index_base
+        for i in range(self._indexed_count, len(violations)):
+            violation = violations[i]
+            position = base + i
+            key = _hour_bucket(violation.timestamp)
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = []
+                insort(self._bucket_keys, key)
+            bucket.append(position)
+            by_type[violation.violation_type].append(position)
+            if violation.framework:
+                by_framework[violation.framework].append(position)
+        self._indexed_count = len(violations)
+        return violations
+    
+    def _count_older(self, cutoff_time: datetime) -> int:
+        """Count indexed violations older than cutoff_time."""
+        violations = self.violations
+        base = self._index_base
+        cutoff_key = _hour_bucket(cutoff_time)
+        
+        count = 0
+        for key in self._bucket_keys:
+            if key > cutoff_key:
+                break
+            bucket = self._violation_buckets[key]
+            if key < cutoff_key:
+                count += len(bucket)
+            else:
+                count += sum(1 for i in bucket if violations[i - base].timestamp < cutoff_time)
+        return count
+    
+    def _trim_violation_index(self) -> None:
+        """Drop positions below _index_base from every index."""
+        base = self._index_base
+        for groups in (self._violation_buckets, self._by_type, self._by_framework):
+            for name, group in list(groups.items()):
+                # Positions in each group are ascending
+                evicted = bisect_left(group, base)
+                if evicted == len(group):
+                    del groups[name]
+                elif evicted:
+                    del group[:evicted]
+        
+        buckets = self._violation_buckets
+        self._bucket_keys = [key for key in self._bucket_keys if key in buckets]
+    
     def _check_personal_data_access(self, user, operation, compliance_context) -> Optional[ComplianceViolation]:
         """Check GDPR compliance for personal data access."""
         if not compliance_context.gdpr_lawful_basis:
             return ComplianceViolation(
-                id=f"gdpr_{datetime.now().timestamp()}",
+                id=_violation_id("gdpr"),
                 violation_type="missing_lawful_basis",
                 description="GDPR requires lawful basis for personal data processing",
                 user_id=user.id if user else None,
@@ -309,7 +563,7 @@ class ComplianceMonitor:
         """Check HIPAA compliance for health data access."""
         if not compliance_context.hipaa_minimum_necessary:
             return ComplianceViolation(
-                id=f"hipaa_{datetime.now().timestamp()}",
+                id=_violation_id("hipaa"),
                 violation_type="minimum_necessary_not_verified",
                 description="HIPAA requires minimum necessary standard for health data access",
                 user_id=user.id if user else None,
@@ -324,7 +578,7 @@ class ComplianceMonitor:
         """Check PCI DSS compliance for financial data access."""
         if not compliance_context.pci_authorized_access:
             return ComplianceViolation(
-                id=f"pci_{datetime.now().timestamp()}",
+                id=_violation_id("pci"),
                 violation_type="unauthorized_cardholder_access",
                 description="PCI DSS requires authorized access to cardholder data",
                 user_id=user.id if user else None,
@@ -337,13 +591,7 @@ class ComplianceMonitor:
     
     def _get_framework_for_data_type(self, data_type: str) -> str:
         """Get the primary compliance framework for a data type."""
-        framework_mapping = {
-            "personal": "GDPR",
-            "health": "HIPAA",
-            "financial": "PCI_DSS",
-            "payment_card": "PCI_DSS",
-        }
-        return framework_mapping.get(data_type, "GENERAL")
+        return _FRAMEWORK_FOR_DATA_TYPE.get(data_type, "GENERAL")
     
     def _record_violation(self, violation: ComplianceViolation) -> None:
         """Record a compliance violation."""
@@ -377,11 +625,49 @@ class ComplianceMonitor:
         )
         
         # Trigger alert callbacks
-        for callback in self.alert_callbacks:
+        alert_queue = self._alert_queue
+        if alert_queue is None:
+            self._dispatch_alerts([violation])
+        else:
             try:
-                callback(violation)
+                alert_queue.put_nowait(violation)
+            except queue.Full:
+                self.logger.error(f"Alert queue full, dropping alert for violation {violation.id}")
+    
+    def _dispatch_alerts(self, violations: List[ComplianceViolation]) -> None:
+        """Call the alert callbacks for each violation and the batch callbacks once."""
+        for violation in violations:
+            for callback in self.alert_callbacks:
+                try:
+                    callback(violation)
+                except Exception as e:
+                    self.logger.error(f"Error in alert callback: {str(e)}")
+        
+        for callback in self.batch_alert_callbacks:
+            try:
+                callback(violations)
             except Exception as e:
                 self.logger.error(f"Error in alert callback: {str(e)}")
+    
+    def _alert_worker(self, alert_queue: queue.Queue) -> None:
+        """Deliver queued alerts until stop_alert_dispatcher is called."""
+        while True:
+            # Block for the first alert, then take whatever else has arrived
+            batch = []
+            item = alert_queue.get()
+            while item is not _STOP_ALERTS:
+                batch.append(item)
+                if len(batch) >= ALERT_BATCH_MAX:
+                    break
+                try:
+                    item = alert_queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if batch:
+                self._dispatch_alerts(batch)
+            if item is _STOP_ALERTS:
+                return
 
 
 # Global compliance monitor instance
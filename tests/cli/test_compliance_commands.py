@@ -0,0 +1,149 @@
+"""
+Tests for CloudScope compliance CLI commands.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import patch
+
+from cloudscope.cli import compliance_commands
+from cloudscope.cli.compliance_commands import ComplianceCommands
+
+
+SOURCE = '''
+def get_user(email):
+    password = "hunter2hunter2"
+    return email
+'''
+
+
+class TestAnalyzeCache(unittest.TestCase):
+    """Test reuse of analyze reports across runs."""
+
+    def setUp(self):
+        """Set up a source tree and an isolated cache directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.temp_dir, 'src')
+        os.mkdir(self.source_dir)
+        self.source_file = os.path.join(self.source_dir, 'app.py')
+        with open(self.source_file, 'w') as f:
+            f.write(SOURCE)
+        self.output = os.path.join(self.temp_dir, 'report.json')
+
+        env = patch.dict(os.environ, {'XDG_CACHE_HOME': os.path.join(self.temp_dir, 'cache')})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self):
+        """Clean up the temporary tree."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _analyze(self, *extra):
+        """Run the analyze command, returning the report and analysis count."""
+        argv = ['compliance', 'analyze', self.source_dir, '--format', 'json',
+                '--output', self.output, '--jobs', '1', *extra]
+        commands = ComplianceCommands()
+        parser = argparse.ArgumentParser()
+        commands.add_compliance_commands(parser, argv)
+        with patch.object(commands, '_run_analysis', wraps=commands._run_analysis) as run:
+            with redirect_stdout(StringIO()):
+                commands.handle_compliance_command(parser.parse_args(argv))
+        with open(self.output) as f:
+            return json.load(f), run.call_count
+
+    def _cache_files(self):
+        return list(compliance_commands._analyze_cache_dir().glob('*.json'))
+
+    def test_cached_report_matches_fresh_report(self):
+        """Test a cache hit skips analysis and reproduces the report."""
+        fresh, runs = self._analyze()
+        self.assertEqual(runs, 1)
+        self.assertEqual(len(fresh['issues']), 1)
+        self.assertEqual(len(self._cache_files()), 1)
+
+        cached, runs = self._analyze()
+        self.assertEqual(runs, 0)
+        self.assertEqual(cached, fresh)
+
+    def test_changed_file_misses_cache(self):
+        """Test editing an analyzed file invalidates the cached report."""
+        self._analyze()
+        with open(self.source_file, 'a') as f:
+            f.write('    token = "abcdefghijklmnop"\n')
+
+        report, runs = self._analyze()
+        self.assertEqual(runs, 1)
+        self.assertEqual(len(report['issues']), 2)
+
+    def test_expired_report_is_not_reused(self):
+        """Test reports older than the TTL are re-analyzed."""
+        self._analyze()
+        expired = time.time() - compliance_commands.ANALYZE_CACHE_TTL - 60
+        for cache_file in self._cache_files():
+            os.utime(cache_file, (expired, expired))
+
+        _, runs = self._analyze()
+        self.assertEqual(runs, 1)
+
+    def test_no_cache_flag(self):
+        """Test --no-cache neither reads nor writes cached reports."""
+        _, runs = self._analyze('--no-cache')
+        self.assertEqual(runs, 1)
+        self.assertEqual(self._cache_files(), [])
+
+        self._analyze()
+        _, runs = self._analyze('--no-cache')
+        self.assertEqual(runs, 1)
+
+
+class TestCheckCommand(unittest.TestCase):
+    """Test the check command."""
+
+    def setUp(self):
+        """Set up enough files for the check command to use worker processes."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.files = []
+        for index in range(compliance_commands.CHECK_PARALLEL_MIN_FILES + 2):
+            file_path = os.path.join(self.temp_dir, f'module_{index}.py')
+            with open(file_path, 'w') as f:
+                f.write(SOURCE if index % 2 else 'VALUE = 1\n')
+            self.files.append(file_path)
+        self.files.insert(3, os.path.join(self.temp_dir, 'missing.py'))
+
+    def tearDown(self):
+        """Clean up the temporary tree."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _check(self, jobs):
+        """Run the check command, returning its exit code and output."""
+        argv = ['compliance', 'check', *self.files, '--fix', '--jobs', str(jobs)]
+        commands = ComplianceCommands()
+        parser = argparse.ArgumentParser()
+        commands.add_compliance_commands(parser, argv)
+        output = StringIO()
+        with redirect_stdout(output):
+            exit_code = commands.handle_compliance_command(parser.parse_args(argv))
+        return exit_code, output.getvalue()
+
+    def test_worker_processes_match_serial_output(self):
+        """Test checking files in worker processes prints the serial report."""
+        serial = self._check(jobs=1)
+        with patch.object(compliance_commands, 'ProcessPoolExecutor',
+                          wraps=compliance_commands.ProcessPoolExecutor) as pool:
+            parallel = self._check(jobs=2)
+        pool.assert_called_once_with(max_workers=2)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(serial[0], 1)
+        self.assertIn("Warning: File", serial[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 """
 Tests for the Asset domain model.
 """
+import sys
 import unittest
 from datetime import datetime
 from uuid import UUID
@@ -83,6 +84,16 @@ class TestAsset(unittest.TestCase):
         with pytest.raises(AssetValidationError):
             Asset(id="test-id", name="Test Asset", asset_type="server", source="")
 
+    def test_asset_creation_with_validation_disabled(self):
+        """Test that Asset.VALIDATE = False skips constructor validation."""
+        Asset.VALIDATE = False
+        try:
+            asset = Asset(id="test-id", name="", asset_type="server", source="test-source")
+        finally:
+            Asset.VALIDATE = True
+
+        self.assertEqual(asset.name, "")
+
     def test_add_metadata(self):
         """Test adding metadata to an Asset."""
         # Arrange
@@ -136,6 +147,50 @@ class TestAsset(unittest.TestCase):
         with pytest.raises(AssetValidationError):
             asset.set_risk_score(101)
 
+    def test_bulk_update(self):
+        """Test updating metadata, tags and risk score in one call."""
+        # Arrange
+        asset = Asset(id="test-id", name="Test Asset", asset_type="server", source="test-source")
+        original_updated_at = asset.updated_at
+
+        # Act
+        asset.bulk_update(
+            metadata={"region": "us-west-2"},
+            tags={"environment": "production"},
+            risk_score=75,
+        )
+
+        # Assert
+        self.assertEqual(asset.metadata["region"], "us-west-2")
+        self.assertEqual(asset.tags["environment"], "production")
+        self.assertEqual(asset.risk_score, 75)
+        self.assertGreaterEqual(asset.updated_at, original_updated_at)
+
+        # An invalid score leaves the asset untouched
+        with pytest.raises(AssetValidationError):
+            asset.bulk_update(metadata={"zone": "a"}, risk_score=101)
+        self.assertNotIn("zone", asset.metadata)
+
+    def test_batch_mutate(self):
+        """Test that batch_mutate refreshes updated_at once on exit."""
+        # Arrange
+        created_at = datetime(2020, 1, 1)
+        asset = Asset(
+            id="test-id", name="Test Asset", asset_type="server", source="test-source",
+            created_at=created_at,
+        )
+
+        # Act
+        with asset.batch_mutate():
+            asset.add_metadata("region", "us-west-2")
+            asset.add_tag("environment", "production")
+            self.assertEqual(asset.updated_at, created_at)
+
+        # Assert
+        self.assertEqual(asset.metadata["region"], "us-west-2")
+        self.assertEqual(asset.tags["environment"], "production")
+        self.assertGreater(asset.updated_at, created_at)
+
     def test_to_dict(self):
         """Test converting an Asset to a dictionary."""
         # Arrange
@@ -185,6 +240,74 @@ class TestAsset(unittest.TestCase):
         self.assertEqual(asset.tags["environment"], asset_dict["tags"]["environment"])
         self.assertEqual(asset.risk_score, asset_dict["risk_score"])
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_asset_rejects_unknown_attributes(self):
+        """Test that Asset uses slots and rejects undeclared attributes."""
+        # Arrange
+        asset = Asset(id="test-id", name="Test Asset", asset_type="server", source="test-source")
+
+        # Act & Assert
+        self.assertFalse(hasattr(asset, "__dict__"))
+        with pytest.raises(AttributeError):
+            asset.owner = "someone"
+
+    def test_from_dicts_bulk(self):
+        """Test creating several Assets from dictionaries."""
+        # Arrange
+        created_at = datetime(2024, 1, 1, 12, 0, 0)
+        records = [
+            {
+                "id": "first",
+                "name": "First",
+                "asset_type": "server",
+                "source": "test-source",
+                "created_at": created_at.isoformat(),
+            },
+            {
+                "name": "Second",
+                "asset_type": "database",
+                "source": "test-source",
+                "tags": {"environment": "production"},
+                "created_at": created_at,
+            },
+        ]
+
+        # Act
+        assets = Asset.from_dicts_bulk(records)
+
+        # Assert
+        self.assertEqual([a.name for a in assets], ["First", "Second"])
+        self.assertEqual(assets[0].id, "first")
+        self.assertEqual(assets[0].created_at, created_at)
+        self.assertEqual(assets[0].updated_at, created_at)
+        self.assertEqual(assets[1].created_at, created_at)
+        self.assertEqual(assets[1].tags["environment"], "production")
+        UUID(assets[1].id)
+
+    def test_from_records_without_validation(self):
+        """Test creating trusted Assets without constructor validation."""
+        # Arrange
+        timestamp = datetime(2024, 1, 1, 12, 0, 0).isoformat()
+        records = [
+            {"id": "first", "name": "First", "asset_type": "server",
+             "source": "test-source", "created_at": timestamp, "updated_at": timestamp},
+            {"name": "Second", "asset_type": "database", "source": "test-source",
+             "risk_score": 40, "created_at": timestamp},
+        ]
+
+        # Act
+        assets = Asset.from_records(records, validate=False)
+
+        # Assert
+        self.assertEqual(assets[0].to_dict()["created_at"], timestamp)
+        self.assertEqual(assets[1].updated_at, assets[1].created_at)
+        self.assertEqual(assets[1].risk_score, 40)
+        self.assertEqual(assets[1].tags, {})
+        UUID(assets[1].id)
+
+        assets[1].add_tag("environment", "production")
+        self.assertEqual(assets[1].tags["environment"], "production")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -119,6 +119,30 @@ class TestFinding:
         with pytest.raises(ValueError, match="Finding is already resolved"):
             finding.resolve("user2", "Fixed again")
             
+    def test_bulk_resolve(self):
+        """Test resolving several findings at once."""
+        findings = [
+            Finding(
+                asset_id="asset-123",
+                title=f"Finding {i}",
+                description="Test",
+                severity=Severity.LOW,
+                framework="SOC2",
+                control_id="CC6.1"
+            )
+            for i in range(3)
+        ]
+        
+        Finding.bulk_resolve(findings, "john.doe", "Fixed in release 2.0")
+        
+        assert all(f.status == FindingStatus.RESOLVED for f in findings)
+        assert all(f.resolved_by == "john.doe" for f in findings)
+        assert len({f.resolved_at for f in findings}) == 1
+        
+        with pytest.raises(ValueError, match="already resolved"):
+            Finding.bulk_resolve(findings[:1], "jane.doe")
+        assert findings[0].resolved_by == "john.doe"
+        
     def test_accept_risk(self):
         """Test accepting risk for a finding."""
         finding = Finding(
@@ -204,6 +228,28 @@ class TestFinding:
         assert finding.framework == "ISO27001"
         assert finding.tags == ["iso", "access-control"]
         
+    def test_from_dict_defaults(self):
+        """Test from_dict applies defaults for absent fields and leaves input untouched."""
+        data = {
+            "asset_id": "asset-456",
+            "title": "Test Finding",
+            "description": "Test description",
+            "severity": "LOW",
+            "framework": "SOC2",
+            "control_id": "CC6.1",
+        }
+        
+        finding = Finding.from_dict(data)
+        
+        assert finding.status == FindingStatus.OPEN
+        assert finding.id
+        assert finding.tags == []
+        assert finding.resolved_at is None
+        assert data["severity"] == "LOW"
+        
+        with pytest.raises(TypeError):
+            Finding.from_dict({"asset_id": "asset-456"})
+        
     def test_round_trip_serialization(self):
         """Test that to_dict and from_dict are symmetric."""
         original = Finding(
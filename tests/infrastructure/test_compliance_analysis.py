@@ -11,6 +11,8 @@ from cloudscope.infrastructure.compliance.analysis import (
     ComplianceStaticAnalyzer,
     ComplianceIssue,
     ComplianceReport,
+    generate_compliance_report_html,
+    iter_analyzed_files,
 )
 
 
@@ -222,7 +224,26 @@ class BrokenClass:
         ]
         self.assertEqual(len(syntax_issues), 1)
         self.assertEqual(syntax_issues[0].severity, "error")
-    
+
+    def test_analyze_undecodable_file(self):
+        """Test files that are not valid UTF-8 are analysis errors."""
+        file_path = os.path.join(self.temp_dir, "latin1.py")
+        with open(file_path, 'wb') as f:
+            f.write(b'name = "caf\xe9"\n')
+
+        issues = self.analyzer.analyze_file(file_path)
+
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(issues[0].issue_type, "analysis_error")
+        self.assertEqual(issues[0].severity, "warning")
+
+        # Syntax errors in valid UTF-8 are still reported as such
+        with open(file_path, 'wb') as f:
+            f.write(b'name = "caf\xc3\xa9\n')
+
+        issues = self.analyzer.analyze_file(file_path)
+        self.assertEqual([issue.issue_type for issue in issues], ["syntax_error"])
+
     def test_analyze_directory(self):
         """Test directory analysis functionality."""
         # Create multiple test files
@@ -274,6 +295,75 @@ def test_function():
         # Check framework scores
         self.assertIsInstance(report.framework_scores, dict)
     
+    def test_iter_analyzed_files(self):
+        """Test the analyzed files are listed with the default exclusions."""
+        for filename in ("app.py", "test_app.py", "notes.txt", "pkg/models.py",
+                         "__pycache__/cached.py"):
+            full_path = os.path.join(self.temp_dir, filename)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'w') as f:
+                f.write("x = 1\n")
+        
+        self.assertEqual(
+            list(iter_analyzed_files(self.temp_dir)),
+            [os.path.join(self.temp_dir, "app.py"), os.path.join(self.temp_dir, "pkg", "models.py")]
+        )
+        self.assertEqual(len(list(iter_analyzed_files(self.temp_dir, []))), 4)
+        report = self.analyzer.analyze_directory(self.temp_dir)
+        self.assertEqual(report.total_files_analyzed, 2)
+    
+    def test_analyze_file_cache(self):
+        """Test per-file results are reused until the file changes."""
+        cache_dir = os.path.join(self.temp_dir, ".cloudscope_cache")
+        analyzer = ComplianceStaticAnalyzer(cache_dir=cache_dir)
+        file_path = self._create_test_file("payment.py", '''
+class Payment:
+    def __init__(self, card_number: str):
+        self.card_number = card_number
+''')
+        
+        issues = analyzer.analyze_file(file_path)
+        self.assertGreater(len(issues), 0)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        
+        # A cache hit returns the same issues without re-analyzing
+        analyzer._analyze_file = None
+        self.assertEqual(analyzer.analyze_file(file_path), issues)
+        
+        # Changing the file invalidates its entry
+        del analyzer._analyze_file
+        self._create_test_file("payment.py", "x = 1\n")
+        self.assertEqual(analyzer.analyze_file(file_path), [])
+    
+    def test_generate_html_report(self):
+        """Test HTML report generation escapes issue text."""
+        issue = ComplianceIssue(
+            file_path="/test/<file>.py",
+            line_number=3,
+            issue_type="hardcoded_secret",
+            description="Secret in 'password'",
+            severity="error",
+            framework="GENERAL",
+            recommendation="Use a secrets manager",
+            code_snippet='password = "<secret>"'
+        )
+        report = ComplianceReport(
+            total_files_analyzed=1,
+            issues_found=[issue],
+            compliance_score=75.0,
+            framework_scores={"GENERAL": 75.0}
+        )
+        
+        output_path = os.path.join(self.temp_dir, "report.html")
+        generate_compliance_report_html(report, output_path)
+        
+        with open(output_path, encoding='utf-8') as f:
+            html_content = f.read()
+        self.assertIn("75.0%", html_content)
+        self.assertIn("/test/&lt;file&gt;.py:3", html_content)
+        self.assertIn("password = &quot;&lt;secret&gt;&quot;", html_content)
+        self.assertNotIn("<secret>", html_content)
+    
     def test_compliance_issue_creation(self):
         """Test ComplianceIssue creation and properties."""
         issue = ComplianceIssue(
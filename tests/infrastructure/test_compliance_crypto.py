@@ -0,0 +1,236 @@
+"""
+Tests for CloudScope compliance cryptography.
+"""
+
+import base64
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESSIV
+
+from cloudscope.infrastructure.compliance import crypto
+from cloudscope.infrastructure.compliance.crypto import (
+    encrypt_value,
+    decrypt_value,
+    encrypt_value_deterministic,
+    decrypt_value_deterministic,
+    get_encryption_key,
+    hash_value,
+    hash_value_batch,
+    hash_value_fast,
+    mask_sensitive_data,
+    mask_sensitive_data_batch,
+    is_encrypted_value,
+)
+from cloudscope.infrastructure.compliance.exceptions import EncryptionError
+
+
+class TestGetEncryptionKey(unittest.TestCase):
+    """Test loading of the default encryption key."""
+
+    def setUp(self):
+        """Start from an unloaded key without CLOUDSCOPE_ENCRYPTION_KEY."""
+        original = crypto._encryption_key_cache
+        crypto._encryption_key_cache = None
+        self.addCleanup(setattr, crypto, '_encryption_key_cache', original)
+
+        env = patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop('CLOUDSCOPE_ENCRYPTION_KEY', None)
+
+    def test_concurrent_first_callers_share_one_key(self):
+        """Test racing first calls generate one key and log one warning."""
+        generate_key = Fernet.generate_key
+
+        def slow_generate_key():
+            # Widen the window in which other threads find no cached key
+            time.sleep(0.05)
+            return generate_key()
+
+        threads_count = 8
+        barrier = threading.Barrier(threads_count)
+        keys = []
+
+        def first_call():
+            barrier.wait()
+            keys.append(get_encryption_key())
+
+        with patch.object(crypto.Fernet, 'generate_key', side_effect=slow_generate_key) as gen:
+            with self.assertLogs(crypto.__name__, level='WARNING') as logs:
+                threads = [threading.Thread(target=first_call) for _ in range(threads_count)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+        self.assertEqual(gen.call_count, 1)
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(len(keys), threads_count)
+        self.assertEqual(set(keys), {crypto._encryption_key_cache})
+
+
+class TestEncryptValue(unittest.TestCase):
+    """Test Fernet encryption of sensitive values."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.key = Fernet.generate_key()
+        self.value = "4111-1111-1111-1111"
+
+    def test_encrypt_decrypt_round_trip(self):
+        """Test encrypted values are bare Fernet tokens that decrypt back."""
+        encrypted = encrypt_value(self.value, self.key)
+
+        self.assertTrue(encrypted.startswith('g'))
+        self.assertEqual(decrypt_value(encrypted, self.key), self.value)
+
+    def test_decrypt_legacy_format(self):
+        """Test values with the extra base64 layer of earlier versions still decrypt."""
+        token = Fernet(self.key).encrypt(self.value.encode())
+        legacy = base64.urlsafe_b64encode(token).decode()
+
+        self.assertEqual(decrypt_value(legacy, self.key), self.value)
+
+    def test_decrypt_with_wrong_key(self):
+        """Test decryption with another key raises EncryptionError."""
+        encrypted = encrypt_value(self.value, self.key)
+
+        with self.assertRaises(EncryptionError):
+            decrypt_value(encrypted, Fernet.generate_key())
+
+    def test_is_encrypted_value(self):
+        """Test both token formats are recognized and plain text is not."""
+        encrypted = encrypt_value(self.value, self.key)
+        legacy = base64.urlsafe_b64encode(encrypted.encode()).decode()
+
+        self.assertTrue(is_encrypted_value(encrypted))
+        self.assertTrue(is_encrypted_value(legacy))
+        self.assertFalse(is_encrypted_value(self.value))
+        self.assertFalse(is_encrypted_value("g" * 81))
+        self.assertFalse(is_encrypted_value(encrypted[:-4] + "!!!!"))
+
+
+class TestEncryptValueDeterministic(unittest.TestCase):
+    """Test AES-SIV encryption of stable identifiers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.key = Fernet.generate_key()
+        self.value = "user-1234"
+
+    def test_round_trip(self):
+        """Test deterministic ciphertexts decrypt back to the value."""
+        encrypted = encrypt_value_deterministic(self.value, self.key)
+
+        self.assertNotIn(self.value, encrypted)
+        self.assertEqual(decrypt_value_deterministic(encrypted, self.key), self.value)
+
+    def test_equal_values_give_equal_ciphertexts(self):
+        """Test equal values encrypt alike and different values do not."""
+        encrypted = encrypt_value_deterministic(self.value, self.key)
+
+        self.assertEqual(encrypt_value_deterministic(self.value, self.key), encrypted)
+        self.assertNotEqual(encrypt_value_deterministic("user-5678", self.key), encrypted)
+        self.assertNotEqual(
+            encrypt_value_deterministic(self.value, Fernet.generate_key()), encrypted
+        )
+
+    def test_decrypt_with_wrong_key(self):
+        """Test decryption with another key raises EncryptionError."""
+        encrypted = encrypt_value_deterministic(self.value, self.key)
+
+        with self.assertRaises(EncryptionError):
+            decrypt_value_deterministic(encrypted, Fernet.generate_key())
+
+    def test_siv_key_is_derived(self):
+        """Test AES-SIV does not reuse the raw Fernet key."""
+        encrypted = encrypt_value_deterministic(self.value, self.key)
+        raw_cipher = AESSIV(base64.urlsafe_b64decode(self.key))
+
+        with self.assertRaises(InvalidTag):
+            raw_cipher.decrypt(base64.urlsafe_b64decode(encrypted), None)
+
+
+
+class TestBatchHelpers(unittest.TestCase):
+    """Test batch hashing and masking against the per-value functions."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.values = ["", "abc", "abcd", "4111-1111-1111-1111", "caf\u00e9-\u00fcber"]
+
+    def test_hash_value_batch_matches_hash_value(self):
+        """Test salted batch hashes equal per-value hashes."""
+        self.assertEqual(
+            hash_value_batch(self.values, salt="s4lt"),
+            [hash_value(value, salt="s4lt") for value in self.values]
+        )
+
+    def test_hash_value_batch_without_salt(self):
+        """Test each value gets a fresh salt when none is given."""
+        hashes = hash_value_batch(["same", "same"])
+
+        self.assertEqual(len(hashes), 2)
+        self.assertNotEqual(hashes[0], hashes[1])
+
+    def test_mask_sensitive_data_batch_matches_mask_sensitive_data(self):
+        """Test batch masks equal per-value masks."""
+        for visible_chars in (0, 2, 4, 30):
+            self.assertEqual(
+                mask_sensitive_data_batch(self.values, visible_chars),
+                [mask_sensitive_data(value, visible_chars) for value in self.values]
+            )
+
+    def test_mask_with_no_visible_chars(self):
+        """Test visible_chars=0 masks the whole value."""
+        self.assertEqual(mask_sensitive_data("secret", 0), "******")
+        self.assertEqual(mask_sensitive_data_batch(["secret", ""], 0), ["******", ""])
+
+    def test_mask_values_longer_than_shared_mask(self):
+        """Test values longer than the shared asterisk string are fully masked."""
+        values = ["x" * 5000 + "1234", "short-1234"]
+
+        self.assertEqual(
+            mask_sensitive_data_batch(values),
+            ["*" * 5000 + "1234", "******1234"]
+        )
+        self.assertEqual(mask_sensitive_data(values[0]), "*" * 5000 + "1234")
+
+
+
+class TestHashValueFast(unittest.TestCase):
+    """Test BLAKE2b hashing of values."""
+
+    def test_same_salt_gives_same_hash(self):
+        """Test hashes depend only on the value and salt."""
+        digest = hash_value_fast("user@example.com", salt="s4lt")
+
+        self.assertEqual(len(digest), 64)
+        self.assertEqual(hash_value_fast("user@example.com", salt="s4lt"), digest)
+        self.assertNotEqual(hash_value_fast("user@example.com", salt="other"), digest)
+        self.assertNotEqual(hash_value_fast("user@example.com"), digest)
+        self.assertNotEqual(digest, hash_value("user@example.com", salt="s4lt"))
+
+    def test_fips_mode_uses_hash_value(self):
+        """Test FIPS mode falls back to SHA-256 hash_value."""
+        with patch.object(crypto, '_FIPS_MODE', True):
+            digest = hash_value_fast("user@example.com", salt="s4lt")
+
+        self.assertEqual(digest, hash_value("user@example.com", salt="s4lt"))
+
+    def test_salt_longer_than_64_bytes(self):
+        """Test salts over the BLAKE2b key size are rejected."""
+        hash_value_fast("value", salt="s" * 64)
+
+        with self.assertRaises(ValueError):
+            hash_value_fast("value", salt="s" * 65)
+
+
+if __name__ == '__main__':
+    unittest.main()
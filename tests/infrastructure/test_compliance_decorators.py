@@ -12,6 +12,8 @@ from cloudscope.infrastructure.compliance.decorators import (
     audit_log,
     access_control,
     pci_scope,
+    start_audit_log_listener,
+    stop_audit_log_listener,
 )
 from cloudscope.infrastructure.compliance.context import (
     User,
@@ -162,6 +164,41 @@ class TestComplianceDecorators(unittest.TestCase):
                 error_call = mock_logger.error.call_args_list[0]
                 self.assertIn("Operation failed", error_call[0][0])
     
+    def test_audit_log_listener(self):
+        """Test audit records are delivered through the background listener."""
+        import logging
+        
+        records = []
+        
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+        
+        class TestModel:
+            @audit_log
+            def sensitive_operation(self):
+                return "done"
+        
+        audit_logger = logging.getLogger("cloudscope.audit")
+        previous_level = audit_logger.level
+        audit_logger.setLevel(logging.INFO)
+        handler = ListHandler()
+        start_audit_log_listener(handler)
+        try:
+            with user_context(self.admin_user):
+                TestModel().sensitive_operation()
+        finally:
+            stop_audit_log_listener()
+            audit_logger.removeHandler(handler)
+            audit_logger.setLevel(previous_level)
+        
+        messages = [record.getMessage() for record in records]
+        self.assertEqual(
+            messages,
+            ["Operation started: sensitive_operation", "Operation completed: sensitive_operation"]
+        )
+        self.assertEqual(records[0].operation_id, records[1].operation_id)
+    
     def test_access_control_decorator_success(self):
         """Test access control decorator with proper permissions."""
         
@@ -325,6 +362,27 @@ class TestComplianceContext(unittest.TestCase):
                 self.assertEqual(user.id, "test123")
                 self.assertEqual(context.gdpr_lawful_basis, "legitimate_interest")
 
+    
+    def test_user_context_isolated_between_tasks(self):
+        """Test concurrent asyncio tasks each see their own user."""
+        import asyncio
+        from cloudscope.infrastructure.compliance.context import get_current_user
+        
+        other_user = User(id="other456", roles=["user"])
+        
+        async def current_user_id(user):
+            with user_context(user):
+                await asyncio.sleep(0)
+                return get_current_user().id
+        
+        async def run_both():
+            return await asyncio.gather(
+                current_user_id(self.test_user),
+                current_user_id(other_user),
+            )
+        
+        self.assertEqual(asyncio.run(run_both()), ["test123", "other456"])
+        self.assertIsNone(get_current_user())
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,7 @@
 Tests for CloudScope compliance monitoring.
 """
 
+import threading
 import unittest
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
@@ -196,7 +197,48 @@ class TestComplianceMonitor(unittest.TestCase):
         framework_violations = self.monitor.get_violations(framework="PCI_DSS")
         self.assertEqual(len(framework_violations), 1)
         self.assertEqual(framework_violations[0].id, "recent1")
+        
+        # Test user filtering
+        user_violations = self.monitor.get_violations(user_id="user1")
+        self.assertEqual(len(user_violations), 1)
+        self.assertEqual(user_violations[0].id, "old1")
+        
+        # Test limit keeps the most recent violations
+        limited_violations = self.monitor.get_violations(limit=1)
+        self.assertEqual(len(limited_violations), 1)
+        self.assertEqual(limited_violations[0].id, "recent1")
     
+    def test_get_violations_date_range_tracks_updates(self):
+        """Test date filtering sees recorded and replaced violations."""
+        now = datetime.now()
+        violations = [
+            ComplianceViolation(
+                id=f"v{i}",
+                violation_type="test_type",
+                description="Test violation",
+                user_id="user1",
+                timestamp=now - timedelta(hours=i * 5),
+            )
+            for i in range(10)
+        ]
+        self.monitor.violations = list(violations)
+
+        in_range = self.monitor.get_violations(
+            start_date=now - timedelta(hours=21),
+            end_date=now - timedelta(hours=4)
+        )
+        self.assertEqual([v.id for v in in_range], ["v1", "v2", "v3", "v4"])
+
+        # Violations recorded after the first query are found too
+        self.monitor._record_violation(violations[0])
+        in_range = self.monitor.get_violations(start_date=now - timedelta(hours=1))
+        self.assertEqual([v.id for v in in_range], ["v0", "v0"])
+
+        # Replacing the list drops the old violations
+        self.monitor.violations = violations[5:]
+        in_range = self.monitor.get_violations(start_date=now - timedelta(hours=30))
+        self.assertEqual([v.id for v in in_range], ["v5", "v6"])
+
     def test_get_metrics(self):
         """Test metrics calculation."""
         # Set up test data
@@ -261,6 +303,48 @@ class TestComplianceMonitor(unittest.TestCase):
         self.assertEqual(len(self.monitor.violations), 1)
         self.assertEqual(self.monitor.violations[0].id, "recent1")
     
+    def test_clear_violations_keeps_filters_consistent(self):
+        """Test filtering after old violations are cleared."""
+        now = datetime.now()
+        for days in (40, 35, 5, 1):
+            self.monitor._record_violation(ComplianceViolation(
+                id=f"v{days}",
+                violation_type="test",
+                description="Violation",
+                user_id="user1",
+                timestamp=now - timedelta(days=days),
+                framework="GDPR"
+            ))
+        self.monitor.get_violations(framework="GDPR")
+
+        self.assertEqual(self.monitor.clear_violations(older_than_days=30), 2)
+
+        self.assertEqual(
+            [v.id for v in self.monitor.get_violations(framework="GDPR")], ["v5", "v1"]
+        )
+        self.assertEqual(
+            [v.id for v in self.monitor.get_violations(start_date=now - timedelta(days=2))], ["v1"]
+        )
+
+    def test_clear_violations_keeps_returned_lists(self):
+        """Test clearing does not shrink lists returned earlier."""
+        now = datetime.now()
+        for days in (40, 1):
+            self.monitor._record_violation(ComplianceViolation(
+                id=f"v{days}",
+                violation_type="test",
+                description="Violation",
+                user_id="user1",
+                timestamp=now - timedelta(days=days),
+                framework="GDPR"
+            ))
+        all_violations = self.monitor.get_violations()
+
+        self.assertEqual(self.monitor.clear_violations(older_than_days=30), 1)
+
+        self.assertEqual([v.id for v in all_violations], ["v40", "v1"])
+        self.assertEqual([v.id for v in self.monitor.get_violations()], ["v1"])
+
     def test_alert_callbacks(self):
         """Test alert callback functionality."""
         callback_data = []
@@ -279,6 +363,35 @@ class TestComplianceMonitor(unittest.TestCase):
         self.assertGreater(len(callback_data), 0)
         self.assertIsInstance(callback_data[0], ComplianceViolation)
     
+    def test_alert_dispatcher(self):
+        """Test alert callbacks run on the background dispatcher."""
+        callback_threads = []
+        batches = []
+
+        def test_callback(violation):
+            callback_threads.append(threading.current_thread())
+
+        self.monitor.add_alert_callback(test_callback)
+        self.monitor.add_alert_callback(batches.append, batch=True)
+        self.monitor.start_alert_dispatcher()
+        try:
+            set_current_user(self.regular_user)
+            for _ in range(3):
+                self.monitor.check_data_access("financial", "user456", "read")
+        finally:
+            # Stopping delivers every queued alert
+            self.monitor.stop_alert_dispatcher()
+
+        self.assertEqual(len(callback_threads), 3)
+        self.assertNotIn(threading.current_thread(), callback_threads)
+        # Batch callbacks see every violation once, however they were batched
+        self.assertEqual(sum(len(batch) for batch in batches), 3)
+
+        # Callbacks run synchronously again once stopped
+        self.monitor.check_data_access("financial", "user456", "read")
+        self.assertIs(callback_threads[-1], threading.current_thread())
+        self.assertEqual(len(batches[-1]), 1)
+
     def test_alert_callback_error_handling(self):
         """Test that callback errors don't break the monitor."""
         def failing_callback(violation):
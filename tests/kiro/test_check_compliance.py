@@ -0,0 +1,153 @@
+"""
+Tests for the Kiro compliance checker.
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+
+CHECKER_PATH = Path(__file__).resolve().parents[2] / ".kiro" / "rules" / "check_compliance.py"
+
+_spec = importlib.util.spec_from_file_location("check_compliance", CHECKER_PATH)
+check_compliance = importlib.util.module_from_spec(_spec)
+with redirect_stdout(StringIO()):
+    _spec.loader.exec_module(check_compliance)
+
+RULES = """
+rules:
+  - name: "no-hardcoded-secrets"
+    description: "Prevents hardcoded secrets in source code"
+    check:
+      type: "content-check"
+      pattern: "*.py"
+      content-pattern: "password\\\\s*=\\\\s*['\\"][^'\\"]{8,}['\\"]"
+      condition: "must-not-contain"
+    message: "Hardcoded secret"
+    severity: "critical"
+    framework: "GENERAL"
+"""
+
+SECRET = 'password = "hunter2hunter2"\n'
+
+
+class TestKiroCache(unittest.TestCase):
+    """Test the per-file result cache of the Kiro checker."""
+
+    def setUp(self):
+        """Set up a source tree, a rules file and a cache location."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.temp_dir, "src")
+        os.mkdir(self.source_dir)
+        self.rules_file = os.path.join(self.temp_dir, "rules.yaml")
+        with open(self.rules_file, "w") as f:
+            f.write(RULES)
+        self.cache_file = os.path.join(self.temp_dir, "cache.json")
+
+    def tearDown(self):
+        """Clean up the temporary tree."""
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, content):
+        path = os.path.join(self.source_dir, name)
+        with open(path, "wb") as f:
+            f.write(content.encode() if isinstance(content, str) else content)
+        return path
+
+    def _scan(self, max_file_size=0):
+        with redirect_stdout(StringIO()):
+            processor = check_compliance.KiroComplianceProcessor(self.rules_file, self.cache_file)
+            processor.max_file_size = max_file_size
+            return processor.check_directory(self.source_dir)
+
+    def _cached_paths(self):
+        with open(self.cache_file) as f:
+            return set(json.load(f)["files"])
+
+    def test_cache_hit_and_invalidation(self):
+        """Test unchanged files reuse results and edited files are rescanned."""
+        path = self._write("app.py", SECRET)
+
+        self.assertEqual(len(self._scan()), 1)
+        self.assertIn(os.path.abspath(path), self._cached_paths())
+        self.assertEqual(len(self._scan()), 1)
+
+        # A different size invalidates the entry even within the same mtime tick
+        self._write("app.py", SECRET + SECRET)
+        self.assertEqual(len(self._scan()), 2)
+
+    def test_skipped_files_are_not_cached(self):
+        """Test oversized and binary files are rescanned on the next run."""
+        large = self._write("large.py", SECRET + "#" * 200)
+        binary = self._write("binary.py", b"\x00" + SECRET.encode())
+
+        self.assertEqual(self._scan(max_file_size=100), [])
+        self.assertNotIn(os.path.abspath(large), self._cached_paths())
+        self.assertNotIn(os.path.abspath(binary), self._cached_paths())
+
+        violations = self._scan()
+        self.assertEqual([v.file_path for v in violations], [large])
+
+        # A lower limit skips the file even though its results are cached
+        self.assertEqual(self._scan(max_file_size=100), [])
+
+    def test_deleted_files_are_pruned(self):
+        """Test cache entries of deleted files are dropped."""
+        path = self._write("app.py", SECRET)
+        self._scan()
+
+        os.remove(path)
+        self._scan()
+        self.assertNotIn(os.path.abspath(path), self._cached_paths())
+
+
+class TestKiroForbiddenPrefilter(unittest.TestCase):
+    """Test the combined must-not-contain prefilter."""
+
+    def _rule(self, name, content_pattern):
+        return check_compliance.KiroRule(
+            name=name,
+            description="",
+            check={"type": "content-check", "condition": "must-not-contain"},
+            message="",
+            severity="error",
+            framework="GENERAL",
+            content_re=check_compliance._compile_pattern(content_pattern),
+        )
+
+    def test_rules_with_groups_are_not_prefiltered(self):
+        """Test backreferences still match and named groups do not clash."""
+        rules = [
+            self._rule("repeat", r"(\w)\1{3}"),
+            self._rule("secret", r"secret"),
+            self._rule("token-a", r"(?P<value>token_a)"),
+            self._rule("token-b", r"(?P<value>token_b)"),
+        ]
+        prefilter = check_compliance._compile_forbidden_prefilter(rules)
+        self.assertIsNone(prefilter)
+        self.assertFalse(check_compliance._is_prefiltered_rule(rules[0]))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            rules_file = os.path.join(temp_dir, "rules.yaml")
+            with open(rules_file, "w") as f:
+                f.write("rules: []\n")
+            with redirect_stdout(StringIO()):
+                processor = check_compliance.KiroComplianceProcessor(rules_file)
+        processor._forbidden_re = check_compliance._compile_forbidden_prefilter(
+            rules + [self._rule("password", r"password")]
+        )
+        self.assertIsNotNone(processor._forbidden_re)
+
+        context = check_compliance.FileContext(b"x = 'aaaa'\n")
+        violations = processor._check_file_all_rules("app.py", context, rules)
+        self.assertEqual([v.rule_name for v in violations], ["repeat"])
+
+
+if __name__ == '__main__':
+    unittest.main()